@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de l'assemblage du document de sortie (md2mmd.assemble_segments).
+
+Génère des documents de taille proportionnelle au nombre de blocs et compare
+l'assemblage en une passe avec l'ancien découpage répété
+(contenu[:start] + remplacement + contenu[end:] par bloc, O(taille × blocs)).
+
+Usage:
+    python benchmarks/bench_assembly.py [--sizes 250,500,1000,2000]
+
+Code retour non nul si le temps d'assemblage croît nettement plus vite que
+le nombre de blocs.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app.conversion.commands.md2mmd import (  # noqa: E402
+    assemble_segments,
+    convert_diagram,
+    extract_code_blocks,
+    render_replacement,
+)
+
+LINEAR_TOLERANCE = 3.0
+
+SECTION = """\
+## Section {i}
+
+Texte d'accompagnement du diagramme {i}, suffisamment long pour que le
+document grossisse avec le nombre de blocs. {filler}
+
+```dot
+digraph G{i} {{ "N{i}" -> "N{j}"; }}
+```
+
+"""
+
+
+def generated_document(blocks):
+    """Document Markdown de `blocks` sections, chacune avec un bloc DOT."""
+    filler = 'Lorem ipsum dolor sit amet. ' * 20
+    return ''.join(SECTION.format(i=i, j=i + 1, filler=filler) for i in range(blocks))
+
+
+def legacy_splice(content, replacements):
+    """Assemblage historique : une recopie complète du document par bloc."""
+    for start, end, text in reversed(replacements):
+        content = content[:start] + text + content[end:]
+    return content
+
+
+def single_pass(content, replacements):
+    return ''.join(assemble_segments(content, replacements))
+
+
+def best_of(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='250,500,1000,2000',
+                        help='Nombres de blocs par document (défaut : %(default)s)')
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    print(f"{'blocs':>8} {'octets':>10} {'une passe (ms)':>16} {'découpage (ms)':>16}")
+    timings = []
+    for n in sizes:
+        content = generated_document(n)
+        replacements = []
+        for block in extract_code_blocks(content):
+            mermaid_code, warning = convert_diagram(block['type'], block['content'])
+            replacements.append((block['start'], block['end'],
+                                 render_replacement(block, mermaid_code, warning)))
+        assert single_pass(content, replacements) == legacy_splice(content, replacements)
+
+        new = best_of(single_pass, content, replacements)
+        old = best_of(legacy_splice, content, replacements, repeat=1)
+        timings.append((n, new))
+        print(f"{n:>8} {len(content):>10} {new * 1000:>16.2f} {old * 1000:>16.2f}")
+
+    (n_min, t_min), (n_max, t_max) = timings[0], timings[-1]
+    growth = t_max / max(t_min, 1e-9)
+    allowed = LINEAR_TOLERANCE * n_max / n_min
+    print(f"Croissance : x{growth:.1f} pour x{n_max / n_min:.0f} blocs (limite x{allowed:.0f})")
+    return 0 if growth <= allowed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
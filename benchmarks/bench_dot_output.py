@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Taille de la sortie Mermaid des graphes DOT générés (convert_dot_digraph).
+
+Compare la sortie actuelle (nœuds déclarés une fois, arêtes nues) avec
+l'ancien format qui répétait id["label"] aux deux extrémités de chaque arête.
+
+Usage:
+    python benchmarks/bench_dot_output.py [--sizes 1000,10000,50000] [--nodes-ratio 0.05]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app.conversion.commands.md2mmd import convert_dot_digraph, sanitize_node_id  # noqa: E402
+from src.app.conversion.dot import flatten, parse_dot  # noqa: E402
+
+
+def generated_digraph(edges, nodes, seed=0):
+    """Digraph de `edges` arêtes entre `nodes` services aux labels réalistes."""
+    rng = random.Random(seed)
+    names = [f'Service {i:05d} ({rng.choice(["API", "Base", "File", "Cache"])})' for i in range(nodes)]
+    lines = [f'    "{rng.choice(names)}" -> "{rng.choice(names)}";' for _ in range(edges)]
+    return 'digraph G {\n    rankdir=LR;\n' + '\n'.join(lines) + '\n}\n'
+
+
+def legacy_size(content):
+    """Taille de l'ancien format : label répété à chaque extrémité d'arête."""
+    flat = flatten(parse_dot(content))
+    lines = [
+        f'    {sanitize_node_id(s)}["{s}"] --> {sanitize_node_id(t)}["{t}"]'
+        for s, t, _ in flat.edges
+    ]
+    return len(('flowchart LR\n' + '\n'.join(lines)).encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1000,10000,50000', help="Nombres d'arêtes (défaut : %(default)s)")
+    parser.add_argument('--nodes-ratio', type=float, default=0.05,
+                        help='Nœuds distincts par arête (défaut : %(default)s)')
+    args = parser.parse_args()
+
+    print(f"{'arêtes':>8} {'nœuds':>7} {'ancien (o)':>12} {'actuel (o)':>12} {'gain':>7} {'temps (ms)':>11}")
+    for edges in (int(s) for s in args.sizes.split(',')):
+        nodes = max(2, int(edges * args.nodes_ratio))
+        content = generated_digraph(edges, nodes)
+        started = time.perf_counter()
+        mermaid, _ = convert_dot_digraph(content)
+        elapsed = (time.perf_counter() - started) * 1000
+        current = len(mermaid.encode('utf-8'))
+        old = legacy_size(content)
+        print(f"{edges:>8} {nodes:>7} {old:>12} {current:>12} {1 - current / old:>7.0%} {elapsed:>11.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
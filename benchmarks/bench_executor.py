@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Traitement par lot md2mmd : pool de threads contre pool de processus.
+
+Génère un corpus (benchmarks/corpus.py) puis convertit le même corpus avec
+convert_batch(executor='thread') et convert_batch(executor='process'), sans
+cache, et affiche la médiane de chaque mode. Les sorties des deux modes sont
+comparées octet pour octet.
+
+Sur un Python avec GIL, le pool de threads ne convertit qu'un fichier à la
+fois ; sur une construction free-threaded (python3.14t), il doit égaler ou
+battre le pool de processus, sans démarrage de workers ni pickle.
+
+Usage:
+    python benchmarks/bench_executor.py [--profile medium] [--jobs 4] [--repeat 3]
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from corpus import PROFILES, write_corpus  # noqa: E402
+from src.app.conversion.commands.md2mmd import convert_batch  # noqa: E402
+from src.app.conversion.executor import gil_enabled, resolve_executor  # noqa: E402
+
+MODES = ('thread', 'process')
+
+
+def outputs(directory):
+    return {path.name: path.read_bytes() for path in sorted(Path(directory).rglob('*.mmd.md'))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='medium')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, GIL {'actif' if gil_enabled() else 'désactivé'}, "
+          f"{args.jobs} worker(s), profil {args.profile} ; exécuteur auto = {resolve_executor()}")
+
+    medians = {}
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        write_corpus(directory, args.profile, args.seed)
+        for mode in MODES:
+            timings = []
+            for _ in range(args.repeat):
+                report = convert_batch([directory], jobs=args.jobs, executor=mode)
+                timings.append(report['elapsed'])
+                if report['failed']:
+                    print(f"[ÉCHEC] {len(report['failed'])} fichier(s) en échec ({mode})")
+                    return 1
+            medians[mode] = statistics.median(timings)
+            results[mode] = outputs(directory)
+            print(f"{mode:<8} médiane {medians[mode] * 1000:8.1f} ms  "
+                  f"min {min(timings) * 1000:8.1f} ms  ({report['files']} fichiers, {report['blocks']} blocs)")
+
+    if results['thread'] != results['process']:
+        print("[ÉCHEC] Les sorties des deux exécuteurs diffèrent")
+        return 1
+    print(f"[OK] Sorties identiques ; threads / processus = {medians['thread'] / medians['process']:.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark adversarial du scanner de clôtures Markdown (md2mmd.scan_fences).
+
+Génère des documents de N clôtures ```plantuml jamais fermées et mesure
+le temps d'extraction. L'ancienne expression régulière (lazy DOTALL)
+reparcourt la fin du document depuis chaque ouverture : O(n²). Le scanner
+doit rester linéaire.
+
+Usage:
+    python benchmarks/bench_fences.py [--sizes 1000,2000,5000,10000] [--legacy-max 4000]
+
+Code retour non nul si le temps croît nettement plus vite que la taille.
+"""
+
+import sys
+import re
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app.conversion.commands.md2mmd import extract_code_blocks  # noqa: E402
+
+# Expression historique, conservée ici uniquement pour comparaison
+LEGACY_CODE_BLOCK_RE = re.compile(
+    r'^```([\w]+)\s*\n(.*?)^```[ \t]*$',
+    re.MULTILINE | re.DOTALL
+)
+
+# Tolérance sur la croissance : temps(n_max)/temps(n_min) ≤ facteur × (n_max/n_min)
+LINEAR_TOLERANCE = 3.0
+
+
+def adversarial_document(n):
+    """Document de n clôtures plantuml non fermées."""
+    return "```plantuml\n@startuml\nA -> B\n" * n
+
+
+def best_of(func, arg, repeat=3):
+    """Meilleur temps sur `repeat` exécutions."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1000,2000,5000,10000',
+                        help='Nombres de clôtures non fermées (défaut : %(default)s)')
+    parser.add_argument('--legacy-max', type=int, default=4000,
+                        help="Taille maximale mesurée pour l'ancienne regex (défaut : %(default)s)")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    print(f"{'clôtures':>10} {'octets':>10} {'scanner (ms)':>14} {'regex (ms)':>12}")
+    timings = []
+    for n in sizes:
+        doc = adversarial_document(n)
+        scanner = best_of(extract_code_blocks, doc)
+        timings.append((n, scanner))
+        legacy = '-'
+        if n <= args.legacy_max:
+            legacy = f"{best_of(lambda d: list(LEGACY_CODE_BLOCK_RE.finditer(d)), doc, 1) * 1000:.1f}"
+        print(f"{n:>10} {len(doc):>10} {scanner * 1000:>14.2f} {legacy:>12}")
+
+    (n_min, t_min), (n_max, t_max) = timings[0], timings[-1]
+    growth = t_max / max(t_min, 1e-9)
+    allowed = LINEAR_TOLERANCE * n_max / n_min
+    print(f"Croissance : x{growth:.1f} pour une taille x{n_max / n_min:.0f} (limite x{allowed:.0f})")
+    return 0 if growth <= allowed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Démarrage à froid de la ligne de commande, mesuré avec python -X importtime.
+
+Lance N interpréteurs neufs qui importent app.cli et le module de la commande
+md2mmd, additionne le temps d'import cumulé des modules de premier niveau
+(hors site/encodings, chargés avant toute commande) et compare la médiane au
+budget : code retour 1 si le budget est dépassé, ou si un module réservé à
+certains usages (cache, DOT, dataclasses, json...) est importé au démarrage.
+
+Le bytecode est compilé une première fois dans un répertoire temporaire
+(PYTHONPYCACHEPREFIX) : la mesure correspond à une installation normale,
+même si PYTHONDONTWRITEBYTECODE est positionné.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 15] [--budget-ms 30]
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+
+STARTUP_CODE = 'import app.cli; import app.conversion.commands.md2mmd'
+
+# Modules chargés uniquement par les fonctionnalités qui en ont besoin
+LAZY_MODULES = (
+    'argparse', 'json', 'hashlib', 'tempfile', 'dataclasses', 'tracemalloc',
+    'unicodedata', 'concurrent.futures', 'subprocess', 'tarfile',
+    'app.conversion.archive', 'app.conversion.cache', 'app.conversion.dot', 'app.conversion.executor',
+    'app.conversion.git', 'app.conversion.manifest', 'app.conversion.output', 'app.conversion.results',
+    'app.conversion.revision', 'app.conversion.watch',
+)
+
+_PRELOADED = ('site', 'encodings')
+
+
+def parse_importtime(stderr):
+    """
+    Analyse la sortie de -X importtime.
+
+    Returns:
+        (total_us, {module: (self_us, cumulé_us)}) ; total_us additionne le
+        temps cumulé des imports de premier niveau hors site/encodings
+    """
+    modules = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_field, cumulative_field, name = line.split('|', 2)
+        self_us = int(self_field.split(':')[1])
+        cumulative_us = int(cumulative_field)
+        module = name.strip()
+        modules[module] = (self_us, cumulative_us)
+        if not name.startswith('  ') and module.split('.')[0] not in _PRELOADED:
+            total += cumulative_us
+    return total, modules
+
+
+def run_once(env):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=15, help='Interpréteurs lancés (défaut : %(default)s)')
+    parser.add_argument('--budget-ms', type=float, default=30.0,
+                        help="Budget du temps d'import médian, en ms (défaut : %(default)s)")
+    parser.add_argument('--top', type=int, default=10, help='Modules les plus coûteux affichés')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pycache:
+        env = dict(os.environ, PYTHONPATH=str(SRC), PYTHONPYCACHEPREFIX=pycache)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        run_once(env)  # compilation du bytecode
+
+        totals = []
+        modules = {}
+        for _ in range(args.runs):
+            total, modules = run_once(env)
+            totals.append(total)
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"Import à froid (app.cli + md2mmd) : médiane {median_ms:.1f} ms, "
+          f"min {min(totals) / 1000:.1f} ms sur {args.runs} exécution(s)")
+    print(f"{'module':<40} {'propre (ms)':>12} {'cumulé (ms)':>12}")
+    for name, (self_us, cumulative_us) in sorted(modules.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"{name:<40} {self_us / 1000:>12.2f} {cumulative_us / 1000:>12.2f}")
+
+    status = 0
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        print(f"[ÉCHEC] Modules importés au démarrage alors qu'ils devraient l'être à la demande : {', '.join(eager)}")
+        status = 1
+    if median_ms > args.budget_ms:
+        print(f"[ÉCHEC] Budget de démarrage dépassé : {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        status = 1
+    if not status:
+        print(f"[OK] Démarrage dans le budget ({args.budget_ms:.0f} ms)")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark mémoire de la conversion au fil de l'eau (md2mmd --stream).
+
+Génère un gros document Markdown (texte + blocs DOT/PlantUML) et compare le
+pic de mémoire tracée (tracemalloc) de la conversion en mémoire et de la
+conversion en flux.
+
+Usage:
+    python benchmarks/bench_stream_memory.py [--mb 50]
+
+Code retour non nul si le pic du mode flux dépasse 1 % de la taille du fichier.
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app.conversion.commands.md2mmd import convert_file  # noqa: E402
+
+CHUNK = """\
+## Page {i}
+
+{text}
+
+```dot
+digraph P{i} {{ "Page {i}" -> "Page {j}"; }}
+```
+
+```plantuml
+@startuml
+[*] --> Etat{i}
+Etat{i} --> [*]
+@enduml
+```
+
+"""
+
+
+def write_document(path, megabytes):
+    """Écrit un document d'environ `megabytes` Mo."""
+    text = 'Texte exporté du wiki. ' * 40
+    target = megabytes * 1024 * 1024
+    written = 0
+    i = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < target:
+            chunk = CHUNK.format(i=i, j=i + 1, text=text)
+            f.write(chunk)
+            written += len(chunk)
+            i += 1
+
+
+def peak_of(source, output, stream):
+    """Pic de mémoire tracée (octets) d'une conversion."""
+    # Les messages partent vers os.devnull : un StringIO fausserait le pic
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        tracemalloc.start()
+        ok = convert_file(source, output, stream=stream)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert ok
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--mb', type=int, default=50, help='Taille du document en Mo (défaut : %(default)s)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / 'wiki.md'
+        write_document(source, args.mb)
+        size = source.stat().st_size
+
+        in_memory = peak_of(source, Path(tmp) / 'memoire.mmd.md', stream=False)
+        streamed = peak_of(source, Path(tmp) / 'flux.mmd.md', stream=True)
+        identical = (Path(tmp) / 'memoire.mmd.md').read_bytes() == (Path(tmp) / 'flux.mmd.md').read_bytes()
+
+    mib = 1024 * 1024
+    print(f"Fichier       : {size / mib:8.1f} Mo")
+    print(f"En mémoire    : {in_memory / mib:8.1f} Mo de pic")
+    print(f"Flux          : {streamed / mib:8.2f} Mo de pic")
+    print(f"Sorties identiques : {'oui' if identical else 'NON'}")
+    return 0 if identical and streamed <= size / 100 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
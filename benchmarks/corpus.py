@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Générateur déterministe de corpus Markdown pour les benchmarks md2mmd.
+
+Chaque document mélange du texte, des blocs non convertis (python, mermaid)
+et des diagrammes PlantUML (séquence, classes, états) et Graphviz/DOT
+(digraph, graph). Tout dépend d'une graine : deux générations avec les mêmes
+paramètres produisent des octets identiques.
+
+Usage:
+    python benchmarks/corpus.py <répertoire> [--profile medium] [--seed 0]
+
+Profils : voir PROFILES (small, medium, large, dot-heavy).
+"""
+
+import sys
+import random
+import argparse
+from pathlib import Path
+
+# files        : nombre de fichiers
+# blocks       : diagrammes par fichier
+# paragraphs   : paragraphes de texte entre deux diagrammes
+# mix          : poids relatifs (sequence, class, state, digraph, graph)
+# plantuml_size: messages / classes / transitions par diagramme PlantUML
+# dot_edges    : arêtes par graphe DOT
+PROFILES = {
+    'small': {
+        'files': 20, 'blocks': 5, 'paragraphs': 2,
+        'mix': (3, 2, 2, 2, 1), 'plantuml_size': 8, 'dot_edges': 20,
+    },
+    'medium': {
+        'files': 100, 'blocks': 20, 'paragraphs': 3,
+        'mix': (3, 2, 2, 2, 1), 'plantuml_size': 15, 'dot_edges': 60,
+    },
+    'large': {
+        'files': 40, 'blocks': 200, 'paragraphs': 4,
+        'mix': (3, 2, 2, 2, 1), 'plantuml_size': 30, 'dot_edges': 150,
+    },
+    'dot-heavy': {
+        'files': 10, 'blocks': 10, 'paragraphs': 1,
+        'mix': (0, 0, 0, 3, 1), 'plantuml_size': 5, 'dot_edges': 2000,
+    },
+}
+
+KINDS = ('sequence', 'class', 'state', 'digraph', 'graph')
+
+_WORDS = (
+    'architecture service données utilisateur requête réponse module '
+    'composant interface flux déploiement serveur client cache base '
+    'configuration sécurité journal événement traitement validation'
+).split()
+
+
+def _sentence(rng, words=12):
+    text = ' '.join(rng.choice(_WORDS) for _ in range(words))
+    return text.capitalize() + '.'
+
+
+def paragraph(rng, sentences=4):
+    """Paragraphe de texte libre."""
+    return ' '.join(_sentence(rng) for _ in range(sentences))
+
+
+def plantuml_sequence(rng, size):
+    """Diagramme de séquence PlantUML de `size` messages."""
+    actors = [f'Acteur{i}' for i in range(max(2, size // 4))]
+    lines = ['@startuml', f'actor {actors[0]}']
+    lines += [f'participant "Service {a}" as {a}' for a in actors[1:]]
+    if rng.random() < 0.3:
+        lines.append('database "Base principale" as DB')
+        actors.append('DB')
+    for _ in range(size):
+        src, dst = rng.sample(actors, 2)
+        arrow = rng.choice(('->', '-->'))
+        lines.append(f'{src} {arrow} {dst} : {rng.choice(_WORDS)}')
+    lines.append('@enduml')
+    return '\n'.join(lines)
+
+
+def plantuml_class(rng, size):
+    """Diagramme de classes PlantUML de `size` classes."""
+    names = [f'Classe{i}' for i in range(max(2, size))]
+    lines = ['@startuml']
+    for name in names:
+        lines.append(f'class {name} {{')
+        lines += [f'  -String {rng.choice(_WORDS)}{i}' for i in range(3)]
+        lines.append(f'  +{rng.choice(_WORDS)}()')
+        lines.append('}')
+    for _ in range(size):
+        a, b = rng.sample(names, 2)
+        lines.append(f'{a} "1" -- "0..*" {b} : {rng.choice(_WORDS)} >')
+    lines.append('@enduml')
+    return '\n'.join(lines)
+
+
+def plantuml_state(rng, size):
+    """Diagramme d'états PlantUML de `size` transitions."""
+    states = [f'Etat{i}' for i in range(max(2, size // 2))]
+    lines = ['@startuml', f'[*] --> {states[0]}']
+    for _ in range(size):
+        a, b = rng.sample(states, 2)
+        lines.append(f'{a} --> {b} : {rng.choice(_WORDS)}')
+    lines.append(f'{states[-1]} --> [*]')
+    lines.append('@enduml')
+    return '\n'.join(lines)
+
+
+def dot_graph(rng, edges, directed=True):
+    """Graphe DOT de `edges` arêtes, avec labels quotés et identifiants nus."""
+    nodes = max(2, edges // 4)
+    names = [f'"Nœud {i} {rng.choice(_WORDS)}"' if i % 3 else f'n{i}' for i in range(nodes)]
+    op = '->' if directed else '--'
+    lines = [f'{"digraph" if directed else "graph"} G {{', f'    rankdir={rng.choice(("TB", "LR"))};']
+    if rng.random() < 0.5:
+        lines.append('    node [shape=box, style=filled, fillcolor="#e0f7fa"];')
+    for _ in range(edges):
+        a, b = rng.sample(names, 2)
+        lines.append(f'    {a} {op} {b};')
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def diagram(rng, kind, params):
+    """Retourne (langage du bloc, contenu) pour un type de diagramme."""
+    size = params['plantuml_size']
+    if kind == 'sequence':
+        return 'plantuml', plantuml_sequence(rng, size)
+    if kind == 'class':
+        return 'plantuml', plantuml_class(rng, size)
+    if kind == 'state':
+        return 'plantuml', plantuml_state(rng, size)
+    lang = rng.choice(('dot', 'graphviz'))
+    return lang, dot_graph(rng, params['dot_edges'], directed=(kind == 'digraph'))
+
+
+def markdown_document(rng, params, title='Document'):
+    """Document Markdown complet selon les paramètres d'un profil."""
+    parts = [f'# {title}\n']
+    for index in range(params['blocks']):
+        parts.append(f'## Section {index + 1}\n')
+        parts += [paragraph(rng) + '\n' for _ in range(params['paragraphs'])]
+        if rng.random() < 0.2:
+            parts.append('```python\nprint("bloc non converti")\n```\n')
+        kind = rng.choices(KINDS, weights=params['mix'])[0]
+        lang, content = diagram(rng, kind, params)
+        parts.append(f'```{lang}\n{content}\n```\n')
+    return '\n'.join(parts)
+
+
+def generate_documents(profile='medium', seed=0, **overrides):
+    """
+    Génère les documents d'un profil, en mémoire.
+
+    Args:
+        profile: Nom d'un profil de PROFILES
+        seed: Graine du générateur
+        overrides: Paramètres remplaçant ceux du profil (ex. blocks=50)
+
+    Returns:
+        Liste de (nom de fichier, contenu)
+    """
+    params = dict(PROFILES[profile], **overrides)
+    rng = random.Random(f'{profile}:{seed}')
+    return [
+        (f'doc_{i:04d}.md', markdown_document(rng, params, title=f'Document {i}'))
+        for i in range(params['files'])
+    ]
+
+
+def write_corpus(directory, profile='medium', seed=0, **overrides):
+    """Écrit le corpus dans un répertoire ; retourne la liste des chemins."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name, content in generate_documents(profile, seed, **overrides):
+        path = directory / name
+        path.write_text(content, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('directory', help='Répertoire de sortie du corpus')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='medium')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    paths = write_corpus(args.directory, args.profile, args.seed)
+    size = sum(p.stat().st_size for p in paths)
+    print(f"[OK] {len(paths)} fichier(s), {size / 1024:.0f} Ko écrits dans {args.directory}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
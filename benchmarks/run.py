@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks md2mmd sur corpus synthétique, avec contrôle de régression.
+
+Mesure, sur un corpus généré par benchmarks/corpus.py :
+- extract_code_blocks sur chaque document ;
+- chaque convertisseur (séquence, classes, états, digraph, graph) sur ses blocs ;
+- convert_file de bout en bout (lecture, conversion, écriture, sans cache) ;
+- le pic de mémoire (tracemalloc) de chaque convertisseur et de convert_file,
+  mesuré à part pour ne pas fausser les durées.
+
+Les résultats sont écrits en JSON. Avec --baseline, chaque mesure est comparée
+à la référence : le code retour est non nul si une médiane ou un pic mémoire
+dépasse la référence de plus de --threshold (25 % par défaut).
+
+Usage:
+    python benchmarks/run.py [--profile medium] [--output results.json]
+                             [--baseline benchmarks/baseline.json] [--threshold 0.25]
+                             [--save-baseline]
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import contextlib
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from corpus import PROFILES, generate_documents  # noqa: E402
+from src.app.conversion.commands.md2mmd import (  # noqa: E402
+    CONVERTER_VERSION,
+    convert_dot_digraph,
+    convert_dot_graph,
+    convert_file,
+    convert_plantuml_class,
+    convert_plantuml_sequence,
+    convert_plantuml_state,
+    detect_plantuml_type,
+    extract_code_blocks,
+)
+from src.app.conversion.dot import parse_dot  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+
+PLANTUML_CONVERTERS = {
+    'sequence': convert_plantuml_sequence,
+    'class': convert_plantuml_class,
+    'state': convert_plantuml_state,
+}
+
+
+def measure(func, repeat):
+    """Exécute func `repeat` fois ; retourne la liste des durées (s)."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summarize(timings, items, size):
+    return {
+        'best': min(timings),
+        'median': statistics.median(timings),
+        'repeat': len(timings),
+        'items': items,
+        'bytes': size,
+    }
+
+
+def classify_blocks(documents):
+    """Répartit les blocs du corpus par convertisseur."""
+    groups = {name: [] for name in ('sequence', 'class', 'state', 'digraph', 'graph')}
+    for _name, content in documents:
+        for block in extract_code_blocks(content):
+            if block['type'] == 'plantuml':
+                groups[detect_plantuml_type(block['content'])].append(block['content'])
+            else:
+                directed = parse_dot(block['content']).directed is not False
+                groups['digraph' if directed else 'graph'].append(block['content'])
+    return groups
+
+
+def run_suite(profile, seed, repeat):
+    """Exécute toute la suite ; retourne le dict des résultats."""
+    documents = generate_documents(profile, seed)
+    corpus_bytes = sum(len(c.encode('utf-8')) for _n, c in documents)
+    results = {}
+
+    results['extract_code_blocks'] = summarize(
+        measure(lambda: [extract_code_blocks(c) for _n, c in documents], repeat),
+        len(documents), corpus_bytes,
+    )
+
+    groups = classify_blocks(documents)
+    converters = dict(PLANTUML_CONVERTERS, digraph=convert_dot_digraph, graph=convert_dot_graph)
+    for name, blocks in groups.items():
+        if not blocks:
+            continue
+        converter = converters[name]
+        results[f'convert.{name}'] = summarize(
+            measure(lambda: [converter(b) for b in blocks], repeat),
+            len(blocks), sum(len(b.encode('utf-8')) for b in blocks),
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, content in documents:
+            path = Path(tmp) / name
+            path.write_text(content, encoding='utf-8')
+            paths.append(path)
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            results['convert_file'] = summarize(
+                measure(lambda: [convert_file(p) for p in paths], repeat),
+                len(paths), corpus_bytes,
+            )
+
+    return results
+
+
+def peak_memory(func, items):
+    """Pic de mémoire tracée (octets) de func(item), maximum sur les éléments."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            func(item)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_memory(profile, seed):
+    """Pics de mémoire par convertisseur et par fichier ; retourne le dict des résultats."""
+    documents = generate_documents(profile, seed)
+    results = {}
+
+    groups = classify_blocks(documents)
+    converters = dict(PLANTUML_CONVERTERS, digraph=convert_dot_digraph, graph=convert_dot_graph)
+    for name, blocks in groups.items():
+        if blocks:
+            results[f'convert.{name}'] = {'peak_bytes': peak_memory(converters[name], blocks), 'items': len(blocks)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, content in documents:
+            path = Path(tmp) / name
+            path.write_text(content, encoding='utf-8')
+            paths.append(path)
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            results['convert_file'] = {'peak_bytes': peak_memory(convert_file, paths), 'items': len(paths)}
+
+    return results
+
+
+def compare(results, baseline, threshold, section='results', key='median'):
+    """
+    Compare les mesures d'une section (médianes ou pics mémoire) à la référence.
+
+    Returns:
+        Liste de (nom, ratio, régression: bool) pour les mesures présentes des deux côtés
+    """
+    rows = []
+    for name, current in results.items():
+        reference = baseline.get(section, {}).get(name)
+        if not reference:
+            continue
+        ratio = current[key] / max(reference[key], 1e-12)
+        rows.append((f'{section}.{name}' if section != 'results' else name, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='medium')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5, help='Répétitions par mesure (défaut : %(default)s)')
+    parser.add_argument('--output', help='Fichier JSON des résultats (défaut : sortie standard)')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Référence JSON (défaut : %(default)s)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Régression tolérée sur la médiane (défaut : %(default)s = 25 %%)')
+    parser.add_argument('--save-baseline', action='store_true', help='Enregistre les résultats comme référence')
+    args = parser.parse_args()
+
+    document = {
+        'meta': {
+            'profile': args.profile,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'converter_version': CONVERTER_VERSION,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'results': run_suite(args.profile, args.seed, args.repeat),
+        'memory': run_memory(args.profile, args.seed),
+    }
+
+    payload = json.dumps(document, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(payload + '\n', encoding='utf-8')
+    if args.save_baseline:
+        Path(args.baseline).write_text(payload + '\n', encoding='utf-8')
+
+    print(f"{'mesure':<24} {'médiane (ms)':>13} {'éléments':>9} {'Mo/s':>8}", file=sys.stderr)
+    for name, result in document['results'].items():
+        throughput = result['bytes'] / max(result['median'], 1e-12) / (1024 * 1024)
+        print(f"{name:<24} {result['median'] * 1000:>13.2f} {result['items']:>9} {throughput:>8.1f}",
+              file=sys.stderr)
+    for name, result in document['memory'].items():
+        print(f"{'pic ' + name:<24} {result['peak_bytes'] / 1024:>10.1f} Ko", file=sys.stderr)
+    if not args.output and not args.save_baseline:
+        print(payload)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline or not baseline_path.exists():
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    if baseline.get('meta', {}).get('profile') != args.profile:
+        print(f"[ATTENTION] Référence établie sur le profil {baseline.get('meta', {}).get('profile')!r}, "
+              f"comparaison ignorée", file=sys.stderr)
+        return 0
+
+    regressions = 0
+    rows = compare(document['results'], baseline, args.threshold)
+    rows += compare(document['memory'], baseline, args.threshold, section='memory', key='peak_bytes')
+    for name, ratio, regressed in rows:
+        status = 'RÉGRESSION' if regressed else 'ok'
+        print(f"[{status}] {name} : x{ratio:.2f} par rapport à la référence", file=sys.stderr)
+        regressions += regressed
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,26 +1,39 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import sys
-import argparse
 
 COMMANDS = {
     'md2mmd': 'app.conversion.commands.md2mmd',
+    'serve': 'app.conversion.commands.serve',
+    'http': 'app.conversion.commands.http',
 }
 
 
-def main():
+def _build_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog='vscodiumbench',
         description='Outillage VSCode/VSCodium — scripts, conversion diagrammes',
     )
     parser.add_argument('command', choices=list(COMMANDS), help='Commande à exécuter')
     parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments de la commande')
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    # Chemin rapide : la commande est le premier argument, son module est
+    # importé seul et analyse lui-même ses options (un seul parseur argparse)
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        command, arguments = sys.argv[1], sys.argv[2:]
+    else:
+        # Aide, commande inconnue ou options globales : argparse
+        args = _build_parser().parse_args()
+        command, arguments = args.command, args.args
 
     import importlib
-    mod = importlib.import_module(COMMANDS[args.command])
-    sys.argv = [args.command] + args.args
+    mod = importlib.import_module(COMMANDS[command])
+    sys.argv = [command] + arguments
     sys.exit(mod.main())
 
 
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Archives d'entrée et de sortie de md2mmd (md2mmd docs.tar.gz -o docs-mmd.tar.gz)
+
+Le format se déduit de l'extension : .tar, .tar.gz/.tgz, .tar.bz2/.tbz2,
+.tar.xz/.txz, .zip. L'archive de sortie est écrite dans un fichier
+temporaire voisin, puis renommée à la fermeture : une conversion
+interrompue ne laisse pas d'archive tronquée à la place de la précédente.
+
+convert_archive() lit l'archive d'entrée entrée par entrée (tar en mode
+flux, zip par son répertoire central) et recopie chaque entrée dans
+l'archive de sortie, suivie du <fichier>.mmd.md de chaque .md : rien n'est
+extrait sur disque, et la mémoire est bornée par la plus grosse entrée .md
+(les autres entrées sont recopiées par blocs).
+"""
+
+import io
+import os
+import shutil
+import time
+
+TAR_SUFFIXES = {
+    '.tar': '',
+    '.tar.gz': 'gz',
+    '.tgz': 'gz',
+    '.tar.bz2': 'bz2',
+    '.tbz2': 'bz2',
+    '.tar.xz': 'xz',
+    '.txz': 'xz',
+}
+ZIP_SUFFIX = '.zip'
+
+_CHUNK = 1024 * 1024
+
+
+def archive_compression(path):
+    """
+    Compression d'une archive tar d'après l'extension de son nom.
+
+    Returns:
+        '', 'gz', 'bz2' ou 'xz' ; None si le nom n'est pas celui d'une archive tar
+    """
+    name = os.fspath(path).lower()
+    for suffix, compression in TAR_SUFFIXES.items():
+        if name.endswith(suffix):
+            return compression
+    return None
+
+
+def archive_kind(path):
+    """'tar' ou 'zip' d'après l'extension ; None si ce n'est pas une archive."""
+    if os.fspath(path).lower().endswith(ZIP_SUFFIX):
+        return 'zip'
+    return 'tar' if archive_compression(path) is not None else None
+
+
+class _AtomicArchive:
+    """Base des archives de sortie : fichier temporaire substitué à la fermeture."""
+
+    def __init__(self, path, mtime=None):
+        from .output import _temp_path
+
+        self.path = path
+        self.mtime = int(time.time()) if mtime is None else mtime
+        self.entries = 0
+        self._tmp = _temp_path(path)
+
+    def close(self, commit=True):
+        """Termine l'archive et la met en place ; l'abandonne si `commit` est faux."""
+        from .output import _discard
+
+        try:
+            self._archive.close()
+            if commit:
+                os.replace(self._tmp, self.path)
+                return
+        except BaseException:
+            _discard(self._tmp)
+            raise
+        _discard(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+        return False
+
+
+class TarWriter(_AtomicArchive):
+    """
+    Archive tar écrite entrée par entrée, substituée atomiquement à la fermeture.
+
+    Usage :
+        with TarWriter('docs.tar.gz', mtime=commit_time) as archive:
+            archive.add('docs/archi.mmd.md', data)
+
+    Args:
+        path: Fichier d'archive (compression selon l'extension)
+        mtime: Date des entrées ajoutées par add(), en secondes Unix (défaut :
+               maintenant) ; une date fixe rend l'archive reproductible
+    """
+
+    def __init__(self, path, mtime=None):
+        import tarfile
+
+        compression = archive_compression(path)
+        if compression is None:
+            raise ValueError(f"Extension d'archive inconnue : {path} (attendu : {', '.join(TAR_SUFFIXES)})")
+        super().__init__(path, mtime)
+        mode = f'w:{compression}' if compression else 'w'
+        self._archive = tarfile.open(self._tmp, mode, format=tarfile.PAX_FORMAT)
+
+    def add(self, name, data, mode=0o644):
+        """Ajoute un fichier régulier de contenu `data` (bytes)."""
+        import tarfile
+
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+        info.mode = mode
+        self._archive.addfile(info, io.BytesIO(data))
+        self.entries += 1
+
+    def add_member(self, info, fileobj=None):
+        """Recopie une entrée d'une autre archive tar (TarInfo, contenu lu par blocs)."""
+        self._archive.addfile(info, fileobj)
+        self.entries += 1
+
+
+class ZipWriter(_AtomicArchive):
+    """Archive zip (deflate) écrite entrée par entrée ; même usage que TarWriter."""
+
+    def __init__(self, path, mtime=None):
+        import zipfile
+
+        super().__init__(path, mtime)
+        self._archive = zipfile.ZipFile(self._tmp, 'w', compression=zipfile.ZIP_DEFLATED)
+
+    def add(self, name, data, mode=0o644):
+        """Ajoute un fichier régulier de contenu `data` (bytes)."""
+        import zipfile
+
+        # Le format zip ne date pas d'avant 1980
+        info = zipfile.ZipInfo(name, time.localtime(max(self.mtime, 315532800))[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = (0o100000 | mode) << 16
+        self._archive.writestr(info, data)
+        self.entries += 1
+
+    def add_member(self, info, fileobj=None):
+        """Recopie une entrée d'une autre archive zip (ZipInfo, contenu lu par blocs)."""
+        copy = _zip_info(info)
+        if fileobj is None:
+            self._archive.writestr(copy, b'')
+        else:
+            # file_size annoncé : zip64 choisi d'emblée pour les grosses entrées
+            copy.file_size = info.file_size
+            with self._archive.open(copy, 'w') as target:
+                shutil.copyfileobj(fileobj, target, _CHUNK)
+        self.entries += 1
+
+
+def _zip_info(info, name=None):
+    """Copie des métadonnées d'une entrée zip, sous un autre nom éventuellement."""
+    import zipfile
+
+    copy = zipfile.ZipInfo(name or info.filename, info.date_time)
+    copy.compress_type = info.compress_type
+    copy.create_system = info.create_system
+    copy.external_attr = info.external_attr
+    copy.comment = info.comment
+    return copy
+
+
+def open_archive(path, mtime=None):
+    """
+    Archive de sortie adaptée à l'extension de `path`.
+
+    Raises:
+        ValueError: extension d'archive inconnue
+    """
+    if archive_kind(path) == 'zip':
+        return ZipWriter(path, mtime)
+    return TarWriter(path, mtime)
+
+
+# ---------------------------------------------------------------------------
+# Conversion d'archive à archive
+# ---------------------------------------------------------------------------
+
+def _tar_output_info(member, name, size):
+    """En-tête de la sortie d'une entrée .md : métadonnées de la source."""
+    import copy
+
+    info = copy.copy(member)
+    info.name = name
+    info.size = size
+    # Les en-têtes PAX de la source porteraient son nom et sa taille
+    info.pax_headers = {key: value for key, value in member.pax_headers.items() if key not in ('path', 'size')}
+    return info
+
+
+def _convert_tar(source, writer, convert):
+    """Parcourt une archive tar en flux ; convert(name, data) rend la sortie ou None."""
+    import tarfile
+    from pathlib import PurePosixPath
+
+    from .core import is_source_markdown, output_name
+
+    with tarfile.open(source, 'r|*') as archive:
+        for member in archive:
+            if not member.isfile():
+                writer.add_member(member)
+                continue
+            path = PurePosixPath(member.name)
+            if path.name.lower().endswith('.mmd.md'):
+                continue
+            fileobj = archive.extractfile(member)
+            if not is_source_markdown(path):
+                writer.add_member(member, fileobj)
+                continue
+            data = fileobj.read()
+            writer.add_member(member, io.BytesIO(data))
+            converted = convert(member.name, data)
+            if converted is not None:
+                name = output_name(member.name)
+                writer.add_member(_tar_output_info(member, name, len(converted)), io.BytesIO(converted))
+
+
+def _convert_zip(source, writer, convert):
+    """Parcourt une archive zip entrée par entrée ; convert(name, data) rend la sortie ou None."""
+    import zipfile
+    from pathlib import PurePosixPath
+
+    from .core import is_source_markdown, output_name
+
+    with zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                writer.add_member(info)
+                continue
+            path = PurePosixPath(info.filename)
+            if path.name.lower().endswith('.mmd.md'):
+                continue
+            if not is_source_markdown(path):
+                with archive.open(info) as fileobj:
+                    writer.add_member(info, fileobj)
+                continue
+            data = archive.read(info)
+            writer.add_member(info, io.BytesIO(data))
+            converted = convert(info.filename, data)
+            if converted is not None:
+                output = _zip_info(info, output_name(info.filename))
+                output.file_size = len(converted)
+                writer.add_member(output, io.BytesIO(converted))
+
+
+def convert_archive(source, target, cache=None):
+    """
+    Convertit les .md d'une archive vers une nouvelle archive, sans extraction.
+
+    Toutes les entrées de `source` sont recopiées dans `target` (mêmes noms,
+    dates et droits), chaque .md suivi de son <fichier>.mmd.md ; les .mmd.md
+    déjà présents dans `source` sont écartés (sorties régénérées). La
+    compression de sortie suit l'extension de `target` ; une archive tar
+    produit une archive tar, une archive zip une archive zip.
+
+    Args:
+        source: Archive d'entrée (.tar[.gz|.bz2|.xz], .zip)
+        target: Archive de sortie, de la même famille
+        cache: Cache de blocs optionnel
+
+    Returns:
+        Dict de synthèse de convert_batch, plus 'entries' (entrées écrites)
+
+    Raises:
+        ValueError: format d'archive inconnu ou différent en entrée et en sortie
+        OSError, tarfile.TarError, zipfile.BadZipFile: archive illisible
+    """
+    from .core import convert_bytes
+
+    kind = archive_kind(source)
+    if kind is None:
+        raise ValueError(f"Archive d'entrée non reconnue : {source}")
+    if archive_kind(target) != kind:
+        raise ValueError(f"L'archive de sortie doit être une archive {kind} : {target}")
+
+    started = time.perf_counter()
+    report = {'files': 0, 'blocks': 0, 'converted': 0, 'cached': 0, 'warnings': 0,
+              'skipped': 0, 'unchanged': 0, 'failed': []}
+
+    def convert(name, data):
+        report['files'] += 1
+        try:
+            converted, counts = convert_bytes(data, cache)
+        except UnicodeDecodeError as e:
+            report['failed'].append({'path': f'{source}:{name}',
+                                     'error': f"[ERREUR] Problème d'encodage lors de la lecture : {e}"})
+            return None
+        for key in ('blocks', 'converted', 'cached', 'warnings', 'skipped'):
+            report[key] += counts[key]
+        return converted
+
+    with open_archive(target) as writer:
+        if kind == 'tar':
+            _convert_tar(source, writer, convert)
+        else:
+            _convert_zip(source, writer, convert)
+    if cache is not None:
+        cache.prune()
+
+    report['entries'] = writer.entries
+    report['elapsed'] = time.perf_counter() - started
+    return report
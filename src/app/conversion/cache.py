@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caches des conversions de blocs de diagrammes
+
+Chaque entrée associe (version du convertisseur, type de bloc, contenu du bloc)
+au résultat Mermaid et à l'avertissement éventuel. Les entrées sont des petits
+fichiers JSON écrits par renommage atomique : le cache est donc partageable
+entre les processus d'un traitement par lot sans verrou.
+
+L'éviction est de type LRU : un accès réussi rafraîchit la date de
+modification de l'entrée, et prune() supprime les entrées les plus anciennes
+jusqu'à repasser sous la taille maximale. La taille comptée est la place
+occupée sur disque (blocs alloués), et la place de chaque sous-répertoire est
+mémorisée dans un index : prune() ne relit que les sous-répertoires modifiés
+depuis l'élagage précédent.
+
+MemoryBlockCache ajoute un niveau LRU en mémoire pour les processus
+résidents (mode watch, serveur), éventuellement chaîné au cache disque.
+
+Les deux caches sont utilisables depuis plusieurs threads, y compris sans
+GIL : compteurs et LRU mémoire sont protégés par un verrou, les lectures et
+écritures disque restent hors verrou. Le verrou n'est pas transmis aux
+processus workers d'un lot : chaque copie du cache en recrée un.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+PRUNE_INDEX = 'prune-index.json'
+
+# Date de modification trop récente pour être fiable : une entrée écrite dans
+# le même tick d'horloge du système de fichiers ne la changerait pas
+_SETTLE_NS = 2 * 10**9
+
+
+def _disk_usage(st):
+    """Place occupée par un fichier : blocs alloués, ou taille sans st_blocks (Windows)."""
+    blocks = getattr(st, 'st_blocks', None)
+    return st.st_size if blocks is None else blocks * 512
+
+
+def default_cache_dir():
+    """Répertoire de cache par défaut (XDG_CACHE_HOME, LOCALAPPDATA ou ~/.cache)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+    root = Path(base) if base else Path.home() / '.cache'
+    return root / 'vscodiumbench' / 'md2mmd'
+
+
+class BlockCache:
+    """
+    Cache persistant des blocs convertis, indexé par empreinte de contenu.
+
+    Args:
+        directory: Répertoire du cache (défaut : default_cache_dir())
+        version: Version du convertisseur, incluse dans la clé
+        max_bytes: Taille maximale du cache avant éviction LRU
+    """
+
+    def __init__(self, directory=None, version='', max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.version = str(version)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def key(self, block_type, content):
+        """Empreinte SHA-256 de (version, type, contenu)."""
+        digest = hashlib.sha256()
+        for part in (self.version, block_type, content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return self.directory / key[:2] / (key + '.json')
+
+    def get(self, block_type, content):
+        """
+        Retourne le résultat mémorisé pour un bloc.
+
+        Returns:
+            (mermaid_code, warning) ou None si absent
+        """
+        path = self._entry_path(self.key(block_type, content))
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data['mermaid'], data['warning']
+
+    def put(self, block_type, content, mermaid_code, warning):
+        """Mémorise le résultat de conversion d'un bloc (écriture atomique)."""
+        import tempfile
+
+        path = self._entry_path(self.key(block_type, content))
+        payload = json.dumps({'mermaid': mermaid_code, 'warning': warning}, ensure_ascii=False)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            # Le cache est une optimisation : une écriture ratée n'est pas fatale
+            pass
+
+    def prune(self):
+        """
+        Supprime les entrées les moins récemment utilisées au-delà de max_bytes.
+
+        La place de chaque sous-répertoire est lue dans l'index, et recalculée
+        seulement si sa date de modification a changé (entrée ajoutée ou
+        supprimée, par ce processus ou un autre) : sans nouvelle entrée,
+        prune() ne lit que le répertoire racine.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        index = self._read_index()
+        usage = {}
+        try:
+            with os.scandir(self.directory) as it:
+                subdirs = [(entry.name, entry.stat().st_mtime_ns) for entry in it if entry.is_dir()]
+        except OSError:
+            return 0
+        for name, mtime in subdirs:
+            known = index.get(name)
+            if isinstance(known, list) and known[:1] == [mtime]:
+                usage[name] = known
+            else:
+                used = sum(size for _atime, size, _path in self._entries(name))
+                usage[name] = [self._settled(mtime), used]
+
+        removed = 0
+        if sum(used for _mtime, used in usage.values()) > self.max_bytes:
+            removed = self._evict(usage)
+        if usage != index:
+            self._write_index(usage)
+        return removed
+
+    def _entries(self, name):
+        """[(date d'accès, place occupée, chemin)] des entrées d'un sous-répertoire."""
+        entries = []
+        try:
+            with os.scandir(self.directory / name) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, _disk_usage(st), entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _evict(self, usage):
+        """Supprime les entrées les plus anciennes de tout le cache ; met `usage` à jour."""
+        entries = []
+        for name in usage:
+            listed = self._entries(name)
+            usage[name][1] = sum(size for _atime, size, _path in listed)
+            entries.extend(listed)
+        total = sum(used for _mtime, used in usage.values())
+
+        removed = 0
+        entries.sort()
+        for _atime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            name = os.path.basename(os.path.dirname(path))
+            # Sous-répertoire modifié : relu au prochain élagage
+            usage[name] = [None, usage[name][1] - size]
+        return removed
+
+    @staticmethod
+    def _settled(mtime):
+        """Date de modification à mémoriser, None si elle est trop récente pour être fiable."""
+        return mtime if time.time_ns() - mtime > _SETTLE_NS else None
+
+    def _read_index(self):
+        try:
+            index = json.loads((self.directory / PRUNE_INDEX).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self, usage):
+        import tempfile
+
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(usage, f)
+            os.replace(tmp, self.directory / PRUNE_INDEX)
+        except OSError:
+            pass
+
+
+class MemoryBlockCache:
+    """
+    Cache mémoire LRU des blocs convertis, pour les processus résidents.
+
+    Même interface que BlockCache (get/put/prune). Un cache disque peut être
+    chaîné derrière : il est consulté en cas d'absence et alimenté à chaque
+    ajout, ce qui conserve le cache chaud entre deux exécutions.
+
+    Args:
+        max_entries: Nombre maximal de blocs conservés en mémoire
+        backend: Cache de second niveau optionnel (ex. BlockCache)
+    """
+
+    def __init__(self, max_entries=4096, backend=None):
+        self.max_entries = max_entries
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, block_type, content):
+        """Retourne (mermaid_code, warning) ou None si absent."""
+        key = (block_type, content)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        if self.backend is not None:
+            value = self.backend.get(block_type, content)
+            if value is not None:
+                self._store(key, value, hit=True)
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, block_type, content, mermaid_code, warning):
+        """Mémorise le résultat de conversion d'un bloc."""
+        self._store((block_type, content), (mermaid_code, warning))
+        if self.backend is not None:
+            self.backend.put(block_type, content, mermaid_code, warning)
+
+    def _store(self, key, value, hit=False):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.hits += hit
+
+    def prune(self):
+        """Élague le cache de second niveau ; retourne le nombre d'entrées supprimées."""
+        return self.backend.prune() if self.backend is not None else 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serveur HTTP local de conversion
+
+Usage:
+    vscodiumbench http [--port N] [--host H] [--root DIR] [--no-cache]
+
+Voir app.conversion.httpd pour les routes, l'ETag et le cache des résultats.
+"""
+
+import os
+import sys
+
+
+def main():
+    """Point d'entrée de la commande http."""
+    import argparse
+
+    from ..httpd import DEFAULT_LRU_ENTRIES, DEFAULT_PORT
+
+    parser = argparse.ArgumentParser(
+        prog='http',
+        description='Serveur HTTP local md2mmd : POST /convert (corps Markdown) ou '
+                    'GET /convert?path=... sous --root ; ETag et If-None-Match (304).',
+    )
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port d\'écoute (défaut : %(default)s)')
+    parser.add_argument('--host', default='127.0.0.1', help='Adresse d\'écoute (défaut : %(default)s)')
+    parser.add_argument('--root', help='Racine des fichiers servis par GET (défaut : aucun fichier servi)')
+    parser.add_argument('--lru-entries', type=int, default=DEFAULT_LRU_ENTRIES,
+                        help='Documents convertis gardés en mémoire (défaut : %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Cache mémoire seul, sans cache disque des blocs')
+    parser.add_argument('--cache-dir', help='Répertoire du cache de blocs (défaut : ~/.cache/vscodiumbench/md2mmd)')
+    parser.add_argument('--quiet', action='store_true', help='Pas de journal des requêtes sur stderr')
+    args = parser.parse_args()
+
+    if args.root and not os.path.isdir(args.root):
+        print(f"[ERREUR] Racine introuvable : {args.root}", file=sys.stderr)
+        return 1
+
+    from ..cache import BlockCache, MemoryBlockCache
+    from ..httpd import ConversionEndpoint, ConversionHTTPServer
+    from ..core import CONVERTER_VERSION
+
+    backend = None if args.no_cache else BlockCache(args.cache_dir, CONVERTER_VERSION)
+    endpoint = ConversionEndpoint(args.root, MemoryBlockCache(backend=backend), args.lru_entries)
+    try:
+        server = ConversionHTTPServer((args.host, args.port), endpoint, quiet=args.quiet)
+    except OSError as e:
+        print(f"[ERREUR] Écoute impossible sur {args.host}:{args.port} : {e.strerror}", file=sys.stderr)
+        return 1
+
+    host, port = server.server_address[:2]
+    print(f"[INFO] md2mmd http : http://{host}:{port}/convert", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if backend is not None:
+            backend.prune()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,28 +8,110 @@ avec les blocs plantuml et dot/graphviz convertis en mermaid.
 
 Usage:
     python md2mmd.py <fichier.md>
+    python md2mmd.py <répertoire|glob>...   (traitement par lot)
 
 Sortie:
     <fichier>.mmd.md dans le même répertoire que le fichier source
+
+Bibliothèque:
+    convert_text(markdown) -> ConversionResult, sans fichier ni affichage
+    (le cœur de conversion est dans app.conversion.core ; ses fonctions
+    publiques restent importables depuis ce module)
 """
 
 import sys
 import io
-import re
-import unicodedata
+from functools import partial
 from pathlib import Path
 
-HELP = """Usage : vscodiumbench md2mmd <fichier.md> [-o <sortie.mmd.md>]
+from ..core import (
+    BLOCK_PARALLEL_MIN,
+    CONVERTER_VERSION,
+    FENCE_LINE_RE,
+    GLOB_CHARS,
+    MERMAID_RESERVED_IDS,
+    SUPPORTED_TYPES,
+    NodeIdAllocator,
+    assemble_segments,
+    collect_markdown_files,
+    convert_batch,
+    convert_block,
+    convert_bytes,
+    convert_diagram,
+    convert_dot_digraph,
+    convert_dot_graph,
+    convert_file,
+    convert_path,
+    convert_plantuml_class,
+    convert_plantuml_sequence,
+    convert_plantuml_state,
+    convert_stream,
+    convert_text,
+    detect_plantuml_type,
+    diagram_subtype,
+    extract_code_blocks,
+    has_diagram_fence,
+    is_source_markdown,
+    output_name,
+    render_replacement,
+    sanitize_node_id,
+    scan_fences,
+)
+# BlockResult et ConversionResult à la demande, par l'accès de app.conversion.core
+from ..core import __getattr__
+from ..metrics import NULL_FILE_METRICS, Metrics
+
+HELP = """Usage : vscodiumbench md2mmd <fichier.md|répertoire|glob>... [-o <sortie.mmd.md>] [-j N]
 
 Convertit les diagrammes PlantUML et Graphviz/DOT en Mermaid.
 Par défaut génère <fichier>.mmd.md dans le même répertoire.
+Avec un répertoire ou un motif glob, tous les .md sont convertis en lot.
+Avec une archive (.tar[.gz|.bz2|.xz], .zip) et -o <archive>, les entrées sont
+recopiées dans l'archive de sortie avec les .mmd.md, sans extraction.
 
 Options :
-  -o, --output  Fichier de sortie (défaut : <fichier>.mmd.md)
+  -             Lit l'entrée standard (sortie standard par défaut, messages sur stderr)
+  -o, --output  Fichier de sortie (défaut : <fichier>.mmd.md, fichier unique) ; '-' pour
+                la sortie standard
+  -j, --jobs    Workers du traitement par lot (défaut : nombre de cœurs)
+  --executor    auto | thread | process : threads si le GIL est désactivé
+                (Python free-threaded), processus sinon (défaut : auto)
+  --block-jobs  Processus de conversion des blocs d'un même fichier, pour les
+                documents de milliers de diagrammes (défaut : séquentiel)
+  --link        hardlink | reflink : sortie des fichiers sans diagramme liée ou
+                clonée au lieu d'être copiée (copie si le lien est impossible)
+  --no-cache    Reconvertit tous les blocs sans consulter le cache
+  --cache-dir   Répertoire du cache de blocs (défaut : ~/.cache/vscodiumbench/md2mmd)
+  --cache-max-mb  Taille maximale du cache (éviction LRU, défaut : 64)
+  --stream      Conversion au fil de l'eau, mémoire bornée par le plus gros bloc
+  --watch       Surveille les entrées et reconvertit à chaque enregistrement
+  --debounce-ms Anti-rebond du mode --watch (défaut : 50 ms)
+  --poll        Mode --watch par scrutation des dates (sans inotify)
+  --metrics json  Document JSON des durées par étape et par bloc (sortie standard,
+                les messages passent sur la sortie d'erreur)
+  --metrics-file  Écrit le document de mesures dans un fichier
+  --mem-profile Pics de mémoire par fichier et par convertisseur, sites
+                d'allocation (tracemalloc, ajoutés au document --metrics)
+  --check       Vérifie sans convertir que les sorties correspondent à leurs
+                sources (manifeste .md2mmd-manifest.json) ; code retour 1 sinon
+  --no-manifest N'écrit pas le manifeste des sorties (écrit par défaut dans chaque
+                répertoire de sortie : à versionner avec les .mmd.md)
+  --since REF   Ne convertit que les .md modifiés depuis REF (git diff), en un seul
+                lot dans ce processus ; les entrées restreignent alors la recherche
+  --staged      Ne convertit que les .md de l'index git (hook pre-commit)
+  --rev REV     Convertit les .md de la révision REV sans extraction (git cat-file
+                --batch) vers le répertoire ou l'archive (.tar[.gz], .zip) donné par -o ;
+                les entrées restreignent alors les chemins (relatifs à la racine)
 
 Exemples :
   vscodiumbench md2mmd _diagrams/multidiagrams.md
-  vscodiumbench md2mmd _diagrams/multidiagrams.md -o out/result.mmd.md"""
+  vscodiumbench md2mmd _diagrams/multidiagrams.md -o out/result.mmd.md
+  vscodiumbench md2mmd docs/ "_diagrams/**/*.md" -j 8
+  vscodiumbench md2mmd --watch _diagrams/
+  vscodiumbench md2mmd docs/ --metrics json > metrics.json
+  vscodiumbench md2mmd --rev v2.0 docs/ -o mermaid-v2.0.tar.gz
+  vscodiumbench md2mmd export-docs.zip -o export-docs-mermaid.zip
+  git show HEAD:docs/archi.md | vscodiumbench md2mmd - > archi.mmd.md"""
 
 
 def _fix_stdout_encoding():
@@ -38,448 +120,381 @@ def _fix_stdout_encoding():
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 
-# ---------------------------------------------------------------------------
-# Extraction des blocs de code
-# ---------------------------------------------------------------------------
-
-CODE_BLOCK_RE = re.compile(
-    r'^```([\w]+)\s*\n(.*?)^```[ \t]*$',
-    re.MULTILINE | re.DOTALL
-)
-
-SUPPORTED_TYPES = {'plantuml', 'dot', 'graphviz'}
-
-
-def extract_code_blocks(content):
-    """
-    Extrait les blocs de code PlantUML et Graphviz/DOT depuis un contenu Markdown.
-
-    Args:
-        content: Contenu texte du fichier Markdown
-
-    Returns:
-        Liste de dicts : [{'type': str, 'content': str, 'start': int, 'end': int}, ...]
-    """
-    blocks = []
-    for match in CODE_BLOCK_RE.finditer(content):
-        lang = match.group(1).lower()
-        if lang in SUPPORTED_TYPES:
-            blocks.append({
-                'type': lang,
-                'content': match.group(2),
-                'start': match.start(),
-                'end': match.end(),
-            })
-    return blocks
-
-
-# ---------------------------------------------------------------------------
-# Utilitaires
-# ---------------------------------------------------------------------------
-
-def sanitize_node_id(label):
-    """
-    Convertit un label DOT quelconque en identifiant Mermaid valide.
-
-    Règles appliquées :
-    - Suppression des accents
-    - Espaces et caractères spéciaux → underscore
-    - Début par une lettre (sinon préfixe N_)
-    - Underscores consécutifs réduits à un seul
-
-    Args:
-        label: Nom de nœud original (peut contenir espaces, accents, etc.)
-
-    Returns:
-        Identifiant valide pour Mermaid
-    """
-    # Supprimer les accents
-    nfkd = unicodedata.normalize('NFKD', label)
-    without_accents = ''.join(c for c in nfkd if not unicodedata.combining(c))
-
-    # Remplacer les caractères non alphanumériques par des underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9]', '_', without_accents)
-
-    # Réduire les underscores consécutifs
-    sanitized = re.sub(r'_+', '_', sanitized).strip('_')
-
-    # Assurer que l'identifiant commence par une lettre
-    if not sanitized or not sanitized[0].isalpha():
-        sanitized = 'N_' + sanitized
-
-    return sanitized or 'node'
-
-
-def detect_plantuml_type(content):
-    """
-    Détecte le type de diagramme PlantUML par heuristique sur les mots-clés.
-
-    Returns:
-        'sequence' | 'class' | 'state'
-    """
-    if 'class ' in content and '{' in content:
-        return 'class'
-    if '[*]' in content:
-        return 'state'
-    # Par défaut : séquence (couvre actor, participant, ->)
-    return 'sequence'
-
-
-# ---------------------------------------------------------------------------
-# Convertisseurs PlantUML
-# ---------------------------------------------------------------------------
-
-def convert_plantuml_sequence(content):
-    """
-    Convertit un diagramme de séquence PlantUML vers Mermaid.
-
-    Conversions appliquées :
-    - @startuml / @enduml supprimés
-    - actor X → participant X
-    - participant "Nom" as Alias → participant Alias as Nom
-    - database "Nom" as Alias → participant Alias as Nom (approximatif)
-    - -> → ->>
-    - --> → -->>
-
-    Returns:
-        (mermaid_code: str, warning: str | None)
-    """
-    lines = []
-    warnings = []
-    has_database = False
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-
-        # Ignorer les délimiteurs PlantUML
-        if line in ('@startuml', '@enduml'):
-            continue
-
-        # database → participant (approximatif)
-        if line.startswith('database '):
-            line = line.replace('database ', 'participant ', 1)
-            has_database = True
-
-        # actor → participant
-        if line.startswith('actor '):
-            line = line.replace('actor ', 'participant ', 1)
-
-        # participant "Nom long" as Alias → participant Alias as Nom long
-        alias_match = re.match(r'participant\s+"([^"]+)"\s+as\s+(\w+)(.*)', line)
-        if alias_match:
-            nom, alias, reste = alias_match.groups()
-            line = f'participant {alias} as {nom}{reste}'
-
-        # Conversion des flèches : -> → ->> et --> → -->>
-        # Ordre important : traiter --> avant ->
-        line = re.sub(r'([\w\"\'])\s*-->\s*([\w\"\'])', r'\1 -->> \2', line)
-        line = re.sub(r'([\w\"\'])\s*->\s*([\w\"\'])', r'\1 ->> \2', line)
-
-        if line:
-            lines.append('    ' + line)
-
-    if has_database:
-        warnings.append(
-            '<!-- ATTENTION: type "database" converti en participant (non supporté nativement par Mermaid) -->'
-        )
-
-    mermaid = 'sequenceDiagram\n' + '\n'.join(lines)
-    return mermaid, '\n'.join(warnings) if warnings else None
-
-
-def convert_plantuml_class(content):
-    """
-    Convertit un diagramme de classes PlantUML vers Mermaid.
-
-    Conversions appliquées :
-    - @startuml / @enduml supprimés
-    - Relations : "1" -- "0..*" → "1" --> "0..*"
-    - Trailing > supprimé dans les labels de relation
-
-    Returns:
-        (mermaid_code: str, warning: str | None)
-    """
-    lines = []
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-
-        if line in ('@startuml', '@enduml'):
-            continue
-
-        # Relation avec cardinalité : Membre "1" -- "0..*" Livre : emprunte >
-        # Convertir -- en --> et supprimer le > final
-        line = re.sub(r'"\s*--\s*"', '" --> "', line)
-        # Supprimer le > terminal dans les labels de relation
-        line = re.sub(r'\s*>\s*$', '', line)
-
-        if line:
-            lines.append('    ' + line)
-
-    mermaid = 'classDiagram\n' + '\n'.join(lines)
-    return mermaid, None
-
-
-def convert_plantuml_state(content):
-    """
-    Convertit un diagramme d'états PlantUML vers Mermaid.
-
-    La syntaxe est quasi-identique : seuls @startuml/@enduml sont supprimés.
-
-    Returns:
-        (mermaid_code: str, None)
-    """
-    lines = []
-
-    for raw_line in content.splitlines():
-        line = raw_line.strip()
-
-        if line in ('@startuml', '@enduml'):
-            continue
-
-        if line:
-            lines.append('    ' + line)
-
-    mermaid = 'stateDiagram-v2\n' + '\n'.join(lines)
-    return mermaid, None
+def _print_batch_report(report):
+    """Affiche le rapport agrégé d'un traitement par lot."""
+    for failure in report['failed']:
+        print(f"{failure['error']} ({failure['path']})")
+    print(
+        f"[OK] {report['files']} fichier(s) analysé(s), "
+        f"{report['converted']} diagramme(s) converti(s) sur {report['blocks']} "
+        f"({report['cached']} depuis le cache), "
+        f"{report['warnings']} avertissement(s), "
+        f"{report['skipped']} fichier(s) sans diagramme copié(s) par le préfiltre, "
+        f"{report['unchanged']} sortie(s) déjà à jour, "
+        f"{len(report['failed'])} échec(s) en {report['elapsed']:.2f} s"
+    )
 
 
 # ---------------------------------------------------------------------------
-# Convertisseurs Graphviz/DOT
+# Point d'entrée CLI
 # ---------------------------------------------------------------------------
 
-_DOT_EDGE_DIRECTED_RE = re.compile(
-    r'"([^"]+)"\s*->\s*"([^"]+)"(?:\s*\[[^\]]*\])?(?:\s*;)?'
-)
-_DOT_EDGE_UNDIRECTED_RE = re.compile(
-    r'"([^"]+)"\s*--\s*"([^"]+)"(?:\s*\[[^\]]*\])?(?:\s*;)?'
-)
-_DOT_RANKDIR_RE = re.compile(r'rankdir\s*=\s*(\w+)', re.IGNORECASE)
-_DOT_GLOBAL_NODE_STYLE_RE = re.compile(r'node\s*\[([^\]]+)\]', re.DOTALL)
-
-
-def _detect_dot_direction(content):
-    """Retourne la direction Mermaid depuis rankdir DOT."""
-    match = _DOT_RANKDIR_RE.search(content)
-    if match:
-        rankdir = match.group(1).upper()
-        mapping = {'TB': 'TD', 'TD': 'TD', 'LR': 'LR', 'RL': 'RL', 'BT': 'BT'}
-        return mapping.get(rankdir, 'TD')
-    return 'TD'
+def main():
+    """Point d'entrée principal."""
+    _fix_stdout_encoding()
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='md2mmd',
+        description='Convertit les diagrammes PlantUML et Graphviz/DOT en Mermaid.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            'Exemples :\n'
+            '  vscodiumbench md2mmd _diagrams/multidiagrams.md\n'
+            '  vscodiumbench md2mmd docs/ "_diagrams/**/*.md" -j 8\n'
+            '  vscodiumbench md2mmd --watch _diagrams/\n'
+            '  vscodiumbench md2mmd --check _diagrams/\n'
+            '  vscodiumbench md2mmd --staged\n'
+            '  vscodiumbench md2mmd --since origin/main docs/\n'
+            '  vscodiumbench md2mmd --rev v2.0 docs/ -o mermaid-v2.0.tar.gz\n'
+            '  vscodiumbench md2mmd export-docs.tar.gz -o export-docs-mermaid.tar.gz\n'
+            '  git show HEAD:docs/archi.md | vscodiumbench md2mmd - > archi.mmd.md'
+        ),
+    )
+    parser.add_argument('inputs', nargs='*', metavar='input',
+                        help="Fichier Markdown source (.md), répertoire, motif glob, archive (.tar[.gz], .zip) "
+                             "ou '-' (entrée standard) ; "
+                             "avec --since/--staged/--rev, chemins auxquels se limiter (défaut : tout le dépôt)")
+    parser.add_argument('-o', '--output',
+                        help="Fichier de sortie ou '-' (défaut : <input>.mmd.md ; sortie standard pour '-') ; "
+                             "avec --rev, répertoire ou archive ; avec une archive en entrée, archive de sortie")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Nombre de workers pour le traitement par lot (défaut : nombre de cœurs)')
+    parser.add_argument('--executor', choices=['auto', 'thread', 'process'], default='auto',
+                        help='Pool du traitement par lot : threads sans GIL, processus sinon (défaut : %(default)s)')
+    parser.add_argument('--block-jobs', type=int, default=None,
+                        help='Processus de conversion des blocs d\'un même fichier (défaut : séquentiel)')
+    parser.add_argument('--link', choices=['hardlink', 'reflink'],
+                        help='Fichiers sans diagramme : lien physique ou clone (reflink) au lieu d\'une copie')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Désactive le cache des blocs déjà convertis')
+    parser.add_argument('--cache-dir', help='Répertoire du cache de blocs (défaut : ~/.cache/vscodiumbench/md2mmd)')
+    parser.add_argument('--cache-max-mb', type=int, default=None,
+                        help='Taille maximale du cache avant éviction LRU, en Mo (défaut : 64)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Conversion au fil de l\'eau (mémoire bornée, pour les fichiers de plusieurs Go)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Surveille les entrées et reconvertit chaque fichier modifié')
+    parser.add_argument('--debounce-ms', type=int, default=50,
+                        help='Anti-rebond du mode --watch, en ms (défaut : %(default)s)')
+    parser.add_argument('--poll', action='store_true',
+                        help='Mode --watch par scrutation des dates de modification (sans inotify)')
+    parser.add_argument('--metrics', choices=['json'],
+                        help='Émet un document JSON des durées par étape et par bloc')
+    parser.add_argument('--metrics-file', help='Fichier du document de mesures (défaut : sortie standard)')
+    parser.add_argument('--mem-profile', action='store_true',
+                        help='Mesure les pics de mémoire (tracemalloc) par fichier et par convertisseur')
+    parser.add_argument('--check', action='store_true',
+                        help='Vérifie sans convertir que les sorties sont à jour (manifeste) ; '
+                             'code retour 1 et liste des sorties périmées sinon')
+    parser.add_argument('--no-manifest', action='store_true',
+                        help='N\'écrit pas le manifeste .md2mmd-manifest.json des sorties '
+                             '(à versionner avec les .mmd.md pour --check)')
+    parser.add_argument('--since', metavar='REF',
+                        help='Ne traite que les .md modifiés depuis REF (git diff REF), dans ce processus')
+    parser.add_argument('--staged', action='store_true',
+                        help='Ne traite que les .md présents dans l\'index git (pre-commit)')
+    parser.add_argument('--rev', metavar='REV',
+                        help='Convertit les .md de la révision REV sans extraction, vers -o (répertoire ou archive .tar[.gz], .zip)')
+    args = parser.parse_args()
 
+    if args.rev:
+        if not args.output or args.output == '-':
+            parser.error("--rev requiert -o <répertoire ou archive .tar[.gz]/.zip>")
+        if args.since or args.staged or args.watch or args.check or '-' in args.inputs:
+            parser.error("--rev ne se combine pas avec --since, --staged, --watch, --check ni '-'")
+    elif args.since or args.staged:
+        if args.output or args.watch or '-' in args.inputs:
+            parser.error("--since/--staged ne se combinent pas avec -o, --watch ni '-'")
+        from ..git import GitError, changed_files
+
+        try:
+            files = [path for path in changed_files(args.since, args.staged, args.inputs)
+                     if is_source_markdown(path) and path.is_file()]
+        except GitError as e:
+            print(f"[ERREUR] git : {e}")
+            return 1
+        if not files:
+            print("[OK] Aucun fichier Markdown modifié")
+            return 0
+        # Lot dans ce processus : quelques fichiers, pas de pool à démarrer
+        args.inputs = [str(path) for path in files]
+        if args.jobs is None:
+            args.jobs = 1
+    elif not args.inputs:
+        parser.error("au moins une entrée est requise (ou --since/--staged/--rev)")
+
+    archive_input = not args.rev and len(args.inputs) == 1 and _is_archive(args.inputs[0])
+    if archive_input:
+        from ..archive import archive_kind
+
+        if not args.output or archive_kind(args.output) != archive_kind(args.inputs[0]):
+            parser.error("une archive en entrée requiert -o <archive de sortie du même format (tar ou zip)>")
+        if args.check or args.watch or args.stream:
+            parser.error("une archive en entrée ne se combine pas avec --check, --watch ni --stream")
+
+    if args.check:
+        if '-' in args.inputs or args.output == '-' or args.watch:
+            parser.error("--check ne se combine pas avec '-' ni --watch")
+        if args.output and len(args.inputs) > 1:
+            parser.error("-o/--output n'est utilisable qu'avec un seul fichier source")
+        return _check(args.inputs, args.output)
+
+    cache = None
+    if not args.no_cache:
+        from ..cache import BlockCache, DEFAULT_MAX_BYTES
+
+        max_bytes = DEFAULT_MAX_BYTES if args.cache_max_mb is None else args.cache_max_mb * 1024 * 1024
+        cache = BlockCache(args.cache_dir, CONVERTER_VERSION, max_bytes)
+
+    if args.rev:
+        return _convert_revision(args, cache)
+    if archive_input:
+        return _convert_archive(args, cache)
+
+    if args.watch:
+        if args.output:
+            parser.error("-o/--output n'est pas utilisable avec --watch")
+        from ..cache import MemoryBlockCache
+        from ..watch import watch
+        try:
+            watch(args.inputs, cache=MemoryBlockCache(backend=cache),
+                  debounce=args.debounce_ms / 1000, poll=args.poll, manifest=not args.no_manifest)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    single = args.inputs[0]
+    if args.output and (len(args.inputs) > 1 or Path(single).is_dir() or GLOB_CHARS.intersection(single)):
+        parser.error("-o/--output n'est utilisable qu'avec un seul fichier source")
+    if '-' in args.inputs and len(args.inputs) > 1:
+        parser.error("'-' (entrée standard) ne se combine pas avec d'autres entrées")
+
+    stdio = single == '-' or args.output == '-'
+    metrics_to_stdout = args.metrics and not args.metrics_file
+    if stdio and metrics_to_stdout:
+        parser.error("--metrics json écrit sur la sortie standard : utilisez --metrics-file avec '-'")
+
+    metrics = None
+    if args.metrics or args.metrics_file or args.mem_profile:
+        metrics = Metrics(memory=args.mem_profile)
+    try:
+        if not (stdio or metrics_to_stdout):
+            return _run(args, cache, metrics)
+
+        # Sortie standard réservée aux données (document converti ou mesures) :
+        # les messages passent sur stderr
+        stdout = sys.stdout
+        from contextlib import redirect_stdout
+
+        with redirect_stdout(sys.stderr):
+            status = _run(args, cache, metrics, stdout)
+        if metrics_to_stdout:
+            _emit_metrics(metrics, stdout)
+        return status
+    finally:
+        if metrics is not None:
+            metrics.close()
+
+
+def _run(args, cache, metrics=None, stdout=None):
+    """Conversion d'un fichier unique ou d'un lot selon les entrées ; retourne le code de sortie."""
+    single = args.inputs[0]
+    if single == '-' or args.output == '-':
+        status = _convert_stdio(single, args.output, stdout or sys.stdout, cache, metrics)
+        if cache is not None:
+            cache.prune()
+    elif len(args.inputs) == 1 and not Path(single).is_dir() and not GLOB_CHARS.intersection(single) \
+            and not (args.since or args.staged):
+        result = convert_file(single, args.output, cache=cache, stream=args.stream, metrics=metrics,
+                              block_jobs=args.block_jobs, link=args.link, manifest=not args.no_manifest)
+        if cache is not None:
+            cache.prune()
+        status = 0 if result else 1
+    else:
+        report = convert_batch(args.inputs, jobs=args.jobs, cache=cache, stream=args.stream, metrics=metrics,
+                               block_jobs=args.block_jobs, executor=args.executor, link=args.link,
+                               manifest=not args.no_manifest)
+        _print_batch_report(report)
+        status = 0 if not report['failed'] else 1
+
+    if metrics is not None and metrics.memory:
+        _print_memory_report(metrics.to_dict())
+    if metrics is not None and args.metrics_file:
+        with open(args.metrics_file, 'w', encoding='utf-8') as target:
+            _emit_metrics(metrics, target)
+    return status
+
+
+def _convert_revision(args, cache=None):
+    """md2mmd --rev : conversion d'une révision git ; retourne le code de sortie."""
+    from ..git import GitError
+    from ..revision import convert_revision
 
-def convert_dot_digraph(content):
-    """
-    Convertit un graphe orienté DOT (digraph) vers Mermaid flowchart.
+    try:
+        report = convert_revision(args.rev, args.output, args.inputs, cache=cache)
+    except GitError as e:
+        print(f"[ERREUR] git : {e}")
+        return 1
+    _print_batch_report(report)
+    print(f"[OK] Sorties de {args.rev} ({report['commit'][:12]}) : {args.output}")
+    return 0 if not report['failed'] else 1
+
+
+def _is_archive(item):
+    """Vrai pour un fichier d'archive existant (un .md n'en est jamais un)."""
+    path = Path(item)
+    if is_source_markdown(path) or not path.is_file():
+        return False
+    from ..archive import archive_kind
 
-    Conversions appliquées :
-    - digraph Name { } → flowchart TD|LR
-    - "Node A" -> "Node B"; → NodeA[Node A] --> NodeB[Node B]
-    - rankdir → direction Mermaid
-    - Avertissement si styles globaux détectés
+    return archive_kind(path) is not None
 
-    Returns:
-        (mermaid_code: str, warning: str | None)
-    """
-    direction = _detect_dot_direction(content)
-    lines = []
-    warnings = []
 
-    for match in _DOT_EDGE_DIRECTED_RE.finditer(content):
-        from_label, to_label = match.group(1), match.group(2)
-        from_id = sanitize_node_id(from_label)
-        to_id = sanitize_node_id(to_label)
-        lines.append(f'    {from_id}["{from_label}"] --> {to_id}["{to_label}"]')
+def _convert_archive(args, cache=None):
+    """md2mmd <archive> -o <archive> : conversion d'archive à archive ; retourne le code de sortie."""
+    import tarfile
+    import zipfile
 
-    # Avertissement si styles globaux présents
-    if _DOT_GLOBAL_NODE_STYLE_RE.search(content):
-        warnings.append(
-            '<!-- ATTENTION: Styles globaux DOT (fillcolor, shape, etc.) '
-            'non traduits — utilisez des classDef Mermaid si nécessaire -->'
-        )
+    from ..archive import convert_archive
 
-    mermaid = f'flowchart {direction}\n' + '\n'.join(lines)
-    return mermaid, '\n'.join(warnings) if warnings else None
+    source = args.inputs[0]
+    try:
+        report = convert_archive(source, args.output, cache=cache)
+    except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+        print(f"[ERREUR] Archive illisible : {source} ({e})")
+        return 1
+    _print_batch_report(report)
+    print(f"[OK] {report['entries']} entrée(s) écrite(s) : {args.output}")
+    return 0 if not report['failed'] else 1
 
 
-def convert_dot_graph(content):
+def _check(inputs, output=None):
     """
-    Convertit un graphe non-orienté DOT (graph) vers Mermaid flowchart.
-
-    Conversion approximative : les arêtes non-orientées sont représentées
-    par des flèches bidirectionnelles (<-->).
+    md2mmd --check : liste les sorties périmées sans rien convertir.
 
     Returns:
-        (mermaid_code: str, warning: str)
+        Code de sortie (0 si toutes les sorties sont à jour)
     """
-    lines = []
-    warnings = [
-        '<!-- ATTENTION: Conversion approximative depuis graphe non-orienté DOT -->',
-        '<!-- Les flèches bidirectionnelles (<-->) représentent les arêtes non-orientées -->',
-    ]
-
-    for match in _DOT_EDGE_UNDIRECTED_RE.finditer(content):
-        from_label, to_label = match.group(1), match.group(2)
-        from_id = sanitize_node_id(from_label)
-        to_id = sanitize_node_id(to_label)
-        lines.append(f'    {from_id}["{from_label}"] <--> {to_id}["{to_label}"]')
-
-    if 'layout=' in content:
-        warnings.append(
-            '<!-- ATTENTION: Attribut layout= DOT (neato, circo, etc.) '
-            'non supporté par Mermaid —  disposition automatique appliquée -->'
-        )
-
-    mermaid = 'flowchart TD\n' + '\n'.join(lines)
-    return mermaid, '\n'.join(warnings)
-
-
-# ---------------------------------------------------------------------------
-# Routeur de conversion
-# ---------------------------------------------------------------------------
-
-def convert_diagram(diagram_type, content):
+    from ..manifest import MANIFEST_NAME, check_outputs
+
+    files = collect_markdown_files(inputs)
+    if output:
+        pairs = [(path, Path(output)) for path in files]
+    else:
+        pairs = [(path, path.parent / (path.stem + '.mmd.md')) for path in files]
+    stale = check_outputs(pairs, CONVERTER_VERSION)
+    for source, target, reason in stale:
+        print(f"[PÉRIMÉ] {target} ({source}) : {reason}")
+    if stale:
+        print(f"[ERREUR] {len(stale)}/{len(pairs)} sortie(s) périmée(s) — relancez md2mmd sur ces fichiers")
+        return 1
+    print(f"[OK] {len(pairs)} sortie(s) à jour ({MANIFEST_NAME}, convertisseur {CONVERTER_VERSION})")
+    return 0
+
+
+def _convert_stdio(input_path, output_path, stdout, cache=None, metrics=None):
     """
-    Route la conversion vers la fonction spécifique selon le type de diagramme.
-
-    Args:
-        diagram_type: 'plantuml' | 'dot' | 'graphviz'
-        content: Contenu brut du bloc de code
+    Conversion au fil de l'eau depuis l'entrée standard et/ou vers la sortie
+    standard ('-'), pour les pipelines shell. Les messages vont sur stderr.
 
     Returns:
-        (mermaid_code: str | None, warning: str | None)
+        Code de sortie (0 si succès)
     """
-    if diagram_type == 'plantuml':
-        subtype = detect_plantuml_type(content)
-        if subtype == 'class':
-            return convert_plantuml_class(content)
-        elif subtype == 'state':
-            return convert_plantuml_state(content)
-        else:
-            return convert_plantuml_sequence(content)
-
-    elif diagram_type in ('dot', 'graphviz'):
-        if re.search(r'\bdigraph\b', content):
-            return convert_dot_digraph(content)
-        elif re.search(r'\bgraph\b', content):
-            return convert_dot_graph(content)
-        else:
-            # Fallback : supposer digraph
-            return convert_dot_digraph(content)
-
-    return None, f'<!-- Type de diagramme non supporté: {diagram_type} -->'
-
+    import contextlib
 
-# ---------------------------------------------------------------------------
-# Orchestrateur principal
-# ---------------------------------------------------------------------------
-
-def convert_file(input_path, output_path=None):
-    """
-    Convertit un fichier Markdown en remplaçant les diagrammes PlantUML/DOT par Mermaid.
+    echo = partial(print, file=sys.stderr)
+    from_stdin = input_path == '-'
+    to_stdout = output_path == '-' or (from_stdin and not output_path)
+    file_metrics = metrics.begin_file(input_path) if metrics is not None else NULL_FILE_METRICS
+    output = None
 
-    Le fichier de sortie est créé dans le même répertoire avec l'extension .mmd.md.
-
-    Args:
-        input_path: Chemin vers le fichier .md source (str ou Path)
-
-    Returns:
-        True si la conversion réussit, False sinon
-    """
     try:
-        path = Path(input_path)
-
-        if not path.exists():
-            print(f"[ERREUR] Fichier introuvable : {path}")
-            return False
-
-        if not path.is_file():
-            print(f"[ERREUR] Chemin invalide (pas un fichier) : {path}")
-            return False
-
-        if path.suffix.lower() != '.md':
-            print(f"[ERREUR] Extension invalide (attendu .md) : {path.suffix}")
-            return False
-
-        print(f"[INFO] Lecture : {path}")
-        content = path.read_text(encoding='utf-8')
-
-        blocks = extract_code_blocks(content)
-
-        if not blocks:
-            print("[INFO] Aucun diagramme PlantUML/DOT trouvé — fichier copié tel quel")
-            output_path = Path(output_path) if output_path else path.parent / (path.stem + '.mmd.md')
-            output_path.write_text(content, encoding='utf-8')
-            print(f"[OK] Créé : {output_path}")
-            return True
-
-        print(f"[INFO] {len(blocks)} diagramme(s) détecté(s)")
-
-        # Traiter les blocs en ordre inverse pour préserver les indices
-        converted_content = content
-        conversion_count = 0
-        warning_count = 0
-
-        for block in reversed(blocks):
-            mermaid_code, warning = convert_diagram(block['type'], block['content'])
-
-            if mermaid_code is None:
-                continue
-
-            replacement = f'```mermaid\n{mermaid_code}\n```'
-            if warning:
-                replacement = warning + '\n' + replacement
-                warning_count += 1
-
-            converted_content = (
-                converted_content[:block['start']]
-                + replacement
-                + converted_content[block['end']:]
-            )
-            conversion_count += 1
-            print(f"[OK] Converti : {block['type']} → mermaid")
-
-        output_path = Path(output_path) if output_path else path.parent / (path.stem + '.mmd.md')
-        output_path.write_text(converted_content, encoding='utf-8')
-
-        print(f"[OK] {conversion_count} diagramme(s) converti(s)")
-        if warning_count:
-            print(f"[ATTENTION] {warning_count} conversion(s) approximative(s) — vérifiez les commentaires dans le fichier")
-        print(f"[OK] Fichier créé : {output_path}")
-        return True
-
-    except PermissionError:
-        print(f"[ERREUR] Permission refusée lors de l'écriture du fichier de sortie")
-        return False
-    except UnicodeDecodeError as e:
-        print(f"[ERREUR] Problème d'encodage lors de la lecture : {e}")
-        return False
-    except Exception as e:
-        print(f"[ERREUR] Erreur inattendue : {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-# ---------------------------------------------------------------------------
-# Point d'entrée CLI
-# ---------------------------------------------------------------------------
-
-def main():
-    """Point d'entrée principal."""
-    _fix_stdout_encoding()
-    import argparse
-    parser = argparse.ArgumentParser(
-        prog='md2mmd',
-        description='Convertit les diagrammes PlantUML et Graphviz/DOT en Mermaid.',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='Exemple :\n  vscodiumbench md2mmd _diagrams/multidiagrams.md',
-    )
-    parser.add_argument('input', help='Fichier Markdown source (.md)')
-    parser.add_argument('-o', '--output', help='Fichier de sortie (défaut : <input>.mmd.md)')
-    args = parser.parse_args()
-    result = convert_file(args.input, args.output)
-    return 0 if result else 1
+        with contextlib.ExitStack() as stack:
+            if from_stdin:
+                source = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+                stack.callback(source.detach)
+            else:
+                source = stack.enter_context(open(input_path, encoding='utf-8'))
+            if to_stdout:
+                target = stdout
+            else:
+                # Écriture atomique : un lien physique vers la source (--link)
+                # n'est jamais tronqué, une sortie identique n'est pas réécrite
+                from ..output import AtomicOutput
+
+                output = AtomicOutput(output_path)
+                target = stack.enter_context(output)
+
+            sizes = [0, 0]
+            write = target.write
+            if file_metrics is not NULL_FILE_METRICS:
+                source = _counting_lines(source, sizes)
+                write = _counting_write(target.write, sizes)
+
+            with file_metrics.stage('stream'):
+                counts = convert_stream(source, write, cache, None, file_metrics)
+            target.flush()
+    except (OSError, UnicodeDecodeError) as e:
+        echo(f"[ERREUR] {e}")
+        return 1
+
+    file_metrics.finish(True, *sizes)
+    echo(f"[OK] {counts['converted']}/{counts['blocks']} diagramme(s) converti(s) en flux")
+    if output is not None and not output.changed:
+        echo(f"[OK] Déjà à jour (non réécrit) : {output_path}")
+    return 0
+
+
+def _counting_lines(lines, sizes):
+    for line in lines:
+        sizes[0] += len(line.encode('utf-8'))
+        yield line
+
+
+def _counting_write(write, sizes):
+    def counting(text):
+        sizes[1] += len(text.encode('utf-8'))
+        return write(text)
+    return counting
+
+
+def _format_bytes(size):
+    return f"{size / (1024 * 1024):.1f} Mo" if size >= 1024 * 1024 else f"{size / 1024:.1f} Ko"
+
+
+def _print_memory_report(document, limit=10):
+    """Affiche les pics de mémoire par fichier et par convertisseur, et les sites d'allocation."""
+    memory = document['memory']
+    files = sorted(document['files'], key=lambda record: record.get('peak_bytes', 0), reverse=True)
+    print(f"[MÉMOIRE] Pic par fichier (max {_format_bytes(memory['peak_bytes'])}) :")
+    for record in files[:limit]:
+        print(f"  {_format_bytes(record.get('peak_bytes', 0)):>10}  {record['path']}")
+    print("[MÉMOIRE] Pic par convertisseur :")
+    for name, entry in sorted(memory['converters'].items()):
+        print(f"  {name:<10} {_format_bytes(entry['peak_bytes']):>10}  ({entry['blocks']} bloc(s))")
+    heaviest = memory['top_allocations']
+    if heaviest:
+        print(f"[MÉMOIRE] Sites d'allocation vivants en fin de fichier ({heaviest['path']}) :")
+        for site in heaviest['sites']:
+            print(f"  {_format_bytes(site['bytes']):>10}  {site['count']:>6} alloc.  {site['site']}")
+
+
+def _emit_metrics(metrics, target):
+    """Écrit le document JSON de mesures d'une exécution."""
+    import json
+
+    json.dump(metrics.to_dict(CONVERTER_VERSION), target, indent=2, ensure_ascii=False)
+    target.write('\n')
 
 
 if __name__ == '__main__':
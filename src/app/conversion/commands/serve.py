@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serveur de conversion résident (JSON-RPC sur stdio)
+
+Usage:
+    vscodiumbench serve [--no-cache] [--cache-dir DIR]
+
+Voir app.conversion.server pour le protocole et les méthodes.
+"""
+
+import sys
+
+
+def main():
+    """Point d'entrée de la commande serve."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='serve',
+        description='Serveur de conversion md2mmd résident : JSON-RPC 2.0 sur stdio, '
+                    'messages encadrés par Content-Length (comme LSP).',
+    )
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Cache mémoire seul, sans cache disque des blocs')
+    parser.add_argument('--cache-dir', help='Répertoire du cache de blocs (défaut : ~/.cache/vscodiumbench/md2mmd)')
+    parser.add_argument('--cache-entries', type=int, default=4096,
+                        help='Blocs conservés dans le cache mémoire (défaut : %(default)s)')
+    args = parser.parse_args()
+
+    from ..cache import BlockCache, MemoryBlockCache
+    from ..server import serve_stdio
+    from ..core import CONVERTER_VERSION
+
+    backend = None if args.no_cache else BlockCache(args.cache_dir, CONVERTER_VERSION)
+    cache = MemoryBlockCache(args.cache_entries, backend=backend)
+    try:
+        return serve_stdio(cache)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if backend is not None:
+            backend.prune()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
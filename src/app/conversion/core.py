@@ -0,0 +1,1383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cœur de la conversion PlantUML et Graphviz/DOT vers Mermaid
+
+Extraction des blocs, convertisseurs, assemblage, conversion d'un document
+(texte, octets, flux), d'un fichier et d'un lot. Sans analyse d'arguments ni
+affichage imposé : la commande md2mmd (app.conversion.commands.md2mmd) et
+les processus résidents (watch, server, httpd, revision, archive) s'appuient
+sur ce module.
+"""
+
+# Démarrage à froid : seuls les modules nécessaires à toute conversion sont
+# importés ici ; cache, dot, json, dataclasses... le sont à la première
+# utilisation, et les expressions régulières sont compilées à la demande.
+import os
+import re
+import time
+from functools import partial
+from pathlib import Path
+
+from .lazy import LazyPattern
+from .metrics import NULL_FILE_METRICS, Metrics
+
+# Version des convertisseurs : à incrémenter dès que la sortie Mermaid change,
+# elle invalide les entrées du cache de blocs.
+CONVERTER_VERSION = '4'
+
+# ---------------------------------------------------------------------------
+# Extraction des blocs de code
+# ---------------------------------------------------------------------------
+
+# Ligne candidate de clôture (CommonMark) : 0 à 3 espaces d'indentation puis
+# au moins trois ` ou ~. Le motif est ancré en début de ligne et ne déborde
+# jamais sur la ligne suivante : un seul passage linéaire sur le document.
+FENCE_LINE_RE = LazyPattern(r'^( {0,3})(`{3,}|~{3,})([^\n]*)$', re.MULTILINE)
+
+SUPPORTED_TYPES = {'plantuml', 'dot', 'graphviz'}
+
+# Préfiltre sur octets : après chaque ``` ou ~~~ (trouvé par bytes.find), la
+# suite de la clôture et le début de l'info string, quelle que soit la casse.
+# Tout bloc convertible y répond ; l'inverse n'est pas vrai (faux positifs admis).
+_DIAGRAM_INFO_BYTES_RE = LazyPattern(rb'[`~]*[ \t]*(?:plantuml|dot|graphviz)', re.IGNORECASE)
+
+
+def scan_fences(content):
+    """
+    Parcourt les blocs de code délimités (fenced code blocks) d'un document.
+
+    Scanner en une passe, compatible CommonMark :
+    - clôtures en ``` ou ~~~, de longueur 3 ou plus ;
+    - indentation de 0 à 3 espaces, retirée du contenu du bloc ;
+    - la clôture fermante utilise le même caractère, au moins aussi long,
+      suivi uniquement d'espaces ;
+    - l'info string d'une clôture ``` ne peut pas contenir de ` ;
+    - un bloc non fermé s'étend jusqu'à la fin du document et n'est pas produit.
+
+    La complexité est O(n) quel que soit le déséquilibre des clôtures.
+
+    Args:
+        content: Contenu texte du document Markdown
+
+    Yields:
+        Dicts : {'lang': str, 'content': str, 'start': int, 'end': int, 'indent': int}
+        où start est le début de la ligne ouvrante et end la fin de la ligne
+        fermante (hors saut de ligne).
+    """
+    opening = None
+    for match in FENCE_LINE_RE.finditer(content):
+        indent, fence, rest = match.groups()
+
+        if opening is None:
+            if fence[0] == '`' and '`' in rest:
+                continue
+            opening = (match, len(indent), fence[0], len(fence), rest.strip())
+            continue
+
+        open_match, open_indent, char, length, info = opening
+        if fence[0] != char or len(fence) < length or rest.strip():
+            continue
+
+        body_start = open_match.end() + 1
+        body = content[body_start:match.start()] if body_start <= match.start() else ''
+        if open_indent:
+            body = _dedent_fence_body(body, open_indent)
+
+        yield {
+            'lang': info.split(None, 1)[0].lower() if info else '',
+            'content': body,
+            'start': open_match.start(),
+            'end': match.end() - (1 if content[match.end() - 1:match.end()] == '\r' else 0),
+            'indent': open_indent,
+        }
+        opening = None
+
+
+def has_diagram_fence(data):
+    """
+    Préfiltre conservateur sur les octets bruts d'un document (bytes, mmap).
+
+    Returns:
+        False si le document ne peut contenir aucun bloc PlantUML/DOT, sans
+        décodage UTF-8 ni analyse des clôtures ; True s'il faut le convertir
+    """
+    # Les clôtures sont rares : les chercher par bytes.find (memchr) puis
+    # examiner leur info string coûte bien moins qu'une recherche par motif
+    for marker in (b'```', b'~~~'):
+        position = data.find(marker)
+        while position != -1:
+            if _DIAGRAM_INFO_BYTES_RE.match(data, position + 3):
+                return True
+            position = data.find(marker, position + 3)
+    return False
+
+
+def _can_copy_verbatim(path):
+    """
+    Vrai si le fichier n'a rien à convertir et peut être recopié octet pour
+    octet : aucune clôture de diagramme, et aucun \r (la lecture en mode
+    texte normaliserait ses fins de ligne). Le fichier est projeté en
+    mémoire (mmap) : rien n'est chargé ni décodé.
+
+    Toujours faux si os.linesep n'est pas '\n' (Windows) : l'écriture en
+    mode texte y traduit les fins de ligne, la copie brute ne le ferait pas.
+    """
+    if os.linesep != '\n':
+        return False
+    import mmap
+
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return True  # fichier vide
+        except OSError:
+            return False  # projection impossible : chemin normal
+        with data:
+            return not has_diagram_fence(data) and data.find(b'\r') == -1
+
+
+def _dedent_fence_body(body, indent):
+    """Retire jusqu'à `indent` espaces en tête de chaque ligne (règle CommonMark)."""
+    lines = body.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        stripped = line.lstrip(' ')
+        removed = len(line) - len(stripped)
+        if removed:
+            lines[i] = line[min(removed, indent):]
+    return ''.join(lines)
+
+
+def extract_code_blocks(content):
+    """
+    Extrait les blocs de code PlantUML et Graphviz/DOT depuis un contenu Markdown.
+
+    Args:
+        content: Contenu texte du fichier Markdown
+
+    Returns:
+        Liste de dicts : [{'type': str, 'content': str, 'start': int, 'end': int,
+                           'indent': int}, ...]
+    """
+    blocks = []
+    for fence in scan_fences(content):
+        if fence['lang'] in SUPPORTED_TYPES:
+            blocks.append({
+                'type': fence['lang'],
+                'content': fence['content'],
+                'start': fence['start'],
+                'end': fence['end'],
+                'indent': fence['indent'],
+            })
+    return blocks
+
+
+# ---------------------------------------------------------------------------
+# Utilitaires
+# ---------------------------------------------------------------------------
+
+def sanitize_node_id(label):
+    """
+    Convertit un label DOT quelconque en identifiant Mermaid valide.
+
+    Règles appliquées :
+    - Suppression des accents
+    - Espaces et caractères spéciaux → underscore
+    - Début par une lettre (sinon préfixe N_)
+    - Underscores consécutifs réduits à un seul
+
+    Args:
+        label: Nom de nœud original (peut contenir espaces, accents, etc.)
+
+    Returns:
+        Identifiant valide pour Mermaid
+    """
+    import unicodedata
+
+    # Supprimer les accents
+    nfkd = unicodedata.normalize('NFKD', label)
+    without_accents = ''.join(c for c in nfkd if not unicodedata.combining(c))
+
+    # Remplacer les caractères non alphanumériques par des underscores
+    sanitized = re.sub(r'[^a-zA-Z0-9]', '_', without_accents)
+
+    # Réduire les underscores consécutifs
+    sanitized = re.sub(r'_+', '_', sanitized).strip('_')
+
+    # Assurer que l'identifiant commence par une lettre
+    if not sanitized or not sanitized[0].isalpha():
+        sanitized = 'N_' + sanitized
+
+    return sanitized or 'node'
+
+
+# Identifiants déjà valides pour Mermaid : sanitize_node_id les laisserait intacts
+_SIMPLE_NODE_ID_RE = LazyPattern(r'[A-Za-z][A-Za-z0-9]*(?:_[A-Za-z0-9]+)*\Z')
+_NON_ALNUM_RE = LazyPattern(r'[^a-zA-Z0-9]')
+_UNDERSCORES_RE = LazyPattern(r'_+')
+
+# Mots qui cassent l'analyse d'un flowchart Mermaid s'ils servent d'identifiant
+MERMAID_RESERVED_IDS = frozenset({'end'})
+
+
+class NodeIdAllocator:
+    """
+    Attribue les identifiants Mermaid des nœuds d'un diagramme.
+
+    - table label → id : chaque label n'est normalisé qu'une fois par diagramme ;
+    - chemin rapide ASCII : pas de normalisation Unicode, et aucun re.sub
+      si le label est déjà un identifiant valide ;
+    - collisions : deux labels distincts qui se normalisent pareil ("A B" et
+      "A-B") reçoivent des identifiants distincts, suffixés _2, _3… dans
+      l'ordre d'apparition (résultat déterministe) ;
+    - les mots réservés de Mermaid (end) sont suffixés de la même façon.
+
+    Une instance par diagramme : les identifiants ne sont uniques qu'au sein
+    de l'allocateur qui les a produits.
+    """
+
+    def __init__(self, reserved=MERMAID_RESERVED_IDS):
+        self._ids = {}
+        self._taken = set(reserved)
+
+    def allocate(self, label, key=None):
+        """
+        Retourne l'identifiant Mermaid du label, en l'attribuant au premier appel.
+
+        Args:
+            label: Texte à convertir en identifiant
+            key: Clé de mémoïsation (défaut : le label) ; une clé distincte
+                 donne un identifiant distinct pour un même label
+                 (ex. sous-graphe homonyme d'un nœud)
+        """
+        key = label if key is None else key
+        node_id = self._ids.get(key)
+        if node_id is not None:
+            return node_id
+
+        base = self._sanitize(label)
+        node_id = base
+        suffix = 2
+        while node_id in self._taken:
+            node_id = f'{base}_{suffix}'
+            suffix += 1
+
+        self._taken.add(node_id)
+        self._ids[key] = node_id
+        return node_id
+
+    __call__ = allocate
+
+    @staticmethod
+    def _sanitize(label):
+        if not label.isascii():
+            return sanitize_node_id(label)
+        if _SIMPLE_NODE_ID_RE.match(label):
+            return label
+        sanitized = _UNDERSCORES_RE.sub('_', _NON_ALNUM_RE.sub('_', label)).strip('_')
+        if not sanitized or not sanitized[0].isalpha():
+            sanitized = 'N_' + sanitized
+        return sanitized
+
+    def __len__(self):
+        return len(self._ids)
+
+
+def detect_plantuml_type(content):
+    """
+    Détecte le type de diagramme PlantUML par heuristique sur les mots-clés.
+
+    Returns:
+        'sequence' | 'class' | 'state'
+    """
+    if 'class ' in content and '{' in content:
+        return 'class'
+    if '[*]' in content:
+        return 'state'
+    # Par défaut : séquence (couvre actor, participant, ->)
+    return 'sequence'
+
+
+# ---------------------------------------------------------------------------
+# Convertisseurs PlantUML
+# ---------------------------------------------------------------------------
+
+def convert_plantuml_sequence(content):
+    """
+    Convertit un diagramme de séquence PlantUML vers Mermaid.
+
+    Conversions appliquées :
+    - @startuml / @enduml supprimés
+    - actor X → participant X
+    - participant "Nom" as Alias → participant Alias as Nom
+    - database "Nom" as Alias → participant Alias as Nom (approximatif)
+    - -> → ->>
+    - --> → -->>
+
+    Returns:
+        (mermaid_code: str, warning: str | None)
+    """
+    lines = []
+    warnings = []
+    has_database = False
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+
+        # Ignorer les délimiteurs PlantUML
+        if line in ('@startuml', '@enduml'):
+            continue
+
+        # database → participant (approximatif)
+        if line.startswith('database '):
+            line = line.replace('database ', 'participant ', 1)
+            has_database = True
+
+        # actor → participant
+        if line.startswith('actor '):
+            line = line.replace('actor ', 'participant ', 1)
+
+        # participant "Nom long" as Alias → participant Alias as Nom long
+        alias_match = re.match(r'participant\s+"([^"]+)"\s+as\s+(\w+)(.*)', line)
+        if alias_match:
+            nom, alias, reste = alias_match.groups()
+            line = f'participant {alias} as {nom}{reste}'
+
+        # Conversion des flèches : -> → ->> et --> → -->>
+        # Ordre important : traiter --> avant ->
+        line = re.sub(r'([\w\"\'])\s*-->\s*([\w\"\'])', r'\1 -->> \2', line)
+        line = re.sub(r'([\w\"\'])\s*->\s*([\w\"\'])', r'\1 ->> \2', line)
+
+        if line:
+            lines.append('    ' + line)
+
+    if has_database:
+        warnings.append(
+            '<!-- ATTENTION: type "database" converti en participant (non supporté nativement par Mermaid) -->'
+        )
+
+    mermaid = 'sequenceDiagram\n' + '\n'.join(lines)
+    return mermaid, '\n'.join(warnings) if warnings else None
+
+
+def convert_plantuml_class(content):
+    """
+    Convertit un diagramme de classes PlantUML vers Mermaid.
+
+    Conversions appliquées :
+    - @startuml / @enduml supprimés
+    - Relations : "1" -- "0..*" → "1" --> "0..*"
+    - Trailing > supprimé dans les labels de relation
+
+    Returns:
+        (mermaid_code: str, warning: str | None)
+    """
+    lines = []
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+
+        if line in ('@startuml', '@enduml'):
+            continue
+
+        # Relation avec cardinalité : Membre "1" -- "0..*" Livre : emprunte >
+        # Convertir -- en --> et supprimer le > final
+        line = re.sub(r'"\s*--\s*"', '" --> "', line)
+        # Supprimer le > terminal dans les labels de relation
+        line = re.sub(r'\s*>\s*$', '', line)
+
+        if line:
+            lines.append('    ' + line)
+
+    mermaid = 'classDiagram\n' + '\n'.join(lines)
+    return mermaid, None
+
+
+def convert_plantuml_state(content):
+    """
+    Convertit un diagramme d'états PlantUML vers Mermaid.
+
+    La syntaxe est quasi-identique : seuls @startuml/@enduml sont supprimés.
+
+    Returns:
+        (mermaid_code: str, None)
+    """
+    lines = []
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+
+        if line in ('@startuml', '@enduml'):
+            continue
+
+        if line:
+            lines.append('    ' + line)
+
+    mermaid = 'stateDiagram-v2\n' + '\n'.join(lines)
+    return mermaid, None
+
+
+# ---------------------------------------------------------------------------
+# Convertisseurs Graphviz/DOT
+# ---------------------------------------------------------------------------
+
+_DOT_DIRECTIONS = {'TB': 'TD', 'TD': 'TD', 'LR': 'LR', 'RL': 'RL', 'BT': 'BT'}
+
+
+def _detect_dot_direction(graph_attrs):
+    """Retourne la direction Mermaid depuis l'attribut rankdir DOT."""
+    rankdir = graph_attrs.get('rankdir')
+    if rankdir:
+        return _DOT_DIRECTIONS.get(rankdir.upper(), 'TD')
+    return 'TD'
+
+
+def _mermaid_text(text):
+    """Échappe un libellé pour l'insérer entre guillemets dans Mermaid."""
+    return text.replace('"', '#quot;')
+
+
+def _render_dot_lines(flat, arrow):
+    """
+    Produit les lignes Mermaid d'un graphe DOT mis à plat.
+
+    - déclarations : chaque nœud une seule fois, id["label"], dans l'ordre
+      de première apparition ;
+    - arêtes nues dans l'ordre du document : id --> id, avec le label DOT
+      d'arête éventuel (-->|"label"|) ;
+    - clusters DOT (subgraph cluster_*) → subgraph Mermaid, imbriqués.
+
+    Déclarer le label une fois évite de le répéter à chaque arête : la sortie
+    reste proportionnelle à (nœuds + arêtes) et non à (arêtes × label).
+    """
+    allocate = NodeIdAllocator()
+    ids = {node_id: allocate(node_id) for node_id in flat.nodes}
+
+    lines = []
+    for node_id, attrs in flat.nodes.items():
+        label = attrs.get('label', node_id)
+        lines.append(f'    {ids[node_id]}["{_mermaid_text(label)}"]')
+
+    for source, target, attrs in flat.edges:
+        label = attrs.get('label')
+        link = f'{arrow}|"{_mermaid_text(label)}"|' if label else arrow
+        lines.append(f'    {ids[source]} {link} {ids[target]}')
+
+    def render_cluster(cluster, depth):
+        cluster_id, label, members, nested = cluster
+        pad = '    ' * depth
+        subgraph_id = allocate(cluster_id, key=('subgraph', cluster_id))
+        lines.append(f'{pad}subgraph {subgraph_id}["{_mermaid_text(label)}"]')
+        nested_members = {m for sub in nested for m in sub[2]}
+        for member in members:
+            if member not in nested_members:
+                lines.append(f'{pad}    {ids[member]}')
+        for sub in nested:
+            render_cluster(sub, depth + 1)
+        lines.append(f'{pad}end')
+
+    for cluster in flat.clusters:
+        render_cluster(cluster, 1)
+
+    return lines
+
+
+def _convert_dot_digraph(graph):
+    from .dot import flatten
+
+    flat = flatten(graph)
+    direction = _detect_dot_direction(flat.graph_attrs)
+    lines = _render_dot_lines(flat, '-->')
+    warnings = []
+
+    # Avertissement si styles globaux présents
+    if flat.has_node_defaults:
+        warnings.append(
+            '<!-- ATTENTION: Styles globaux DOT (fillcolor, shape, etc.) '
+            'non traduits — utilisez des classDef Mermaid si nécessaire -->'
+        )
+
+    mermaid = f'flowchart {direction}\n' + '\n'.join(lines)
+    return mermaid, '\n'.join(warnings) if warnings else None
+
+
+def _convert_dot_graph(graph):
+    from .dot import flatten
+
+    flat = flatten(graph)
+    direction = _detect_dot_direction(flat.graph_attrs)
+    lines = _render_dot_lines(flat, '<-->')
+    warnings = [
+        '<!-- ATTENTION: Conversion approximative depuis graphe non-orienté DOT -->',
+        '<!-- Les flèches bidirectionnelles (<-->) représentent les arêtes non-orientées -->',
+    ]
+
+    if 'layout' in flat.graph_attrs:
+        warnings.append(
+            '<!-- ATTENTION: Attribut layout= DOT (neato, circo, etc.) '
+            'non supporté par Mermaid —  disposition automatique appliquée -->'
+        )
+
+    mermaid = f'flowchart {direction}\n' + '\n'.join(lines)
+    return mermaid, '\n'.join(warnings)
+
+
+def convert_dot_digraph(content):
+    """
+    Convertit un graphe orienté DOT (digraph) vers Mermaid flowchart.
+
+    Le texte est analysé par app.conversion.dot (tokenizer + AST) en une passe.
+
+    Conversions appliquées :
+    - digraph Name { } → flowchart TD|LR
+    - "Node A" -> "Node B"; → Node_A["Node A"] et Node_B["Node B"] déclarés
+      une seule fois, puis Node_A --> Node_B
+    - chaînes a -> b -> c, extrémités {a b} et sous-graphes développés
+    - attribut label de nœud et d'arête conservé
+    - subgraph cluster_* → subgraph Mermaid
+    - rankdir → direction Mermaid
+    - Avertissement si styles globaux détectés
+
+    Returns:
+        (mermaid_code: str, warning: str | None)
+    """
+    from .dot import parse_dot
+
+    return _convert_dot_digraph(parse_dot(content))
+
+
+def convert_dot_graph(content):
+    """
+    Convertit un graphe non-orienté DOT (graph) vers Mermaid flowchart.
+
+    Conversion approximative : les arêtes non-orientées sont représentées
+    par des flèches bidirectionnelles (<-->). Même analyse que
+    convert_dot_digraph.
+
+    Returns:
+        (mermaid_code: str, warning: str)
+    """
+    from .dot import parse_dot
+
+    return _convert_dot_graph(parse_dot(content))
+
+
+# ---------------------------------------------------------------------------
+# Routeur de conversion
+# ---------------------------------------------------------------------------
+
+def convert_diagram(diagram_type, content):
+    """
+    Route la conversion vers la fonction spécifique selon le type de diagramme.
+
+    Args:
+        diagram_type: 'plantuml' | 'dot' | 'graphviz'
+        content: Contenu brut du bloc de code
+
+    Returns:
+        (mermaid_code: str | None, warning: str | None)
+    """
+    if diagram_type == 'plantuml':
+        subtype = detect_plantuml_type(content)
+        if subtype == 'class':
+            return convert_plantuml_class(content)
+        elif subtype == 'state':
+            return convert_plantuml_state(content)
+        else:
+            return convert_plantuml_sequence(content)
+
+    elif diagram_type in ('dot', 'graphviz'):
+        from .dot import parse_dot
+
+        graph = parse_dot(content)
+        if graph.directed is False:
+            return _convert_dot_graph(graph)
+        # digraph, ou fallback si l'en-tête est absent
+        return _convert_dot_digraph(graph)
+
+    return None, f'<!-- Type de diagramme non supporté: {diagram_type} -->'
+
+
+def convert_block(diagram_type, content, cache=None):
+    """
+    Convertit un bloc en consultant le cache de blocs s'il est fourni.
+
+    Args:
+        diagram_type: 'plantuml' | 'dot' | 'graphviz'
+        content: Contenu brut du bloc de code
+        cache: BlockCache optionnel
+
+    Returns:
+        (mermaid_code: str | None, warning: str | None, cached: bool)
+    """
+    if cache is not None:
+        hit = cache.get(diagram_type, content)
+        if hit is not None:
+            return hit[0], hit[1], True
+
+    mermaid_code, warning = convert_diagram(diagram_type, content)
+    if cache is not None and mermaid_code is not None:
+        cache.put(diagram_type, content, mermaid_code, warning)
+    return mermaid_code, warning, False
+
+
+def diagram_subtype(diagram_type, content):
+    """
+    Sous-type d'un bloc (mesures, résultats de convert_text).
+
+    Returns:
+        detect_plantuml_type() pour PlantUML, 'digraph' | 'graph' pour DOT, None sinon
+    """
+    if diagram_type == 'plantuml':
+        return detect_plantuml_type(content)
+    if diagram_type in ('dot', 'graphviz'):
+        from .dot import header_directed
+
+        # Même décision que convert_diagram : digraph sans en-tête
+        return 'graph' if header_directed(content) is False else 'digraph'
+    return None
+
+
+def _convert_measured(diagram_type, content, cache, file_metrics, start, subtype=None):
+    """convert_block, chronométré et enregistré si des mesures sont demandées."""
+    if file_metrics is NULL_FILE_METRICS:
+        return convert_block(diagram_type, content, cache)
+
+    started = file_metrics.block_started()
+    mermaid_code, warning, cached = convert_block(diagram_type, content, cache)
+    file_metrics.block(
+        diagram_type,
+        subtype or diagram_subtype(diagram_type, content),
+        start,
+        len(content.encode('utf-8')),
+        len(mermaid_code.encode('utf-8')) if mermaid_code else 0,
+        started,
+        cached,
+        warning is not None,
+    )
+    return mermaid_code, warning, cached
+
+
+# ---------------------------------------------------------------------------
+# Orchestrateur principal
+# ---------------------------------------------------------------------------
+
+def render_replacement(block, mermaid_code, warning):
+    """
+    Construit le texte Markdown qui remplace un bloc converti.
+
+    L'avertissement éventuel précède le bloc mermaid ; un bloc indenté
+    (liste, citation alignée) conserve son indentation d'origine.
+    """
+    replacement = f'```mermaid\n{mermaid_code}\n```'
+    if warning:
+        replacement = warning + '\n' + replacement
+    indent = block.get('indent', 0)
+    if indent:
+        pad = ' ' * indent
+        replacement = '\n'.join(pad + line if line else line for line in replacement.split('\n'))
+    return replacement
+
+
+def assemble_segments(content, replacements):
+    """
+    Produit les segments du document de sortie, dans l'ordre.
+
+    Chaque portion inchangée du document est produite une seule fois, entre
+    les remplacements : l'assemblage coûte O(taille + nombre de blocs), que
+    le résultat soit joint en mémoire ou écrit au fil de l'eau.
+
+    Args:
+        content: Document source
+        replacements: Itérable de (start, end, texte), triés par start et
+                      sans chevauchement
+
+    Yields:
+        Segments de texte à concaténer
+    """
+    position = 0
+    for start, end, text in replacements:
+        if start > position:
+            yield content[position:start]
+        yield text
+        position = end
+    if position < len(content):
+        yield content[position:]
+
+
+def convert_stream(lines, write, cache=None, echo=None, file_metrics=NULL_FILE_METRICS, digests=None):
+    """
+    Convertit un document Markdown au fil de l'eau, ligne par ligne.
+
+    Les clôtures sont détectées incrémentalement avec les mêmes règles que
+    scan_fences. Le texte hors diagramme est recopié immédiatement ; seul le
+    bloc PlantUML/DOT en cours est conservé en mémoire, converti dès sa
+    clôture puis écrit. La mémoire est donc bornée par le plus gros bloc et
+    non par la taille du document. La sortie est identique à celle de
+    l'assemblage en mémoire.
+
+    Args:
+        lines: Itérable de lignes (fins de ligne incluses), ex. un fichier texte
+        write: Fonction d'écriture de la sortie (ex. fichier.write)
+        cache: BlockCache optionnel
+        echo: Fonction d'affichage des messages (aucun affichage par défaut)
+        file_metrics: FileMetrics optionnel (mesures par bloc)
+        digests: Liste optionnelle recevant l'empreinte de chaque bloc
+                 (manifeste, voir app.conversion.manifest)
+
+    Returns:
+        Dict : {'blocks': int, 'converted': int, 'cached': int, 'warnings': int}
+    """
+    counts = {'blocks': 0, 'converted': 0, 'cached': 0, 'warnings': 0}
+    opening = None   # (indent, char, longueur, lang)
+    buffered = []    # ligne ouvrante + corps du bloc supporté en cours
+    offset = 0       # position du début de la ligne courante
+    block_start = 0
+
+    for line in lines:
+        line_start = offset
+        offset += len(line)
+        body = line.rstrip('\n')
+        match = FENCE_LINE_RE.match(body) if body.lstrip(' ')[:3] in ('```', '~~~') else None
+
+        if opening is None:
+            if match is None:
+                write(line)
+                continue
+            indent, fence, rest = match.groups()
+            if fence[0] == '`' and '`' in rest:
+                write(line)
+                continue
+            info = rest.strip()
+            lang = info.split(None, 1)[0].lower() if info else ''
+            opening = (len(indent), fence[0], len(fence), lang)
+            if lang in SUPPORTED_TYPES:
+                block_start = line_start
+                buffered.append(line)
+            else:
+                write(line)
+            continue
+
+        indent, char, length, lang = opening
+        closes = (
+            match is not None
+            and match.group(2)[0] == char
+            and len(match.group(2)) >= length
+            and not match.group(3).strip()
+        )
+
+        if lang not in SUPPORTED_TYPES:
+            write(line)
+            if closes:
+                opening = None
+            continue
+
+        if not closes:
+            buffered.append(line)
+            continue
+
+        # Bloc supporté fermé : convertir et écrire le remplacement
+        block_content = ''.join(buffered[1:])
+        if indent:
+            block_content = _dedent_fence_body(block_content, indent)
+        block = {'type': lang, 'content': block_content, 'indent': indent}
+        if digests is not None:
+            from .manifest import block_digest
+
+            digests.append(block_digest(lang, block_content))
+        counts['blocks'] += 1
+        opening = None
+
+        mermaid_code, warning, cached = _convert_measured(lang, block_content, cache, file_metrics, block_start)
+        if mermaid_code is None:
+            write(''.join(buffered))
+            write(line)
+        else:
+            eol = line[len(body.rstrip('\r')):]
+            write(render_replacement(block, mermaid_code, warning) + eol)
+            counts['converted'] += 1
+            counts['cached'] += cached
+            counts['warnings'] += bool(warning)
+            if echo:
+                echo(f"[OK] Converti : {lang} → mermaid")
+        buffered = []
+
+    # Bloc non fermé en fin de document : recopié tel quel
+    if buffered:
+        write(''.join(buffered))
+
+    return counts
+
+
+# Nombre minimal de blocs à convertir pour répartir un document sur un pool :
+# en deçà, le démarrage des workers coûte plus que la conversion elle-même
+BLOCK_PARALLEL_MIN = 32
+
+
+def _block_worker(key):
+    """Convertit un bloc (type, contenu) dans un worker ; retourne aussi la durée."""
+    started = time.perf_counter()
+    mermaid_code, warning = convert_diagram(*key)
+    return mermaid_code, warning, time.perf_counter() - started
+
+
+def _convert_blocks_parallel(blocks, cache, jobs, file_metrics, subtypes):
+    """
+    Convertit les blocs d'un document sur un pool (processus, ou threads sans GIL).
+
+    Le cache est consulté et alimenté dans le processus appelant ; seuls les
+    blocs absents du cache partent aux workers, une seule fois par contenu
+    distinct. Les résultats sont rangés dans l'ordre du document, avec les
+    mêmes valeurs (et le même marquage « depuis le cache » pour les doublons)
+    que la conversion séquentielle.
+
+    Returns:
+        Liste de (mermaid_code, avertissement, cached), un élément par bloc
+    """
+    from .executor import pool_executor
+
+    results = [None] * len(blocks)
+    durations = [0.0] * len(blocks)
+    pending = {}  # (type, contenu) -> indices des blocs identiques
+    for index, block in enumerate(blocks):
+        key = (block['type'], block['content'])
+        if key in pending:
+            pending[key].append(index)
+            continue
+        hit = cache.get(*key) if cache is not None else None
+        if hit is not None:
+            results[index] = (hit[0], hit[1], True)
+        else:
+            pending[key] = [index]
+
+    if pending:
+        keys = list(pending)
+        workers = min(jobs, len(keys))
+        chunksize = max(1, len(keys) // (workers * 4))
+        with pool_executor(workers) as executor:
+            for key, (mermaid_code, warning, seconds) in zip(
+                keys, executor.map(_block_worker, keys, chunksize=chunksize)
+            ):
+                if cache is not None and mermaid_code is not None:
+                    cache.put(*key, mermaid_code, warning)
+                first, *duplicates = pending[key]
+                results[first] = (mermaid_code, warning, False)
+                durations[first] = seconds
+                # Un doublon est servi par le cache en conversion séquentielle
+                reused = cache is not None and mermaid_code is not None
+                for index in duplicates:
+                    results[index] = (mermaid_code, warning, reused)
+
+    if file_metrics is not NULL_FILE_METRICS:
+        for block, subtype, (mermaid_code, warning, cached), seconds in zip(blocks, subtypes, results, durations):
+            file_metrics.block(
+                block['type'],
+                subtype or diagram_subtype(block['type'], block['content']),
+                block['start'],
+                len(block['content'].encode('utf-8')),
+                len(mermaid_code.encode('utf-8')) if mermaid_code else 0,
+                time.perf_counter() - seconds,
+                cached,
+                warning is not None,
+            )
+    return results
+
+
+def _convert_content(content, cache=None, file_metrics=NULL_FILE_METRICS, echo=None, records=None,
+                     block_jobs=None, digests=None):
+    """
+    Cœur de convert_text et de convert_file : conversion d'un document en mémoire.
+
+    Args:
+        records: Liste optionnelle recevant, par bloc, le tuple
+                 (type, sous-type, start, end, converti, cache, avertissement)
+        block_jobs: Processus de conversion des blocs (défaut : séquentiel) ;
+                    la sortie est identique octet pour octet
+        digests: Liste optionnelle recevant l'empreinte de chaque bloc
+
+    Returns:
+        (texte converti, {'blocks': int, 'converted': int, 'cached': int, 'warnings': int})
+    """
+    counts = {'blocks': 0, 'converted': 0, 'cached': 0, 'warnings': 0}
+    with file_metrics.stage('extract'):
+        blocks = extract_code_blocks(content)
+    if not blocks:
+        return content, counts
+    counts['blocks'] = len(blocks)
+    if echo:
+        echo(f"[INFO] {len(blocks)} diagramme(s) détecté(s)")
+    if digests is not None:
+        from .manifest import block_digest
+
+        digests.extend(block_digest(block['type'], block['content']) for block in blocks)
+
+    # Collecter les remplacements dans l'ordre du document, puis assembler
+    # la sortie en une seule passe (pas de recopie du document par bloc)
+    replacements = []
+    if records is not None:
+        subtypes = [diagram_subtype(block['type'], block['content']) for block in blocks]
+    else:
+        subtypes = [None] * len(blocks)
+    with file_metrics.stage('convert'):
+        # Les pics mémoire par bloc ne se mesurent que dans ce processus
+        if block_jobs and block_jobs > 1 and len(blocks) >= BLOCK_PARALLEL_MIN and not file_metrics.memory:
+            results = _convert_blocks_parallel(blocks, cache, block_jobs, file_metrics, subtypes)
+        else:
+            results = (
+                _convert_measured(block['type'], block['content'], cache, file_metrics, block['start'], subtype)
+                for block, subtype in zip(blocks, subtypes)
+            )
+        for block, subtype, (mermaid_code, warning, cached) in zip(blocks, subtypes, results):
+            if records is not None:
+                records.append((block['type'], subtype, block['start'], block['end'],
+                                mermaid_code is not None, cached, warning))
+            if mermaid_code is None:
+                continue
+            counts['cached'] += cached
+            counts['warnings'] += warning is not None
+
+            replacements.append((block['start'], block['end'], render_replacement(block, mermaid_code, warning)))
+            if echo:
+                echo(f"[OK] Converti : {block['type']} → mermaid")
+
+    counts['converted'] = len(replacements)
+    if not replacements:
+        return content, counts
+    with file_metrics.stage('assemble'):
+        return ''.join(assemble_segments(content, replacements)), counts
+
+
+def convert_text(markdown, cache=None, metrics=None):
+    """
+    Convertit un document Markdown en mémoire : ni fichier, ni affichage.
+
+    Args:
+        markdown: Contenu Markdown
+        cache: Cache de blocs optionnel (BlockCache, MemoryBlockCache)
+        metrics: Collecteur Metrics optionnel (enregistré sous le chemin '<text>')
+
+    Returns:
+        ConversionResult
+    """
+    from .results import BlockResult, ConversionResult
+
+    file_metrics = metrics.begin_file('<text>') if metrics is not None else NULL_FILE_METRICS
+    records = []
+    text, counts = _convert_content(markdown, cache, file_metrics, records=records)
+    if file_metrics is not NULL_FILE_METRICS:
+        file_metrics.finish(True, len(markdown.encode('utf-8')), len(text.encode('utf-8')))
+    return ConversionResult(
+        text,
+        [BlockResult(*record) for record in records],
+        counts['converted'],
+        counts['cached'],
+        counts['warnings'],
+    )
+
+
+def _decode_text(data):
+    """Décode des octets comme une lecture en mode texte : UTF-8, fins de ligne en \\n."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def convert_bytes(data, cache=None):
+    """
+    Convertit un document lu en octets (objet git, entrée d'archive), sans fichier.
+
+    Le résultat est celui qu'écrirait convert_file : fins de ligne normalisées
+    comme par une lecture en mode texte, puis écrites en os.linesep ; un
+    document sans clôture de diagramme ni \r est rendu tel quel, sans
+    décodage, là où os.linesep est '\n'.
+
+    Returns:
+        (octets convertis, {'blocks': int, 'converted': int, 'cached': int,
+                            'warnings': int, 'skipped': bool})
+
+    Raises:
+        UnicodeDecodeError: Document non UTF-8
+    """
+    if os.linesep == '\n' and not has_diagram_fence(data) and data.find(b'\r') == -1:
+        return data, {'blocks': 0, 'converted': 0, 'cached': 0, 'warnings': 0, 'skipped': True}
+    text = _decode_text(data)
+    converted, counts = _convert_content(text, cache)
+    from .output import encode_text
+
+    counts['skipped'] = False
+    return encode_text(converted), counts
+
+
+def convert_path(input_path, output_path=None, echo=print, cache=None, stream=False, metrics=None,
+                 block_jobs=None, link=None, manifest=False):
+    """
+    Cœur de convert_file : convertit un fichier et retourne ses statistiques.
+
+    Args:
+        input_path: Chemin vers le fichier .md source (str ou Path)
+        output_path: Fichier de sortie (défaut : <input>.mmd.md)
+        echo: Fonction d'affichage des messages (print par défaut)
+        cache: BlockCache optionnel (blocs inchangés non reconvertis)
+        stream: Conversion au fil de l'eau (mémoire bornée par le plus gros bloc)
+        metrics: Collecteur Metrics optionnel (durées par étape et par bloc)
+        block_jobs: Processus de conversion des blocs du fichier (hors stream)
+        link: Fichier sans diagramme : None (copie), 'hardlink' ou 'reflink'
+        manifest: Ajoute aux statistiques l'entrée de manifeste de la sortie
+                  (clé 'manifest', voir app.conversion.manifest)
+
+    Returns:
+        Dict : {'path': str, 'ok': bool, 'blocks': int, 'converted': int,
+                'cached': int, 'warnings': int, 'skipped': bool,
+                'unchanged': bool, 'error': str | None}
+                ('skipped' : recopié sans décodage, écarté par le préfiltre ;
+                'unchanged' : sortie déjà identique, non réécrite)
+    """
+    stats = {
+        'path': str(input_path),
+        'ok': False,
+        'blocks': 0,
+        'converted': 0,
+        'cached': 0,
+        'warnings': 0,
+        'skipped': False,
+        'unchanged': False,
+        'error': None,
+    }
+
+    file_metrics = metrics.begin_file(input_path) if metrics is not None else NULL_FILE_METRICS
+    digests = [] if manifest else None
+
+    def fail(message):
+        echo(message)
+        stats['error'] = message
+        return stats
+
+    def done(output_path, changed, message, source_sha256=None):
+        # Sortie identique à l'existant : ni réécrite, ni datée à nouveau
+        stats['unchanged'] = not changed
+        echo(message if changed else f"[OK] Déjà à jour (non réécrit) : {output_path}")
+        stats['ok'] = True
+        if digests is not None:
+            from .manifest import file_digest, manifest_entry
+
+            output_sha256 = None
+            if source_sha256 is None:
+                # Recopie telle quelle : la sortie porte les octets sources copiés
+                source_sha256 = output_sha256 = file_digest(output_path)
+            stats['manifest'] = manifest_entry(path, output_path, digests, source_sha256, output_sha256)
+        if file_metrics is not NULL_FILE_METRICS:
+            file_metrics.finish(True, path.stat().st_size, output_path.stat().st_size)
+        return stats
+
+    try:
+        path = Path(input_path)
+
+        if not path.exists():
+            return fail(f"[ERREUR] Fichier introuvable : {path}")
+
+        if not path.is_file():
+            return fail(f"[ERREUR] Chemin invalide (pas un fichier) : {path}")
+
+        if path.suffix.lower() != '.md':
+            return fail(f"[ERREUR] Extension invalide (attendu .md) : {path.suffix}")
+
+        echo(f"[INFO] Lecture : {path}")
+        output_path = Path(output_path) if output_path else path.parent / (path.stem + '.mmd.md')
+        from .output import AtomicOutput, copy_if_changed, write_text_if_changed
+
+        # Préfiltre : un fichier sans clôture de diagramme est recopié tel quel,
+        # sans décodage ni recherche des blocs
+        with file_metrics.stage('stream' if stream else 'read'):
+            verbatim = _can_copy_verbatim(path)
+        if verbatim:
+            echo("[INFO] Aucune clôture PlantUML/DOT — fichier copié sans décodage")
+            with file_metrics.stage('write'):
+                changed = copy_if_changed(path, output_path, link)
+            stats['skipped'] = True
+            return done(output_path, changed, f"[OK] Créé : {output_path}")
+
+        if stream:
+            output = AtomicOutput(output_path)
+            if digests is not None:
+                from .manifest import open_hashed
+
+                # Empreinte des octets au fil de la lecture, sans relire la source
+                source, source_hash = open_hashed(path)
+            else:
+                source, source_hash = open(path, encoding='utf-8'), None
+            with file_metrics.stage('stream'), source, output as target:
+                counts = convert_stream(source, target.write, cache, echo, file_metrics, digests)
+            echo(f"[OK] {counts['converted']}/{counts['blocks']} diagramme(s) converti(s) en flux")
+            stats.update(counts)
+            return done(output_path, output.changed, f"[OK] Fichier créé : {output_path}",
+                        source_hash.hexdigest() if source_hash is not None else None)
+
+        with file_metrics.stage('read'):
+            data = path.read_bytes()
+            content = _decode_text(data)
+        source_sha256 = None
+        if digests is not None:
+            import hashlib
+
+            source_sha256 = hashlib.sha256(data).hexdigest()
+
+        converted_content, counts = _convert_content(content, cache, file_metrics, echo, block_jobs=block_jobs,
+                                                     digests=digests)
+
+        if not counts['blocks']:
+            echo("[INFO] Aucun diagramme PlantUML/DOT trouvé — fichier copié tel quel")
+            with file_metrics.stage('write'):
+                changed = write_text_if_changed(output_path, content)
+            return done(output_path, changed, f"[OK] Créé : {output_path}", source_sha256)
+
+        with file_metrics.stage('write'):
+            changed = write_text_if_changed(output_path, converted_content)
+
+        if counts['cached']:
+            echo(f"[OK] {counts['converted']} diagramme(s) converti(s), dont {counts['cached']} depuis le cache")
+        else:
+            echo(f"[OK] {counts['converted']} diagramme(s) converti(s)")
+        if counts['warnings']:
+            echo(f"[ATTENTION] {counts['warnings']} conversion(s) approximative(s) — vérifiez les commentaires dans le fichier")
+        stats.update(counts)
+        return done(output_path, changed, f"[OK] Fichier créé : {output_path}", source_sha256)
+
+    except PermissionError:
+        return fail(f"[ERREUR] Permission refusée lors de l'écriture du fichier de sortie")
+    except UnicodeDecodeError as e:
+        return fail(f"[ERREUR] Problème d'encodage lors de la lecture : {e}")
+    except Exception as e:
+        fail(f"[ERREUR] Erreur inattendue : {e}")
+        if echo is print:
+            import traceback
+            traceback.print_exc()
+        return stats
+
+
+def convert_file(input_path, output_path=None, cache=None, stream=False, metrics=None, block_jobs=None,
+                 link=None, manifest=False):
+    """
+    Convertit un fichier Markdown en remplaçant les diagrammes PlantUML/DOT par Mermaid.
+
+    Le fichier de sortie est créé dans le même répertoire avec l'extension .mmd.md.
+
+    Args:
+        input_path: Chemin vers le fichier .md source (str ou Path)
+        output_path: Fichier de sortie (défaut : <input>.mmd.md)
+        cache: BlockCache optionnel
+        stream: Conversion au fil de l'eau, pour les très gros documents
+        metrics: Collecteur Metrics optionnel ; reçoit les durées par étape
+                 et par bloc (voir app.conversion.metrics)
+        block_jobs: Processus de conversion des blocs d'un même document
+                    (défaut : séquentiel ; sans effet avec stream)
+        link: Sortie d'un fichier sans diagramme : None (copie), 'hardlink'
+              (lien physique) ou 'reflink' (clone copy-on-write)
+        manifest: Enregistre la sortie dans le manifeste de son répertoire
+                  (.md2mmd-manifest.json, utilisé par md2mmd --check)
+
+    Une sortie identique au fichier existant n'est pas réécrite ; sinon elle
+    est remplacée atomiquement (voir app.conversion.output).
+
+    Returns:
+        True si la conversion réussit, False sinon
+    """
+    stats = convert_path(input_path, output_path, cache=cache, stream=stream, metrics=metrics,
+                         block_jobs=block_jobs, link=link, manifest=manifest)
+    if manifest and stats['ok']:
+        from .manifest import update_manifests
+
+        update_manifests([stats['manifest']], CONVERTER_VERSION)
+    return stats['ok']
+
+
+# ---------------------------------------------------------------------------
+# Traitement par lot (répertoires, motifs glob)
+# ---------------------------------------------------------------------------
+
+GLOB_CHARS = set('*?[')
+
+
+def is_source_markdown(path):
+    """Vrai pour un .md source (les sorties .mmd.md sont exclues)."""
+    name = path.name.lower()
+    return name.endswith('.md') and not name.endswith('.mmd.md')
+
+
+def output_name(name):
+    """Nom de la sortie (.mmd.md) d'un chemin d'archive ou de dépôt (séparateur '/')."""
+    directory, _, base = name.rpartition('/')
+    stem = base[:-3] if base.lower().endswith('.md') else base
+    return f'{directory}/{stem}.mmd.md' if directory else f'{stem}.mmd.md'
+
+
+def collect_markdown_files(inputs):
+    """
+    Développe une liste de chemins, répertoires et motifs glob en fichiers .md.
+
+    Les répertoires sont parcourus récursivement ; les fichiers de sortie
+    .mmd.md sont ignorés. L'ordre est stable et sans doublons.
+
+    Args:
+        inputs: Itérable de chemins (str ou Path) ou de motifs glob
+
+    Returns:
+        Liste de Path
+    """
+    import glob
+
+    files = []
+    seen = set()
+
+    def add(path):
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            files.append(path)
+
+    for item in inputs:
+        item = str(item)
+        if GLOB_CHARS.intersection(item):
+            candidates = [Path(p) for p in sorted(glob.glob(item, recursive=True))]
+        else:
+            candidates = [Path(item)]
+
+        for candidate in candidates:
+            if candidate.is_dir():
+                for path in sorted(candidate.rglob('*')):
+                    if path.is_file() and is_source_markdown(path):
+                        add(path)
+            elif candidate.is_file() and is_source_markdown(candidate):
+                add(candidate)
+
+    return files
+
+
+def silent(*_args, **_kwargs):
+    """Sortie muette pour les workers du lot."""
+
+
+_worker_metrics = None
+
+
+def _batch_worker(path, cache=None, stream=False, measure=False, memory=False, link=None, manifest=False):
+    """Convertit un fichier dans un processus worker (sans affichage)."""
+    global _worker_metrics
+    metrics = None
+    if measure:
+        # Collecteur propre au processus : le pic mémoire le plus élevé du
+        # worker est retenu d'un fichier à l'autre
+        if _worker_metrics is None or _worker_metrics.memory != memory:
+            _worker_metrics = Metrics(memory=memory)
+        metrics = _worker_metrics
+    stats = convert_path(path, echo=silent, cache=cache, stream=stream, metrics=metrics, link=link,
+                         manifest=manifest)
+    if metrics is not None:
+        stats['metrics'] = metrics.worker_record()
+    return stats
+
+
+def _thread_worker(path, cache=None, stream=False, measure=False, link=None, manifest=False):
+    """Convertit un fichier dans un thread du pool ; collecteur propre au fichier."""
+    metrics = Metrics() if measure else None
+    stats = convert_path(path, echo=silent, cache=cache, stream=stream, metrics=metrics, link=link,
+                         manifest=manifest)
+    if metrics is not None:
+        stats['metrics'] = metrics.worker_record()
+    return stats
+
+
+def convert_batch(inputs, jobs=None, cache=None, stream=False, metrics=None, block_jobs=None,
+                  executor='auto', link=None, manifest=False):
+    """
+    Convertit un ensemble de fichiers Markdown en parallèle.
+
+    Chaque fichier produit le même <fichier>.mmd.md que convert_file ; les
+    fichiers sont répartis sur un pool dimensionné sur le nombre de cœurs :
+    threads si le GIL est désactivé (Python free-threaded), processus sinon.
+
+    Args:
+        inputs: Chemins, répertoires ou motifs glob
+        jobs: Nombre de processus (défaut : os.cpu_count())
+        cache: BlockCache optionnel, partagé par les workers via le disque
+        stream: Conversion au fil de l'eau de chaque fichier
+        metrics: Collecteur Metrics optionnel, alimenté par les workers
+        block_jobs: Processus de conversion des blocs quand les fichiers sont
+                    traités dans ce processus (un seul fichier, ou jobs=1)
+        executor: 'auto', 'thread' ou 'process' (voir app.conversion.executor) ;
+                  le profil mémoire impose les processus (tracemalloc est global)
+        link: Sortie des fichiers sans diagramme (voir convert_file)
+        manifest: Met à jour les manifestes des répertoires de sortie
+
+    Returns:
+        Dict de synthèse : {'files': int, 'blocks': int, 'converted': int,
+                            'cached': int, 'warnings': int, 'skipped': int,
+                            'unchanged': int, 'failed': [dict], 'elapsed': float}
+        ('skipped' : fichiers sans diagramme écartés par le préfiltre ;
+        'unchanged' : sorties déjà à jour, non réécrites)
+    """
+    started = time.perf_counter()
+    files = collect_markdown_files(inputs)
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    from .executor import pool_executor, resolve_executor
+
+    kind = resolve_executor(executor)
+    measure = metrics is not None
+    if measure and metrics.memory:
+        kind = 'process'
+    if kind == 'thread':
+        worker = partial(_thread_worker, cache=cache, stream=stream, measure=measure, link=link,
+                         manifest=manifest)
+    else:
+        worker = partial(_batch_worker, cache=cache, stream=stream, measure=measure,
+                         memory=measure and metrics.memory, link=link, manifest=manifest)
+
+    if jobs == 1 or len(files) <= 1:
+        results = [
+            convert_path(path, echo=silent, cache=cache, stream=stream, metrics=metrics,
+                         block_jobs=block_jobs, link=link, manifest=manifest)
+            for path in files
+        ]
+    else:
+        workers = min(jobs, len(files))
+        chunksize = max(1, len(files) // (workers * 4))
+        with pool_executor(workers, kind) as pool:
+            results = list(pool.map(worker, files, chunksize=chunksize))
+
+    if cache is not None:
+        cache.prune()
+    if metrics is not None:
+        for result in results:
+            metrics.add_record(result.pop('metrics', None))
+    if manifest:
+        from .manifest import update_manifests
+
+        # Écrits par ce processus seul : les workers ne font que calculer les entrées
+        update_manifests([r.pop('manifest') for r in results if 'manifest' in r], CONVERTER_VERSION)
+
+    return {
+        'files': len(files),
+        'blocks': sum(r['blocks'] for r in results),
+        'converted': sum(r['converted'] for r in results),
+        'cached': sum(r['cached'] for r in results),
+        'warnings': sum(r['warnings'] for r in results),
+        'skipped': sum(r['skipped'] for r in results),
+        'unchanged': sum(r['unchanged'] for r in results),
+        'failed': [r for r in results if not r['ok']],
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Résultats de convert_text
+# ---------------------------------------------------------------------------
+
+def __getattr__(name):
+    # BlockResult et ConversionResult, exposés ici sans importer dataclasses au
+    # démarrage ; la commande md2mmd réutilise ce même accès
+    if name in ('BlockResult', 'ConversionResult'):
+        from . import results
+        return getattr(results, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
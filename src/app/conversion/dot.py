@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analyseur Graphviz/DOT : tokenizer en une passe et petit AST
+
+Couvre la grammaire DOT utile à la conversion vers Mermaid :
+- identifiants non quotés, quotés ("..." avec échappements), numériques, HTML (<...>) ;
+- commentaires // et /* */, lignes de préprocesseur # ;
+- instructions de nœud, d'arête (chaînes a -> b -> c, extrémités {a b} ou
+  subgraph), d'attributs (graph/node/edge [...]) et affectations (k=v) ;
+- sous-graphes nommés ou anonymes, imbriqués ; ports (a:p:n) ignorés.
+
+L'analyse est tolérante : un jeton inattendu est ignoré au lieu de lever une
+exception, comme les convertisseurs historiques qui ne plantaient jamais sur
+un diagramme invalide. Le coût est linéaire en la taille du texte.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from .lazy import LazyPattern
+
+_TOKEN_RE = LazyPattern(r'''
+    (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z)|^[ \t]*\#[^\n]*)
+  | (?P<ws>[ \t\r\f\v]+|\n)
+  | (?P<edgeop>->|--)
+  | (?P<qid>"(?:[^"\\]|\\.)*")
+  | (?P<html><(?:[^<>]|<(?:[^<>]|<[^<>]*>)*>)*>)
+  | (?P<num>-?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?))
+  | (?P<id>[^\W\d]\w*)
+  | (?P<punct>[{}\[\]=;,:])
+  | (?P<other>.)
+''', re.VERBOSE | re.DOTALL | re.MULTILINE)
+
+_KEYWORDS = {'strict', 'graph', 'digraph', 'node', 'edge', 'subgraph'}
+
+# Types de jetons produits par tokenize()
+ID = 'id'
+KEYWORD = 'keyword'
+EDGEOP = 'edgeop'
+PUNCT = 'punct'
+
+
+def tokenize(text):
+    """
+    Découpe un texte DOT en jetons, en une seule passe.
+
+    Args:
+        text: Source DOT
+
+    Returns:
+        Liste de (type, valeur) où type ∈ {'id', 'keyword', 'edgeop', 'punct'} ;
+        les identifiants quotés sont déséchappés, les mots-clés en minuscules.
+    """
+    tokens = []
+    append = tokens.append
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        if kind in ('ws', 'comment', 'other'):
+            continue
+        if kind == 'id':
+            lowered = value.lower()
+            if lowered in _KEYWORDS:
+                append((KEYWORD, lowered))
+            else:
+                append((ID, value))
+        elif kind == 'qid':
+            append((ID, value[1:-1].replace('\\"', '"').replace('\\\n', '')))
+        elif kind == 'html':
+            append((ID, value[1:-1]))
+        elif kind == 'num':
+            append((ID, value))
+        else:
+            append((kind, value))
+    return tokens
+
+
+# ---------------------------------------------------------------------------
+# AST
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class NodeStmt:
+    """Déclaration de nœud : a [label="A"]."""
+    id: str
+    attrs: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class EdgeStmt:
+    """Chaîne d'arêtes : a -> b -> {c d}. Les extrémités sont des id ou des Subgraph."""
+    endpoints: list
+    attrs: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class AttrStmt:
+    """Attributs par défaut (graph/node/edge [...]) ou affectation k=v (kind 'graph')."""
+    kind: str
+    attrs: dict
+
+
+@dataclass(slots=True)
+class Subgraph:
+    """Sous-graphe nommé (subgraph cluster_x {...}) ou anonyme ({...})."""
+    id: str | None
+    stmts: list = field(default_factory=list)
+
+    def node_ids(self):
+        """Identifiants des nœuds mentionnés dans le sous-graphe, dans l'ordre, sans doublon."""
+        seen = {}
+        for stmt in self.stmts:
+            if isinstance(stmt, NodeStmt):
+                seen.setdefault(stmt.id)
+            elif isinstance(stmt, EdgeStmt):
+                for endpoint in stmt.endpoints:
+                    if isinstance(endpoint, Subgraph):
+                        for node_id in endpoint.node_ids():
+                            seen.setdefault(node_id)
+                    else:
+                        seen.setdefault(endpoint)
+            elif isinstance(stmt, Subgraph):
+                for node_id in stmt.node_ids():
+                    seen.setdefault(node_id)
+        return list(seen)
+
+    def attrs(self):
+        """Attributs de graphe propres à ce (sous-)graphe."""
+        attrs = {}
+        for stmt in self.stmts:
+            if isinstance(stmt, AttrStmt) and stmt.kind == 'graph':
+                attrs.update(stmt.attrs)
+        return attrs
+
+
+@dataclass(slots=True)
+class DotGraph:
+    """Graphe DOT complet. directed vaut None si l'en-tête graph/digraph est absent."""
+    directed: bool | None
+    strict: bool
+    id: str | None
+    body: Subgraph
+
+
+# ---------------------------------------------------------------------------
+# Analyse syntaxique
+# ---------------------------------------------------------------------------
+
+class _Parser:
+    """Descente récursive tolérante sur la liste de jetons."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def accept(self, kind, value=None):
+        tok_kind, tok_value = self.peek()
+        if tok_kind == kind and (value is None or tok_value == value):
+            self.pos += 1
+            return tok_value
+        return None
+
+    def parse_graph(self):
+        strict = self.accept(KEYWORD, 'strict') is not None
+        directed = None
+        if self.accept(KEYWORD, 'digraph'):
+            directed = True
+        elif self.accept(KEYWORD, 'graph'):
+            directed = False
+        name = self.accept(ID)
+
+        # Avancer jusqu'à l'accolade ouvrante (en-tête éventuellement invalide) ;
+        # sans accolade, les instructions sont lues telles quelles
+        start = self.pos
+        while self.peek()[0] is not None and self.peek() != (PUNCT, '{'):
+            self.pos += 1
+        if not self.accept(PUNCT, '{'):
+            self.pos = start
+        body = Subgraph(None, self.parse_stmt_list())
+        return DotGraph(directed, strict, name, body)
+
+    def parse_stmt_list(self):
+        stmts = []
+        while True:
+            kind, value = self.peek()
+            if kind is None:
+                return stmts
+            if (kind, value) == (PUNCT, '}'):
+                self.pos += 1
+                return stmts
+            if (kind, value) in ((PUNCT, ';'), (PUNCT, ',')):
+                self.pos += 1
+                continue
+            stmt = self.parse_stmt()
+            if stmt is None:
+                self.pos += 1  # jeton inattendu : ignoré
+            else:
+                stmts.append(stmt)
+
+    def parse_stmt(self):
+        kind, value = self.peek()
+
+        if kind == KEYWORD and value in ('graph', 'node', 'edge'):
+            self.pos += 1
+            return AttrStmt(value, self.parse_attr_lists())
+
+        if kind == ID and self.peek(1) == (PUNCT, '='):
+            self.pos += 2
+            rhs = self.accept(ID)
+            return AttrStmt('graph', {value: rhs if rhs is not None else ''})
+
+        first = self.parse_endpoint()
+        if first is None:
+            return None
+
+        if self.peek()[0] == EDGEOP:
+            endpoints = [first]
+            while self.accept(EDGEOP):
+                endpoint = self.parse_endpoint()
+                if endpoint is None:
+                    break
+                endpoints.append(endpoint)
+            return EdgeStmt(endpoints, self.parse_attr_lists())
+
+        if isinstance(first, Subgraph):
+            return first
+        return NodeStmt(first, self.parse_attr_lists())
+
+    def parse_endpoint(self):
+        """Identifiant de nœud (port ignoré) ou sous-graphe."""
+        kind, value = self.peek()
+        if kind == ID:
+            self.pos += 1
+            while self.accept(PUNCT, ':'):
+                self.accept(ID)
+            return value
+        if (kind, value) == (KEYWORD, 'subgraph'):
+            self.pos += 1
+            name = self.accept(ID)
+            if not self.accept(PUNCT, '{'):
+                return Subgraph(name)
+            return Subgraph(name, self.parse_stmt_list())
+        if (kind, value) == (PUNCT, '{'):
+            self.pos += 1
+            return Subgraph(None, self.parse_stmt_list())
+        return None
+
+    def parse_attr_lists(self):
+        attrs = {}
+        while self.accept(PUNCT, '['):
+            while True:
+                kind, value = self.peek()
+                if kind is None:
+                    return attrs
+                self.pos += 1
+                if (kind, value) == (PUNCT, ']'):
+                    break
+                if kind == ID:
+                    if self.accept(PUNCT, '='):
+                        rhs = self.accept(ID)
+                        attrs[value] = rhs if rhs is not None else ''
+                    else:
+                        attrs[value] = 'true'
+        return attrs
+
+
+def header_directed(text):
+    """
+    Orientation déclarée par l'en-tête DOT, sans analyser le reste du texte.
+
+    Même décision que parse_dot(text).directed : [strict] digraph | graph,
+    commentaires et blancs ignorés.
+
+    Returns:
+        True (digraph), False (graph), None si l'en-tête est absent
+    """
+    strict = False
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in ('ws', 'comment', 'other'):
+            continue
+        keyword = match.group().lower() if kind == 'id' else None
+        if keyword == 'strict' and not strict:
+            strict = True
+            continue
+        if keyword == 'digraph':
+            return True
+        if keyword == 'graph':
+            return False
+        return None
+    return None
+
+
+def parse_dot(text):
+    """
+    Analyse un texte DOT en AST.
+
+    Args:
+        text: Source DOT (contenu d'un bloc ```dot ou ```graphviz)
+
+    Returns:
+        DotGraph
+    """
+    return _Parser(tokenize(text)).parse_graph()
+
+
+# ---------------------------------------------------------------------------
+# Mise à plat pour les convertisseurs
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class FlatGraph:
+    """
+    Vue à plat d'un DotGraph, consommée par les convertisseurs Mermaid.
+
+    nodes: {id: attrs} dans l'ordre de première apparition
+    edges: [(source, cible, attrs)] dans l'ordre du document
+    clusters: [(id, label, [ids des nœuds], [clusters imbriqués])]
+    graph_attrs: attributs de graphe de premier niveau
+    has_node_defaults: présence d'une instruction node [...] non vide
+    """
+    nodes: dict
+    edges: list
+    clusters: list
+    graph_attrs: dict
+    has_node_defaults: bool
+
+
+def flatten(graph):
+    """
+    Met un DotGraph à plat : nœuds, arêtes (chaînes et sous-graphes développés),
+    clusters à dessiner et attributs de graphe.
+
+    Returns:
+        FlatGraph
+    """
+    nodes = {}
+    edges = []
+    state = {'node_defaults': False}
+
+    def touch(node_id, attrs=None):
+        current = nodes.get(node_id)
+        if current is None:
+            nodes[node_id] = dict(attrs) if attrs else {}
+        elif attrs:
+            current.update(attrs)
+
+    def endpoint_ids(endpoint):
+        if isinstance(endpoint, Subgraph):
+            return endpoint.node_ids()
+        return [endpoint]
+
+    def walk(subgraph):
+        clusters = []
+        for stmt in subgraph.stmts:
+            if isinstance(stmt, NodeStmt):
+                touch(stmt.id, stmt.attrs)
+            elif isinstance(stmt, EdgeStmt):
+                groups = []
+                for endpoint in stmt.endpoints:
+                    if isinstance(endpoint, Subgraph):
+                        clusters.extend(walk(endpoint))
+                    ids = endpoint_ids(endpoint)
+                    for node_id in ids:
+                        touch(node_id)
+                    groups.append(ids)
+                for sources, targets in zip(groups, groups[1:]):
+                    for source in sources:
+                        for target in targets:
+                            edges.append((source, target, stmt.attrs))
+            elif isinstance(stmt, Subgraph):
+                clusters.extend(walk(stmt))
+            elif isinstance(stmt, AttrStmt) and stmt.kind == 'node' and stmt.attrs:
+                state['node_defaults'] = True
+
+        if subgraph.id and subgraph.id.lower().startswith('cluster'):
+            label = subgraph.attrs().get('label', subgraph.id)
+            return [(subgraph.id, label, subgraph.node_ids(), clusters)]
+        return clusters
+
+    clusters = walk(graph.body)
+    return FlatGraph(nodes, edges, clusters, graph.body.attrs(), state['node_defaults'])
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pool d'exécution des conversions parallèles (lot, blocs d'un document)
+
+Sur une construction « free-threaded » de Python (3.13t, 3.14t) où le GIL est
+désactivé, les threads convertissent réellement en parallèle : un pool de
+threads évite alors le démarrage des processus et la sérialisation (pickle)
+des chemins, blocs et résultats. Avec le GIL, seul un pool de processus
+exploite plusieurs cœurs.
+"""
+
+import sys
+
+EXECUTORS = ('auto', 'thread', 'process')
+
+
+def gil_enabled():
+    """Vrai si le GIL est actif (toujours le cas avant Python 3.13)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def resolve_executor(kind='auto'):
+    """
+    Type de pool effectif.
+
+    Args:
+        kind: 'auto' (threads sans GIL, processus sinon), 'thread' ou 'process'
+
+    Returns:
+        'thread' | 'process'
+    """
+    if kind not in EXECUTORS:
+        raise ValueError(f"Exécuteur inconnu : {kind} (attendu : {', '.join(EXECUTORS)})")
+    if kind == 'auto':
+        return 'process' if gil_enabled() else 'thread'
+    return kind
+
+
+def pool_executor(max_workers, kind='auto'):
+    """Crée le pool (concurrent.futures) correspondant à resolve_executor(kind)."""
+    if resolve_executor(kind) == 'thread':
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='md2mmd')
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=max_workers)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Accès au dépôt git local par les commandes de plomberie
+
+md2mmd --since <ref> / --staged : liste des fichiers Markdown modifiés par
+rapport à une référence ou présents dans l'index, en un seul appel
+`git diff-index --name-only -z` ; ils sont ensuite convertis dans le même
+processus, sans parcourir l'arborescence.
+
+md2mmd --rev <révision> : fichiers d'une révision listés par `git ls-tree`,
+puis lus par un seul processus `git cat-file --batch` (CatFile), sans
+extraction dans l'arbre de travail ni processus par fichier.
+"""
+
+import subprocess
+from pathlib import Path
+
+
+class GitError(Exception):
+    """Commande git en échec (dépôt absent, référence inconnue, git introuvable)."""
+
+
+def run_git(args, cwd=None, input=None):
+    """
+    Exécute une commande git et retourne sa sortie standard (bytes).
+
+    Args:
+        input: Octets envoyés sur l'entrée standard de git (défaut : aucune entrée)
+
+    Raises:
+        GitError: git introuvable ou code retour non nul
+    """
+    try:
+        result = subprocess.run(['git', *args], cwd=cwd, capture_output=True,
+                                input=input, stdin=None if input is not None else subprocess.DEVNULL)
+    except FileNotFoundError:
+        raise GitError("git introuvable dans le PATH")
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip() or f"git {args[0]} : code {result.returncode}"
+        raise GitError(message)
+    return result.stdout
+
+
+def repo_root(cwd=None):
+    """Racine de l'arbre de travail contenant `cwd`."""
+    return Path(run_git(['rev-parse', '--show-toplevel'], cwd).decode('utf-8').strip())
+
+
+def _split_paths(output):
+    return [name.decode('utf-8', 'surrogateescape') for name in output.split(b'\0') if name]
+
+
+def _refresh_index(cwd=None):
+    """Rafraîchit les stats de l'index : diff-index ne compare sinon que les dates."""
+    try:
+        run_git(['update-index', '-q', '--refresh'], cwd)
+    except GitError:
+        pass  # fichiers modifiés (code retour non nul) ou index verrouillé : sans gravité
+
+
+def _head_tree(cwd=None):
+    """HEAD, ou l'arbre vide d'un dépôt encore sans commit."""
+    try:
+        run_git(['rev-parse', '--verify', '--quiet', 'HEAD'], cwd)
+        return 'HEAD'
+    except GitError:
+        return run_git(['mktree'], cwd, input=b'').decode('ascii').strip()
+
+
+def _diff_command(since, cwd=None):
+    """
+    Commande de plomberie équivalente à `git diff <since>` : diff-index pour
+    une référence (arbre de travail comparé à celle-ci), diff-tree pour
+    'A..B' et 'A...B' (base de fusion de A et B comparée à B).
+    """
+    if '...' in since:
+        left, _, right = since.partition('...')
+        right = right or 'HEAD'
+        base = run_git(['merge-base', left or 'HEAD', right], cwd).decode('ascii').strip()
+        return ['diff-tree', '-r', base, right]
+    if '..' in since:
+        left, _, right = since.partition('..')
+        return ['diff-tree', '-r', left or 'HEAD', right or 'HEAD']
+    return ['diff-index', since]
+
+
+def changed_files(since=None, staged=False, pathspecs=(), cwd=None):
+    """
+    Fichiers ajoutés, copiés, modifiés ou renommés (les suppressions sont exclues).
+
+    Les commandes de plomberie (diff-index, diff-tree) donnent des chemins
+    relatifs à la racine quelle que soit la configuration (diff.relative...).
+
+    Args:
+        since: Référence de base (arbre de travail comparé à la référence ;
+               'main...' compare HEAD à la base de fusion, 'A..B' B à A)
+        staged: Fichiers de l'index (`git diff-index --cached HEAD`)
+        pathspecs: Restreint la recherche à ces chemins (pathspecs git)
+        cwd: Répertoire dans le dépôt (défaut : répertoire courant)
+
+    Returns:
+        Liste de Path absolus, sans doublons, dans l'ordre de git
+    """
+    root = repo_root(cwd)
+    queries = []
+    if since is not None:
+        if '..' not in since:
+            _refresh_index(cwd)
+        queries.append(_diff_command(since, cwd))
+    if staged:
+        queries.append(['diff-index', '--cached', _head_tree(cwd)])
+
+    paths = []
+    seen = set()
+    for query in queries:
+        output = run_git(
+            [*query[:1], '--name-only', '-z', '--no-renames', '--diff-filter=ACMR', *query[1:], '--', *pathspecs],
+            cwd,
+        )
+        for name in _split_paths(output):
+            if name not in seen:
+                seen.add(name)
+                paths.append(root / name)
+    return paths
+
+
+def commit_info(rev, cwd=None):
+    """
+    Commit désigné par une révision (branche, étiquette, empreinte...).
+
+    Returns:
+        (empreinte complète, date du commit en secondes Unix)
+    """
+    output = run_git(['log', '-1', '--format=%H %ct', f'{rev}^{{commit}}', '--'], cwd)
+    sha, timestamp = output.decode('ascii').split()
+    return sha, int(timestamp)
+
+
+def tree_blobs(rev, pathspecs=(), cwd=None):
+    """
+    Fichiers d'une révision (`git ls-tree -r`), sans les liens symboliques ni
+    les sous-modules.
+
+    Args:
+        rev: Révision (commit ou arbre)
+        pathspecs: Chemins auxquels se limiter, relatifs à la racine du dépôt
+        cwd: Répertoire dans le dépôt (défaut : répertoire courant)
+
+    Returns:
+        Liste de (identifiant d'objet, chemin relatif à la racine), dans l'ordre de git
+    """
+    output = run_git(['ls-tree', '-r', '-z', '--full-tree', rev, '--', *pathspecs], cwd)
+    blobs = []
+    for line in output.split(b'\0'):
+        if not line:
+            continue
+        info, _, name = line.partition(b'\t')
+        mode, kind, oid = info.split()
+        if kind == b'blob' and mode != b'120000':
+            blobs.append((oid.decode('ascii'), name.decode('utf-8', 'surrogateescape')))
+    return blobs
+
+
+class CatFile:
+    """
+    Lecture d'objets par un processus `git cat-file --batch` unique, gardé
+    ouvert : une requête par ligne sur son entrée, l'en-tête et le contenu
+    de l'objet sur sa sortie.
+
+    Usage :
+        with CatFile(repo) as objects:
+            data = objects.read('HEAD:docs/archi.md')
+
+    Raises:
+        GitError: git introuvable
+    """
+
+    def __init__(self, cwd=None):
+        try:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'], cwd=cwd,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise GitError("git introuvable dans le PATH")
+
+    def read(self, name):
+        """
+        Contenu d'un objet (identifiant ou '<révision>:<chemin>').
+
+        Raises:
+            GitError: objet introuvable ou processus git interrompu
+        """
+        process = self._process
+        try:
+            process.stdin.write(name.encode('utf-8', 'surrogateescape') + b'\n')
+            process.stdin.flush()
+        except BrokenPipeError:
+            raise GitError("git cat-file interrompu")
+        header = process.stdout.readline()
+        if not header:
+            raise GitError("git cat-file interrompu")
+        fields = header.split()
+        if len(fields) != 3:
+            raise GitError(f"objet introuvable : {name}")
+        size = int(fields[2])
+        data = process.stdout.read(size)
+        if len(data) != size or process.stdout.read(1) != b'\n':
+            raise GitError("git cat-file interrompu")
+        return data
+
+    def close(self):
+        """Ferme l'entrée du processus et attend sa fin."""
+        process = self._process
+        if process.stdin and not process.stdin.closed:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+        process.wait()
+        process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
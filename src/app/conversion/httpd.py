@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serveur HTTP local de conversion (vscodiumbench http)
+
+Routes :
+    POST /convert                 corps = Markdown UTF-8
+    GET  /convert?path=doc.md     fichier lu sous la racine configurée (--root)
+
+La réponse est le document converti (text/markdown), avec un ETag fort :
+empreinte SHA-256 de la version du convertisseur et du Markdown source. Un
+client qui renvoie l'ETag dans If-None-Match reçoit 304 sans reconversion.
+Les derniers résultats sont gardés dans un LRU mémoire indexé par ETag, et
+les blocs inchangés d'un document modifié viennent du cache de blocs.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from .cache import MemoryBlockCache
+from .core import CONVERTER_VERSION, convert_text
+
+DEFAULT_PORT = 8765
+DEFAULT_LRU_ENTRIES = 256
+DEFAULT_MAX_BODY = 16 * 1024 * 1024
+
+
+def content_etag(source):
+    """ETag fort d'un document source (bytes) pour la version courante du convertisseur."""
+    digest = hashlib.sha256(CONVERTER_VERSION.encode('utf-8') + b'\0' + source)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(header, etag):
+    """Vrai si l'en-tête If-None-Match désigne l'ETag (liste, W/ et * acceptés)."""
+    if header is None:
+        return False
+    candidates = [item.strip() for item in header.split(',')]
+    return '*' in candidates or any(item.removeprefix('W/') == etag for item in candidates)
+
+
+class ConversionEndpoint:
+    """
+    Conversion avec LRU des résultats, partagée par les threads du serveur.
+
+    Args:
+        root: Racine des fichiers servis par GET /convert?path=
+        cache: Cache de blocs (défaut : MemoryBlockCache)
+        max_entries: Taille du LRU des documents convertis
+    """
+
+    def __init__(self, root=None, cache=None, max_entries=DEFAULT_LRU_ENTRIES):
+        self.root = Path(root).resolve() if root else None
+        self.cache = cache if cache is not None else MemoryBlockCache()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, relative):
+        """Chemin d'un fichier .md sous la racine ; None s'il en sort ou n'est pas servi."""
+        if self.root is None or not relative:
+            return None
+        path = (self.root / relative.lstrip('/')).resolve()
+        if not path.is_relative_to(self.root) or path.suffix.lower() != '.md':
+            return None
+        return path
+
+    def convert(self, source):
+        """
+        Convertit un document source (bytes).
+
+        Returns:
+            (etag, document converti en bytes)
+
+        Raises:
+            UnicodeDecodeError: Source non UTF-8
+        """
+        etag = content_etag(source)
+        with self._lock:
+            converted = self._results.get(etag)
+            if converted is not None:
+                self._results.move_to_end(etag)
+                self.hits += 1
+                return etag, converted
+            self.misses += 1
+        # Conversion hors verrou : le cache de blocs est sûr entre threads
+        converted = convert_text(source.decode('utf-8'), cache=self.cache).text.encode('utf-8')
+        with self._lock:
+            self._results[etag] = converted
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return etag, converted
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """Gestionnaire des routes /convert ; self.server.endpoint porte l'état partagé."""
+
+    server_version = f'vscodiumbench-md2mmd/{CONVERTER_VERSION}'
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        # Les refus précèdent la lecture du corps : la connexion est alors
+        # fermée, le corps non lu ne doit pas passer pour la requête suivante
+        if urlsplit(self.path).path != '/convert':
+            return self._send_error(HTTPStatus.NOT_FOUND, 'Route inconnue', close=True)
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            return self._send_error(HTTPStatus.LENGTH_REQUIRED, 'Content-Length requis', close=True)
+        if length < 0:
+            return self._send_error(HTTPStatus.BAD_REQUEST, 'Content-Length invalide', close=True)
+        if length > self.server.max_body:
+            return self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'Document trop volumineux', close=True)
+        self._respond(self.rfile.read(length))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != '/convert':
+            return self._send_error(HTTPStatus.NOT_FOUND, 'Route inconnue')
+        relative = parse_qs(url.query).get('path', [''])[0]
+        path = self.server.endpoint.resolve(relative)
+        if path is None:
+            return self._send_error(HTTPStatus.FORBIDDEN, 'Chemin hors de la racine configurée')
+        try:
+            source = path.read_bytes()
+        except FileNotFoundError:
+            return self._send_error(HTTPStatus.NOT_FOUND, 'Fichier introuvable')
+        except OSError as e:
+            return self._send_error(HTTPStatus.FORBIDDEN, f'Lecture impossible : {e.strerror}')
+        self._respond(source)
+
+    def _respond(self, source):
+        endpoint = self.server.endpoint
+        etag = content_etag(source)
+        if etag_matches(self.headers.get('If-None-Match'), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        try:
+            etag, converted = endpoint.convert(source)
+        except UnicodeDecodeError:
+            return self._send_error(HTTPStatus.BAD_REQUEST, 'Document non UTF-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/markdown; charset=utf-8')
+        self.send_header('Content-Length', str(len(converted)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(converted)
+
+    def _send_error(self, status, message, close=False):
+        """Réponse d'erreur ; `close` ferme la connexion (corps de requête non lu)."""
+        body = (message + '\n').encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            self.close_connection = True
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    """Serveur HTTP multi-thread portant un ConversionEndpoint."""
+
+    daemon_threads = True
+
+    def __init__(self, address, endpoint, max_body=DEFAULT_MAX_BODY, quiet=False):
+        super().__init__(address, ConversionHandler)
+        self.endpoint = endpoint
+        self.max_body = max_body
+        self.quiet = quiet
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Expressions régulières compilées à la première utilisation
+
+Les modules de conversion déclarent leurs motifs au niveau module, mais un
+démarrage à froid (aide, commande qui n'utilise pas tous les convertisseurs)
+ne doit pas payer leur compilation. LazyPattern s'utilise comme le résultat
+de re.compile() ; après la première utilisation, les méthodes du motif
+compilé sont des attributs ordinaires de l'instance (aucun surcoût par appel).
+
+Sans GIL, deux threads peuvent compiler le même motif simultanément : les
+deux compilations sont équivalentes et la dernière affectation l'emporte,
+aucun verrou n'est nécessaire.
+"""
+
+import re
+
+_PATTERN_ATTRS = (
+    'match', 'fullmatch', 'search', 'finditer', 'findall', 'sub', 'subn', 'split',
+    'pattern', 'flags', 'groups', 'groupindex',
+)
+
+
+class LazyPattern:
+    """Équivalent paresseux de re.compile(pattern, flags)."""
+
+    def __init__(self, pattern, flags=0):
+        self._source = (pattern, flags)
+
+    def __getattr__(self, name):
+        # Appelé uniquement pour un attribut absent : la première fois
+        if name not in _PATTERN_ATTRS:
+            raise AttributeError(name)
+        compiled = re.compile(*self._source)
+        for attr in _PATTERN_ATTRS:
+            setattr(self, attr, getattr(compiled, attr))
+        return vars(self)[name]
+
+    def __repr__(self):
+        return f'LazyPattern({self._source[0]!r}, {self._source[1]!r})'
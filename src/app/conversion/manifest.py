@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Manifeste des sorties md2mmd et vérification de fraîcheur (md2mmd --check)
+
+Chaque répertoire de sortie contient un fichier .md2mmd-manifest.json qui
+associe à chaque .mmd.md :
+- sa source (chemin relatif au répertoire du manifeste) ;
+- l'empreinte SHA-256 de la source et de la sortie ;
+- l'empreinte de chaque bloc PlantUML/DOT de la source ;
+- la version du convertisseur (pour tout le manifeste).
+
+--check répond « les sorties sont-elles à jour ? » sans rien convertir : une
+empreinte de la source et une de la sortie par fichier. Les empreintes de
+blocs ne servent qu'à expliquer une source périmée (blocs ou texte modifiés).
+
+Chaque exécution de md2mmd écrit le manifeste par défaut (--no-manifest pour
+s'en passer) : il se versionne avec les sorties qu'il décrit, sans quoi
+--check signale en CI « manifeste absent » pour des sorties pourtant à jour.
+"""
+
+import io
+import os
+import json
+import hashlib
+from pathlib import Path
+
+MANIFEST_NAME = '.md2mmd-manifest.json'
+MANIFEST_SCHEMA = 1
+
+
+def block_digest(block_type, content):
+    """Empreinte courte d'un bloc source (type, contenu)."""
+    digest = hashlib.sha256(block_type.encode('utf-8') + b'\0' + content.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def file_digest(path):
+    """Empreinte SHA-256 d'un fichier, lu par blocs."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+class _HashingReader(io.RawIOBase):
+    """Fichier binaire dont les octets lus alimentent une empreinte SHA-256."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.digest = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._raw.readinto(buffer)
+        if count:
+            self.digest.update(memoryview(buffer)[:count])
+        return count
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
+
+def open_hashed(path):
+    """
+    Ouvre une source comme open(path, encoding='utf-8'), en calculant
+    l'empreinte SHA-256 des octets au fil de la lecture.
+
+    Returns:
+        (fichier texte, empreinte hashlib : hexdigest() une fois le fichier lu)
+    """
+    raw = _HashingReader(open(path, 'rb', buffering=0))
+    return io.TextIOWrapper(io.BufferedReader(raw), encoding='utf-8'), raw.digest
+
+
+def manifest_entry(source, output, blocks, source_sha256, output_sha256=None):
+    """
+    Entrée de manifeste d'une sortie venant d'être écrite (ou laissée à jour).
+
+    L'empreinte de la source est celle des octets effectivement convertis :
+    relire la source ici associerait une source enregistrée pendant la
+    conversion (mode watch) à la sortie de la version précédente.
+
+    Args:
+        source: Fichier .md source
+        output: Fichier .mmd.md produit
+        blocks: Empreintes block_digest() des blocs de la source, dans l'ordre
+        source_sha256: Empreinte SHA-256 des octets sources convertis
+        output_sha256: Empreinte de la sortie, si elle est déjà connue
+    """
+    output = Path(output)
+    return {
+        'output': str(output),
+        'source': os.path.relpath(source, output.parent),
+        'source_sha256': source_sha256,
+        'output_sha256': output_sha256 or file_digest(output),
+        'blocks': blocks,
+    }
+
+
+def load_manifest(directory):
+    """Manifeste d'un répertoire de sortie ; None s'il est absent ou illisible."""
+    try:
+        with open(Path(directory) / MANIFEST_NAME, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('schema') != MANIFEST_SCHEMA:
+        return None
+    return manifest
+
+
+def update_manifests(entries, version):
+    """
+    Enregistre des entrées dans les manifestes de leurs répertoires de sortie.
+
+    Un manifeste d'une autre version du convertisseur est repris de zéro ; un
+    manifeste inchangé n'est pas réécrit.
+
+    Returns:
+        Nombre de manifestes écrits
+    """
+    from .output import write_text_if_changed
+
+    by_directory = {}
+    for entry in entries:
+        output = Path(entry['output'])
+        by_directory.setdefault(output.parent, {})[output.name] = {
+            key: value for key, value in entry.items() if key != 'output'
+        }
+
+    written = 0
+    for directory, files in by_directory.items():
+        manifest = load_manifest(directory)
+        if manifest is None or manifest.get('converter_version') != version:
+            manifest = {'schema': MANIFEST_SCHEMA, 'converter_version': version, 'files': {}}
+        manifest['files'].update(files)
+        text = json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + '\n'
+        written += write_text_if_changed(directory / MANIFEST_NAME, text)
+    return written
+
+
+def _source_change(source, recorded_blocks):
+    """Précise la modification d'une source périmée : blocs ou texte seul."""
+    from .core import extract_code_blocks
+
+    with open(source, encoding='utf-8') as f:
+        blocks = [block_digest(block['type'], block['content']) for block in extract_code_blocks(f.read())]
+    if blocks == recorded_blocks:
+        return 'texte modifié hors diagrammes'
+    changed = sum(1 for a, b in zip(blocks, recorded_blocks) if a != b)
+    changed += abs(len(blocks) - len(recorded_blocks))
+    return f'{changed} bloc(s) de diagramme modifié(s), ajouté(s) ou supprimé(s)'
+
+
+def check_outputs(pairs, version):
+    """
+    Sorties périmées, sans conversion.
+
+    Args:
+        pairs: Itérable de (source, sortie)
+        version: Version courante du convertisseur
+
+    Returns:
+        Liste de (source, sortie, raison), dans l'ordre des paires
+    """
+    manifests = {}
+    stale = []
+    for source, output in pairs:
+        source, output = Path(source), Path(output)
+        directory = output.parent
+        if directory not in manifests:
+            manifests[directory] = load_manifest(directory)
+        manifest = manifests[directory]
+
+        if not output.exists():
+            reason = 'sortie absente'
+        elif manifest is None:
+            reason = f'manifeste {MANIFEST_NAME} absent'
+        elif manifest.get('converter_version') != version:
+            reason = f"convertisseur {manifest.get('converter_version')} → {version}"
+        elif output.name not in manifest['files']:
+            reason = 'sortie absente du manifeste'
+        else:
+            entry = manifest['files'][output.name]
+            if os.path.normpath(directory / entry['source']) != os.path.normpath(source):
+                reason = f"sortie produite depuis {entry['source']}"
+            elif file_digest(source) != entry['source_sha256']:
+                try:
+                    reason = 'source modifiée : ' + _source_change(source, entry['blocks'])
+                except (OSError, UnicodeDecodeError):
+                    reason = 'source modifiée'
+            elif file_digest(output) != entry['output_sha256']:
+                reason = 'sortie modifiée à la main'
+            else:
+                continue
+        stale.append((source, output, reason))
+    return stale
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instrumentation de md2mmd : durées par étape et par bloc, tailles en octets
+
+Un objet Metrics collecte, pour chaque fichier converti :
+- la durée des étapes (read, extract, convert, assemble, write ; stream en
+  mode --stream) ;
+- un enregistrement par bloc : type, sous-type (detect_plantuml_type ou
+  digraph/graph), position, octets en entrée et en sortie, durée, cache.
+
+to_dict() produit un seul document structuré par exécution (md2mmd
+--metrics json), prêt pour un tableau de bord de build. Les enregistrements
+de fichier sont des dicts sérialisables : ils remontent tels quels des
+processus workers d'un traitement par lot.
+
+Avec Metrics(memory=True) (md2mmd --mem-profile), tracemalloc mesure en plus
+le pic de mémoire de chaque fichier et de chaque bloc, au-delà de la mémoire
+déjà allouée à leur début ; les sites d'allocation encore vivants à la fin
+du fichier le plus gourmand sont relevés. Les modules de conversion chargés
+à la première utilisation (dot, results, manifest) et leurs motifs sont
+alors préparés dès la création du collecteur : leur import n'est pas
+imputé au premier bloc converti.
+"""
+
+import time
+from contextlib import contextmanager
+
+# tracemalloc n'est importé qu'en mode mémoire (démarrage à froid de md2mmd)
+
+METRICS_SCHEMA = 2
+STAGES = ('read', 'extract', 'convert', 'assemble', 'write', 'stream')
+TRACE_FRAMES = 1
+TOP_ALLOCATIONS = 10
+
+_TRACE_EXCLUDED = (
+    '<frozen importlib._bootstrap>',
+    '<frozen importlib._bootstrap_external>',
+    '<unknown>',
+)
+
+
+def top_allocations(snapshot, baseline=None, limit=TOP_ALLOCATIONS):
+    """
+    Sites d'allocation les plus lourds d'un instantané tracemalloc, sérialisables.
+
+    Avec `baseline`, seules comptent les allocations apparues depuis cet
+    instantané de référence (imports, pool de processus... sont écartés).
+    """
+    import tracemalloc
+
+    filters = [tracemalloc.Filter(False, pattern) for pattern in (tracemalloc.__file__,) + _TRACE_EXCLUDED]
+    snapshot = snapshot.filter_traces(filters)
+    if baseline is None:
+        rows = [(stat.traceback, stat.size, stat.count) for stat in snapshot.statistics('lineno')]
+    else:
+        rows = [
+            (stat.traceback, stat.size_diff, stat.count_diff)
+            for stat in snapshot.compare_to(baseline.filter_traces(filters), 'lineno')
+            if stat.size_diff > 0
+        ]
+        rows.sort(key=lambda row: row[1], reverse=True)
+    return [
+        {'site': f'{traceback[0].filename}:{traceback[0].lineno}', 'bytes': size, 'count': count}
+        for traceback, size, count in rows[:limit]
+    ]
+
+
+def _preload_converters():
+    """Importe les modules de conversion paresseux et compile leurs motifs."""
+    from . import core, dot, manifest, results
+    from .lazy import LazyPattern
+
+    for module in (core, dot, manifest, results):
+        for value in vars(module).values():
+            if isinstance(value, LazyPattern):
+                value.pattern
+
+
+class FileMetrics:
+    """Mesures d'un fichier ; créé par Metrics.begin_file()."""
+
+    def __init__(self, path, owner=None):
+        self.record = {
+            'path': str(path),
+            'ok': False,
+            'bytes_in': 0,
+            'bytes_out': 0,
+            'stages': {},
+            'blocks': [],
+        }
+        self._owner = owner
+        self.memory = owner is not None and owner.memory
+        if self.memory:
+            import tracemalloc
+
+            self._file_base = tracemalloc.get_traced_memory()[0]
+            self._file_peak = self._file_base
+            self._block_base = 0
+            tracemalloc.reset_peak()
+
+    def _fold_peak(self):
+        """Pic tracemalloc depuis la dernière remise à zéro, reporté sur le fichier."""
+        import tracemalloc
+
+        peak = tracemalloc.get_traced_memory()[1]
+        self._file_peak = max(self._file_peak, peak)
+        return peak
+
+    @contextmanager
+    def stage(self, name):
+        """Chronomètre une étape ; les durées d'une même étape s'additionnent."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stages = self.record['stages']
+            stages[name] = stages.get(name, 0.0) + time.perf_counter() - started
+
+    def block_started(self):
+        """Début de la conversion d'un bloc ; retourne l'instant de départ pour block()."""
+        if self.memory:
+            import tracemalloc
+
+            self._fold_peak()
+            self._block_base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        return time.perf_counter()
+
+    def block(self, block_type, subtype, start, bytes_in, bytes_out, started, cached, warning):
+        """Enregistre la conversion d'un bloc commencée à l'instant `started`."""
+        entry = {
+            'index': len(self.record['blocks']),
+            'type': block_type,
+            'subtype': subtype,
+            'start': start,
+            'bytes_in': bytes_in,
+            'bytes_out': bytes_out,
+            'seconds': time.perf_counter() - started,
+            'cached': cached,
+            'warning': warning,
+        }
+        if self.memory:
+            entry['peak_bytes'] = self._fold_peak() - self._block_base
+        self.record['blocks'].append(entry)
+
+    def finish(self, ok, bytes_in, bytes_out):
+        self.record.update(ok=ok, bytes_in=bytes_in, bytes_out=bytes_out)
+        if self.memory:
+            self._fold_peak()
+            peak = self._file_peak - self._file_base
+            self.record['peak_bytes'] = peak
+            self._owner._observe_peak(self.record, peak)
+
+
+class _NullFileMetrics:
+    """Variante sans effet, utilisée quand aucune mesure n'est demandée."""
+
+    record = None
+    memory = False
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def block_started(self):
+        return 0.0
+
+    def block(self, *args):
+        pass
+
+    def finish(self, *args):
+        pass
+
+
+NULL_FILE_METRICS = _NullFileMetrics()
+
+
+class Metrics:
+    """
+    Collecteur de mesures pour une exécution de md2mmd.
+
+    Usage programmatique :
+        metrics = Metrics()
+        convert_file('doc.md', metrics=metrics)
+        document = metrics.to_dict()
+
+    Args:
+        memory: Mesure aussi les pics de mémoire (démarre tracemalloc si besoin ;
+                appeler close() pour l'arrêter)
+    """
+
+    def __init__(self, memory=False):
+        self.files = []
+        self.memory = memory
+        self._heaviest = None
+        self._baseline = None
+        self._started_tracing = False
+        if memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACE_FRAMES)
+                self._started_tracing = True
+            _preload_converters()
+        self._started = time.perf_counter()
+        self._timestamp = time.strftime('%Y-%m-%dT%H:%M:%S%z')
+
+    def close(self):
+        """Arrête tracemalloc s'il a été démarré par ce collecteur."""
+        if self._started_tracing:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def begin_file(self, path):
+        """Ouvre l'enregistrement d'un fichier."""
+        if self.memory and self._baseline is None:
+            import tracemalloc
+
+            self._baseline = tracemalloc.take_snapshot()
+        file_metrics = FileMetrics(path, self)
+        self.files.append(file_metrics.record)
+        return file_metrics
+
+    def add_record(self, record):
+        """Ajoute un enregistrement de fichier produit ailleurs (worker de lot)."""
+        if record is None:
+            return
+        self.files.append(record)
+        if 'top_allocations' in record:
+            self._observe_peak(record, record['peak_bytes'], record.pop('top_allocations'))
+
+    def _observe_peak(self, record, peak, sites=None):
+        """Retient les sites d'allocation du fichier au pic le plus élevé."""
+        if self._heaviest is not None and peak <= self._heaviest['peak_bytes']:
+            return
+        if sites is None:
+            import tracemalloc
+
+            sites = top_allocations(tracemalloc.take_snapshot(), self._baseline)
+        self._heaviest = {'path': record['path'], 'peak_bytes': peak, 'sites': sites}
+
+    def worker_record(self):
+        """
+        Retire et retourne l'enregistrement du dernier fichier, à renvoyer au
+        processus parent ; il porte ses sites d'allocation s'il est le plus
+        gourmand du worker.
+        """
+        record = self.files.pop()
+        if self.memory and self._heaviest is not None and self._heaviest['path'] == record['path']:
+            record = dict(record, top_allocations=self._heaviest['sites'])
+        return record
+
+    def _memory_summary(self):
+        converters = {}
+        for record in self.files:
+            for block in record['blocks']:
+                if 'peak_bytes' not in block:
+                    continue
+                name = block['subtype'] or block['type']
+                entry = converters.setdefault(name, {'blocks': 0, 'peak_bytes': 0})
+                entry['blocks'] += 1
+                entry['peak_bytes'] = max(entry['peak_bytes'], block['peak_bytes'])
+        return {
+            'peak_bytes': max((record.get('peak_bytes', 0) for record in self.files), default=0),
+            'converters': converters,
+            'top_allocations': self._heaviest,
+        }
+
+    def to_dict(self, converter_version=None):
+        """Document de synthèse de l'exécution."""
+        stages = {}
+        blocks = 0
+        bytes_in = bytes_out = 0
+        for record in self.files:
+            for name, seconds in record['stages'].items():
+                stages[name] = stages.get(name, 0.0) + seconds
+            blocks += len(record['blocks'])
+            bytes_in += record['bytes_in']
+            bytes_out += record['bytes_out']
+
+        document = {
+            'schema': METRICS_SCHEMA,
+            'tool': 'md2mmd',
+            'converter_version': converter_version,
+            'timestamp': self._timestamp,
+            'elapsed': time.perf_counter() - self._started,
+            'totals': {
+                'files': len(self.files),
+                'failed': sum(1 for record in self.files if not record['ok']),
+                'blocks': blocks,
+                'bytes_in': bytes_in,
+                'bytes_out': bytes_out,
+            },
+            'stages': stages,
+            'files': self.files,
+        }
+        if self.memory:
+            document['memory'] = self._memory_summary()
+        return document
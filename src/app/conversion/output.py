@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Écriture des fichiers de sortie (.mmd.md)
+
+Une sortie identique octet pour octet au fichier existant n'est pas réécrite :
+sa date de modification ne bouge pas, et les aperçus, surveillances de
+fichiers et reconstructions en aval ne se déclenchent pas. Sinon, elle est
+écrite dans un fichier temporaire du même répertoire puis renommée
+(os.replace) : un lecteur voit l'ancienne ou la nouvelle version, jamais un
+fichier partiel.
+
+Un document sans diagramme peut être recopié, lié (lien physique) ou cloné
+(reflink, copie à la demande des systèmes de fichiers Btrfs, XFS...).
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+
+LINK_MODES = ('hardlink', 'reflink')
+
+_CHUNK = 1024 * 1024
+_FICLONE = 0x40049409  # ioctl Linux : clone d'un fichier entier
+
+
+def _temp_path(path):
+    """Fichier temporaire voisin de `path`, propre au processus et au thread."""
+    path = Path(path)
+    return path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+
+def _same_bytes(path, data):
+    """Vrai si le fichier existe et contient exactement `data`."""
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size != len(data):
+                return False
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _same_files(first, second):
+    """Comparaison par blocs de deux fichiers (mémoire bornée)."""
+    try:
+        with open(first, 'rb') as a, open(second, 'rb') as b:
+            if os.fstat(a.fileno()).st_size != os.fstat(b.fileno()).st_size:
+                return False
+            while True:
+                chunk = a.read(_CHUNK)
+                if chunk != b.read(_CHUNK):
+                    return False
+                if not chunk:
+                    return True
+    except OSError:
+        return False
+
+
+def _replace(tmp, path):
+    """Substitue `tmp` à `path` en conservant les droits du fichier remplacé."""
+    try:
+        os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+    except OSError:
+        pass
+    os.replace(tmp, path)
+
+
+def _discard(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def encode_text(text, encoding='utf-8'):
+    """Octets qu'écrirait un fichier texte (fins de ligne os.linesep)."""
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode(encoding)
+
+
+def write_text_if_changed(path, text, encoding='utf-8'):
+    """
+    Écrit un texte de façon atomique, sauf si le fichier le contient déjà.
+
+    Returns:
+        True si le fichier a été (ré)écrit, False s'il était à jour
+    """
+    return write_bytes_if_changed(path, encode_text(text, encoding))
+
+
+def write_bytes_if_changed(path, data):
+    """Variante de write_text_if_changed pour un contenu déjà encodé."""
+    if _same_bytes(path, data):
+        return False
+    tmp = _temp_path(path)
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        _replace(tmp, path)
+    except BaseException:
+        _discard(tmp)
+        raise
+    return True
+
+
+class AtomicOutput:
+    """
+    Fichier de sortie texte écrit au fil de l'eau puis substitué atomiquement.
+
+    Usage :
+        output = AtomicOutput(path)
+        with output as target:
+            target.write(...)
+        output.changed  # False si le résultat était déjà en place
+
+    En cas d'exception, le fichier existant est laissé intact.
+    """
+
+    def __init__(self, path, encoding='utf-8'):
+        self.path = path
+        self.encoding = encoding
+        self.changed = False
+        self._tmp = _temp_path(path)
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self._tmp, 'w', encoding=self.encoding)
+        return self._file
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is not None or _same_files(self._tmp, self.path):
+            _discard(self._tmp)
+            return False
+        try:
+            _replace(self._tmp, self.path)
+        except BaseException:
+            _discard(self._tmp)
+            raise
+        self.changed = True
+        return False
+
+
+def _reflink(source, target):
+    """Clone `source` vers `target` (ioctl FICLONE) ; OSError si non pris en charge."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError('reflink indisponible sur cette plateforme')
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+
+def copy_if_changed(source, target, link=None):
+    """
+    Recopie un fichier source tel quel, sauf si la cible est déjà identique.
+
+    Args:
+        link: None (copie), 'hardlink' (lien physique) ou 'reflink' (clone) ;
+              si le lien est impossible (autre volume, système de fichiers
+              sans reflink), une copie ordinaire est faite
+
+    Returns:
+        True si la cible a été (ré)écrite, False si elle était à jour
+    """
+    if link is not None and link not in LINK_MODES:
+        raise ValueError(f"Mode de lien inconnu : {link} (attendu : {', '.join(LINK_MODES)})")
+    try:
+        if os.path.samefile(source, target):
+            return False
+    except OSError:
+        pass
+    if _same_files(source, target):
+        return False
+
+    tmp = _temp_path(target)
+    try:
+        _discard(tmp)
+        try:
+            if link == 'hardlink':
+                os.link(source, tmp)
+            elif link == 'reflink':
+                _reflink(source, tmp)
+            else:
+                shutil.copyfile(source, tmp)
+        except OSError:
+            if link is None:
+                raise
+            _discard(tmp)
+            shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        _discard(tmp)
+        raise
+    return True
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Résultats structurés de md2mmd.convert_text
+
+Module séparé de md2mmd : dataclasses n'est importé que par les appelants
+de l'API en mémoire, pas au démarrage de la ligne de commande.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class BlockResult:
+    """
+    Bloc PlantUML/DOT rencontré par convert_text.
+
+    start/end: position du bloc (clôtures comprises) dans le texte source
+    converted: faux si le convertisseur n'a rien produit (bloc laissé tel quel)
+    warning: commentaire d'avertissement inséré avant le bloc mermaid, ou None
+    """
+    type: str
+    subtype: str | None
+    start: int
+    end: int
+    converted: bool
+    cached: bool
+    warning: str | None
+
+
+@dataclass(slots=True)
+class ConversionResult:
+    """Résultat de convert_text : texte converti, blocs et compteurs."""
+    text: str
+    blocks: list = field(default_factory=list)
+    converted: int = 0
+    cached: int = 0
+    warnings: int = 0
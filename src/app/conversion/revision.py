@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conversion d'une révision git sans extraction (md2mmd --rev)
+
+Les .md d'une révision (étiquette de version, branche, commit) sont listés
+par `git ls-tree`, lus par un seul processus `git cat-file --batch` et
+convertis en mémoire : ni `git checkout`, ni arbre de travail modifié, ni
+processus git par fichier. Les <fichier>.mmd.md sont écrits sous un
+répertoire de sortie, à leur chemin dans le dépôt, ou dans une archive tar
+datée du commit (reproductible, .tar[.gz] ou .zip).
+"""
+
+import time
+from pathlib import Path, PurePosixPath
+
+from .core import convert_bytes, is_source_markdown, output_name
+from .git import CatFile, commit_info, repo_root, tree_blobs
+
+
+def convert_revision(rev, output, pathspecs=(), cache=None, cwd=None, echo=print):
+    """
+    Convertit les fichiers Markdown d'une révision.
+
+    Args:
+        rev: Révision git (étiquette, branche, commit)
+        output: Répertoire de sortie, ou archive si son extension en est une
+                (.tar, .tar.gz, .zip... voir app.conversion.archive)
+        pathspecs: Chemins auxquels se limiter, relatifs à la racine du dépôt
+        cache: Cache de blocs optionnel
+        cwd: Répertoire dans le dépôt (défaut : répertoire courant)
+        echo: Fonction d'affichage des messages
+
+    Returns:
+        Dict de synthèse de convert_batch, plus 'commit' (empreinte convertie)
+
+    Raises:
+        GitError: dépôt, révision ou git introuvable
+    """
+    from .archive import archive_kind, open_archive
+    from .output import write_bytes_if_changed
+
+    started = time.perf_counter()
+    root = repo_root(cwd)
+    sha, timestamp = commit_info(rev, cwd)
+    blobs = [(oid, name) for oid, name in tree_blobs(sha, pathspecs, cwd)
+             if is_source_markdown(PurePosixPath(name))]
+    echo(f"[INFO] {rev} ({sha[:12]}) : {len(blobs)} fichier(s) Markdown")
+
+    report = {'files': len(blobs), 'blocks': 0, 'converted': 0, 'cached': 0, 'warnings': 0,
+              'skipped': 0, 'unchanged': 0, 'failed': [], 'commit': sha}
+    archive = open_archive(output, mtime=timestamp) if archive_kind(output) is not None else None
+    target = Path(output)
+
+    with CatFile(root) as objects:
+        try:
+            for oid, name in blobs:
+                try:
+                    data, counts = convert_bytes(objects.read(oid), cache)
+                except UnicodeDecodeError as e:
+                    report['failed'].append({'path': f'{rev}:{name}',
+                                             'error': f"[ERREUR] Problème d'encodage lors de la lecture : {e}"})
+                    continue
+                for key in ('blocks', 'converted', 'cached', 'warnings', 'skipped'):
+                    report[key] += counts[key]
+                if archive is not None:
+                    archive.add(output_name(name), data)
+                else:
+                    path = target / output_name(name)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    report['unchanged'] += not write_bytes_if_changed(path, data)
+        except BaseException:
+            if archive is not None:
+                archive.close(commit=False)
+            raise
+    if archive is not None:
+        archive.close()
+    if cache is not None:
+        cache.prune()
+
+    report['elapsed'] = time.perf_counter() - started
+    return report
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serveur de conversion résident : JSON-RPC 2.0 sur stdio (vscodiumbench serve)
+
+Les messages sont encadrés comme dans le Language Server Protocol : un
+en-tête « Content-Length: N », une ligne vide, puis N octets de JSON UTF-8.
+Le processus reste vivant entre deux requêtes : expressions régulières
+compilées, modules de conversion importés et cache mémoire des blocs
+restent chauds, et une petite modification ne reconvertit que ses blocs.
+
+Méthodes :
+    initialize            -> {'serverInfo': {...}, 'capabilities': {'methods': [...]}}
+    md2mmd/convertText    {'text'}            -> {'text', 'blocks', 'converted', 'cached', 'warnings'}
+    md2mmd/convertFile    {'path', 'output'?} -> statistiques de convert_file
+    md2mmd/listBlocks     {'text'} | {'path'} -> [{'type', 'subtype', 'start', 'end', 'line'}]
+    shutdown              -> null ; puis la notification exit termine la boucle
+"""
+
+import sys
+import json
+
+from .cache import MemoryBlockCache
+from .core import (
+    CONVERTER_VERSION,
+    convert_path,
+    convert_text,
+    diagram_subtype,
+    extract_code_blocks,
+    silent,
+)
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    """Erreur renvoyée au client dans la réponse JSON-RPC."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+# ---------------------------------------------------------------------------
+# Encadrement des messages (Content-Length)
+# ---------------------------------------------------------------------------
+
+def read_message(stream):
+    """
+    Lit un message encadré sur un flux binaire.
+
+    Returns:
+        Corps du message (bytes), ou None en fin de flux
+    """
+    length = None
+    headers = False
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.rstrip(b'\r\n')
+        if not line:
+            if not headers:
+                continue  # ligne vide parasite entre deux messages
+            break
+        headers = True
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            try:
+                length = int(value.strip())
+            except ValueError:
+                length = None
+    if length is None:
+        return b''  # en-tête sans longueur : signalé comme JSON invalide
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return body
+
+
+def write_message(stream, payload):
+    """Écrit un message JSON encadré sur un flux binaire."""
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    stream.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+    stream.flush()
+
+
+# ---------------------------------------------------------------------------
+# Service de conversion
+# ---------------------------------------------------------------------------
+
+class ConversionService:
+    """
+    Opérations de conversion d'un processus résident, sur un cache partagé.
+
+    Args:
+        cache: Cache de blocs (défaut : MemoryBlockCache sans cache disque)
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else MemoryBlockCache()
+
+    def warm_up(self):
+        """Compile les expressions régulières et importe les convertisseurs."""
+        convert_text(
+            '```plantuml\n@startuml\nA -> B : x\n@enduml\n```\n'
+            '```dot\ndigraph { a -> b }\n```\n'
+        )
+
+    def convert_text(self, text):
+        result = convert_text(text, cache=self.cache)
+        return {
+            'text': result.text,
+            'blocks': [
+                {
+                    'type': block.type,
+                    'subtype': block.subtype,
+                    'start': block.start,
+                    'end': block.end,
+                    'converted': block.converted,
+                    'cached': block.cached,
+                    'warning': block.warning,
+                }
+                for block in result.blocks
+            ],
+            'converted': result.converted,
+            'cached': result.cached,
+            'warnings': result.warnings,
+        }
+
+    def convert_file(self, path, output=None):
+        return convert_path(path, output, echo=silent, cache=self.cache)
+
+    def list_blocks(self, text):
+        blocks = []
+        line = 0
+        position = 0
+        for block in extract_code_blocks(text):
+            line += text.count('\n', position, block['start'])
+            position = block['start']
+            blocks.append({
+                'type': block['type'],
+                'subtype': diagram_subtype(block['type'], block['content']),
+                'start': block['start'],
+                'end': block['end'],
+                'line': line,
+            })
+        return blocks
+
+
+# ---------------------------------------------------------------------------
+# Répartition JSON-RPC
+# ---------------------------------------------------------------------------
+
+def _param(params, name, required=True):
+    value = params.get(name) if isinstance(params, dict) else None
+    if value is None:
+        if required:
+            raise RpcError(INVALID_PARAMS, f"Paramètre manquant : {name}")
+        return None
+    if not isinstance(value, str):
+        raise RpcError(INVALID_PARAMS, f"Paramètre {name} : chaîne attendue")
+    return value
+
+
+class JsonRpcServer:
+    """Boucle JSON-RPC : lit les requêtes, appelle le service, écrit les réponses."""
+
+    def __init__(self, service=None):
+        self.service = service if service is not None else ConversionService()
+        self.shutdown_requested = False
+        self.running = True
+        self._methods = {
+            'initialize': self._initialize,
+            'md2mmd/convertText': self._convert_text,
+            'md2mmd/convertFile': self._convert_file,
+            'md2mmd/listBlocks': self._list_blocks,
+            'shutdown': self._shutdown,
+            'exit': self._exit,
+        }
+
+    def _initialize(self, params):
+        return {
+            'serverInfo': {'name': 'vscodiumbench', 'version': CONVERTER_VERSION},
+            'capabilities': {'methods': sorted(self._methods)},
+        }
+
+    def _convert_text(self, params):
+        return self.service.convert_text(_param(params, 'text'))
+
+    def _convert_file(self, params):
+        return self.service.convert_file(_param(params, 'path'), _param(params, 'output', required=False))
+
+    def _list_blocks(self, params):
+        text = _param(params, 'text', required=False)
+        if text is None:
+            path = _param(params, 'path')
+            try:
+                with open(path, encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                raise RpcError(INVALID_PARAMS, f"Lecture impossible : {e}")
+        return self.service.list_blocks(text)
+
+    def _shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def _exit(self, params):
+        self.running = False
+        return None
+
+    def handle(self, body):
+        """
+        Traite un message (bytes) ; retourne la réponse (dict) ou None pour
+        une notification.
+        """
+        try:
+            message = json.loads(body)
+        except (ValueError, UnicodeDecodeError) as e:
+            return _error(None, PARSE_ERROR, f"JSON invalide : {e}")
+
+        if not isinstance(message, dict) or not isinstance(message.get('method'), str):
+            return _error(message.get('id') if isinstance(message, dict) else None,
+                          INVALID_REQUEST, "Requête invalide")
+
+        request_id = message.get('id')
+        is_notification = 'id' not in message
+        method = self._methods.get(message['method'])
+        try:
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Méthode inconnue : {message['method']}")
+            result = method(message.get('params'))
+        except RpcError as e:
+            return None if is_notification else _error(request_id, e.code, e.message)
+        except Exception as e:
+            return None if is_notification else _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+
+        if is_notification:
+            return None
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    def serve(self, reader, writer):
+        """Traite les messages jusqu'à la notification exit ou la fin du flux."""
+        while self.running:
+            body = read_message(reader)
+            if body is None:
+                break
+            response = self.handle(body)
+            if response is not None:
+                write_message(writer, response)
+        return 0 if self.shutdown_requested or self.running else 1
+
+
+def _error(request_id, code, message):
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def serve_stdio(cache=None):
+    """Sert les requêtes sur stdin/stdout ; retourne le code de sortie."""
+    server = JsonRpcServer(ConversionService(cache))
+    server.service.warm_up()
+    print("[INFO] md2mmd serve : JSON-RPC sur stdio (Content-Length)", file=sys.stderr)
+    return server.serve(sys.stdin.buffer, sys.stdout.buffer)
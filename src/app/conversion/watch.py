@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Surveillance des fichiers Markdown et reconversion à la volée (md2mmd --watch)
+
+Deux observateurs partagent la même interface wait(timeout) -> {Path} :
+- InotifyWatcher : notifications du noyau Linux (inotify via ctypes),
+  réveil immédiat à l'enregistrement ;
+- PollingWatcher : comparaison périodique des (mtime, taille), utilisé
+  ailleurs que sous Linux ou si inotify est indisponible.
+
+La boucle watch() regroupe les rafales d'enregistrements (anti-rebond),
+puis reconvertit uniquement les fichiers modifiés. Le processus reste
+résident : un cache mémoire des blocs évite de reconvertir les diagrammes
+inchangés d'un fichier modifié.
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+import fnmatch
+import threading
+from pathlib import Path
+
+from .cache import MemoryBlockCache
+from .core import (
+    CONVERTER_VERSION,
+    GLOB_CHARS,
+    collect_markdown_files,
+    convert_path,
+    is_source_markdown,
+    silent,
+)
+from .manifest import update_manifests
+
+DEFAULT_DEBOUNCE = 0.05
+DEFAULT_POLL_INTERVAL = 0.1
+
+
+# ---------------------------------------------------------------------------
+# Cibles surveillées
+# ---------------------------------------------------------------------------
+
+class WatchTargets:
+    """
+    Traduit les entrées de la ligne de commande (fichiers, répertoires, glob)
+    en répertoires à observer et en filtre sur les chemins modifiés.
+    """
+
+    def __init__(self, inputs):
+        self.inputs = [str(item) for item in inputs]
+        self.files = set()
+        self.trees = set()
+        self.patterns = []
+        self.pattern_roots = set()
+
+        for item in self.inputs:
+            if GLOB_CHARS.intersection(item):
+                self.patterns.append(os.path.abspath(item))
+                self.pattern_roots.add(self._glob_root(item))
+            elif Path(item).is_dir():
+                self.trees.add(Path(item).resolve())
+            else:
+                self.files.add(Path(item).resolve())
+
+    @staticmethod
+    def _glob_root(pattern):
+        """Plus long préfixe sans caractère joker d'un motif glob."""
+        parts = []
+        for part in Path(pattern).parts:
+            if GLOB_CHARS.intersection(part):
+                break
+            parts.append(part)
+        return Path(*parts).resolve() if parts else Path.cwd()
+
+    def directories(self):
+        """Répertoires à observer : arborescences complètes et parents des fichiers."""
+        dirs = {path.parent for path in self.files}
+        for tree in self.trees | self.pattern_roots:
+            if tree.is_dir():
+                dirs.add(tree)
+                for root, subdirs, _files in os.walk(tree):
+                    dirs.update(Path(root) / name for name in subdirs)
+        return dirs
+
+    def accepts(self, path):
+        """Vrai si un chemin modifié doit être reconverti."""
+        path = Path(path)
+        if not is_source_markdown(path):
+            return False
+        resolved = path.resolve()
+        if resolved in self.files:
+            return True
+        if any(fnmatch.fnmatch(str(resolved), pattern) for pattern in self.patterns):
+            return True
+        return any(tree in resolved.parents for tree in self.trees)
+
+
+# ---------------------------------------------------------------------------
+# Observateurs
+# ---------------------------------------------------------------------------
+
+class PollingWatcher:
+    """Observateur portable par comparaison périodique des dates de modification."""
+
+    def __init__(self, inputs, interval=DEFAULT_POLL_INTERVAL):
+        self.inputs = list(inputs)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for path in collect_markdown_files(self.inputs):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path.resolve()] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        """Attend au plus `timeout` secondes ; retourne les fichiers créés ou modifiés."""
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {path for path, stamp in snapshot.items() if self._snapshot.get(path) != stamp}
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Observateur Linux basé sur inotify (ctypes), sans dépendance externe."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, inputs):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 a échoué')
+        self._dirs = {}
+        self.targets = WatchTargets(inputs)
+        for directory in self.targets.directories():
+            self._add_watch(directory)
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), self.MASK)
+        if wd >= 0:
+            self._dirs[wd] = Path(directory)
+
+    def wait(self, timeout):
+        """Attend au plus `timeout` secondes ; retourne les fichiers créés ou modifiés."""
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, mask, _cookie, length = struct.unpack_from('iIII', data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b'\0')
+            offset += 16 + length
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._add_watch(path)
+                continue
+            if self.targets.accepts(path):
+                changed.add(path.resolve())
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(inputs, poll=False):
+    """Retourne un InotifyWatcher si disponible, sinon un PollingWatcher."""
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(inputs)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(inputs)
+
+
+# ---------------------------------------------------------------------------
+# Boucle de surveillance
+# ---------------------------------------------------------------------------
+
+def _convert_one(path, cache, echo, manifest=False):
+    started = time.perf_counter()
+    stats = convert_path(path, echo=silent, cache=cache, manifest=manifest)
+    if manifest and stats['ok']:
+        update_manifests([stats['manifest']], CONVERTER_VERSION)
+    elapsed = (time.perf_counter() - started) * 1000
+    if stats['ok']:
+        reused = f", {stats['cached']} inchangé(s)" if stats['cached'] else ''
+        echo(f"[OK] {path} : {stats['converted']} diagramme(s){reused} en {elapsed:.1f} ms")
+    else:
+        echo(f"{stats['error']} ({path})")
+    return stats
+
+
+def watch(inputs, cache=None, debounce=DEFAULT_DEBOUNCE, poll=False, stop=None, echo=print, manifest=False):
+    """
+    Surveille des fichiers Markdown et les reconvertit à chaque enregistrement.
+
+    Tous les fichiers sont convertis une première fois au démarrage, ce qui
+    remplit le cache mémoire ; ensuite seuls les fichiers modifiés sont
+    reconvertis, et leurs blocs inchangés viennent du cache.
+
+    Args:
+        inputs: Chemins, répertoires ou motifs glob
+        cache: Cache de blocs (défaut : MemoryBlockCache sans cache disque)
+        debounce: Délai de calme (s) avant de traiter une rafale d'événements
+        poll: Force l'observateur par scrutation des dates de modification
+        stop: threading.Event optionnel pour arrêter la boucle
+        echo: Fonction d'affichage des messages
+        manifest: Tient à jour les manifestes des sorties (md2mmd --check)
+    """
+    cache = cache if cache is not None else MemoryBlockCache()
+    stop = stop or threading.Event()
+    watcher = make_watcher(inputs, poll)
+    echo(f"[INFO] Surveillance ({type(watcher).__name__}) — Ctrl+C pour arrêter")
+
+    try:
+        for path in collect_markdown_files(inputs):
+            _convert_one(path, cache, echo, manifest)
+
+        while not stop.is_set():
+            changed = watcher.wait(0.25)
+            if not changed:
+                continue
+            # Anti-rebond : attendre que la rafale d'enregistrements se calme
+            while not stop.is_set():
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+            for path in sorted(changed):
+                if path.is_file():
+                    _convert_one(path, cache, echo, manifest)
+    finally:
+        watcher.close()
@@ -9,7 +9,9 @@ from pathlib import Path
 
 from src.app.conversion.commands.md2mmd import (
     extract_code_blocks,
+    scan_fences,
     sanitize_node_id,
+    NodeIdAllocator,
     detect_plantuml_type,
     convert_plantuml_sequence,
     convert_plantuml_class,
@@ -18,7 +20,20 @@ from src.app.conversion.commands.md2mmd import (
     convert_dot_graph,
     convert_diagram,
     convert_file,
+    convert_text,
+    convert_bytes,
+    ConversionResult,
+    render_replacement,
+    assemble_segments,
+    convert_stream,
+    collect_markdown_files,
+    convert_batch,
+    has_diagram_fence,
+    convert_path,
+    BLOCK_PARALLEL_MIN,
 )
+from src.app.conversion.cache import MemoryBlockCache
+from src.app.conversion.metrics import Metrics
 
 
 # ===========================================================================
@@ -154,6 +169,69 @@ class TestExtractCodeBlocks:
         blocks = extract_code_blocks("")
         assert blocks == []
 
+    def test_tilde_fence(self):
+        content = "~~~plantuml\n@startuml\n[*] --> A\n@enduml\n~~~\n"
+        blocks = extract_code_blocks(content)
+        assert len(blocks) == 1
+        assert blocks[0]['content'] == "@startuml\n[*] --> A\n@enduml\n"
+
+    def test_longer_backtick_fence_contains_shorter(self):
+        content = "````dot\ndigraph { \"A\" -> \"B\"; }\n```\n````\n"
+        blocks = extract_code_blocks(content)
+        assert len(blocks) == 1
+        assert blocks[0]['content'].endswith("```\n")
+
+    def test_closing_fence_must_match_char(self):
+        content = "~~~dot\ndigraph {}\n```\n~~~\n"
+        blocks = extract_code_blocks(content)
+        assert len(blocks) == 1
+        assert '```' in blocks[0]['content']
+
+    def test_indented_fence_dedented(self):
+        content = "- item\n  ```plantuml\n  @startuml\n  [*] --> A\n  @enduml\n  ```\n"
+        blocks = extract_code_blocks(content)
+        assert len(blocks) == 1
+        assert blocks[0]['indent'] == 2
+        assert blocks[0]['content'].startswith("@startuml\n")
+        assert blocks[0]['start'] == content.index("  ```plantuml")
+
+    def test_four_spaces_is_not_a_fence(self):
+        content = "    ```plantuml\n    @startuml\n    ```\n"
+        assert extract_code_blocks(content) == []
+
+    def test_info_string_with_extra_words(self):
+        content = "```plantuml title=\"x\"\n@startuml\n@enduml\n```\n"
+        blocks = extract_code_blocks(content)
+        assert blocks[0]['type'] == 'plantuml'
+
+    def test_unclosed_fence_ignored(self):
+        content = "```plantuml\n@startuml\n[*] --> A\n"
+        assert extract_code_blocks(content) == []
+
+    def test_unclosed_fence_swallows_rest_of_document(self):
+        content = "```text\nnon fermé\n```plantuml\n@startuml\n@enduml\n"
+        assert extract_code_blocks(content) == []
+
+    def test_nested_fence_text_is_content(self):
+        content = "```\n```plantuml\n@startuml\n@enduml\n```\n"
+        assert extract_code_blocks(content) == []
+
+    def test_crlf_line_endings(self):
+        content = "```plantuml\r\n@startuml\r\n@enduml\r\n```\r\nFin\r\n"
+        blocks = extract_code_blocks(content)
+        assert len(blocks) == 1
+        assert content[blocks[0]['end']:].startswith("\r\n")
+
+    def test_scan_fences_reports_all_languages(self):
+        content = "```python\nx = 1\n```\n\n```\nbrut\n```\n"
+        langs = [f['lang'] for f in scan_fences(content)]
+        assert langs == ['python', '']
+
+    def test_adversarial_unclosed_fences(self):
+        """10k clôtures non fermées : aucun bloc et pas d'explosion quadratique."""
+        content = "```plantuml\n@startuml\nA -> B\n" * 10000
+        assert extract_code_blocks(content) == []
+
 
 # ===========================================================================
 # Tests : sanitize_node_id
@@ -197,6 +275,49 @@ class TestSanitizeNodeId:
         assert result == "Service_Auth"
 
 
+# ===========================================================================
+# Tests : NodeIdAllocator
+# ===========================================================================
+
+class TestNodeIdAllocator:
+    """Tests pour l'allocation mémoïsée des identifiants de nœuds."""
+
+    def test_same_label_same_id(self):
+        allocate = NodeIdAllocator()
+        assert allocate("API Gateway") == allocate("API Gateway") == "API_Gateway"
+        assert len(allocate) == 1
+
+    def test_colliding_labels_get_suffix(self):
+        allocate = NodeIdAllocator()
+        assert allocate("A B") == "A_B"
+        assert allocate("A-B") == "A_B_2"
+        assert allocate("A.B") == "A_B_3"
+
+    def test_suffix_does_not_steal_natural_id(self):
+        allocate = NodeIdAllocator()
+        allocate("A B")
+        assert allocate("A-B") == "A_B_2"
+        assert allocate("A_B_2") == "A_B_2_2"
+
+    def test_deterministic(self):
+        labels = ["x y", "x-y", "Données", "Donnees", "1er"]
+        assert [NodeIdAllocator()(l) for l in labels] == [NodeIdAllocator()(l) for l in labels]
+        first = NodeIdAllocator()
+        assert [first(l) for l in labels] == ["x_y", "x_y_2", "Donnees", "Donnees_2", "N_1er"]
+
+    def test_matches_sanitize_node_id_without_collision(self):
+        for label in ["Frontend", "Service Auth", "Node-1.5", "_private", "Données", "", "1-First"]:
+            assert NodeIdAllocator()(label) == sanitize_node_id(label)
+
+    def test_reserved_word_suffixed(self):
+        assert NodeIdAllocator()("end") == "end_2"
+
+    def test_distinct_key_distinct_id(self):
+        allocate = NodeIdAllocator()
+        assert allocate("cluster_a") == "cluster_a"
+        assert allocate("cluster_a", key=("subgraph", "cluster_a")) == "cluster_a_2"
+
+
 # ===========================================================================
 # Tests : detect_plantuml_type
 # ===========================================================================
@@ -377,8 +498,62 @@ class TestConvertDotDigraph:
     def test_simple_digraph(self):
         content = 'digraph { "A" -> "B"; "B" -> "C"; }'
         mermaid, _ = convert_dot_digraph(content)
-        assert 'A["A"] --> B["B"]' in mermaid
-        assert 'B["B"] --> C["C"]' in mermaid
+        assert mermaid.splitlines()[1:] == [
+            '    A["A"]',
+            '    B["B"]',
+            '    C["C"]',
+            '    A --> B',
+            '    B --> C',
+        ]
+
+    def test_node_declared_once(self):
+        content = 'digraph { "Hub central" -> "A"; "Hub central" -> "B"; "C" -> "Hub central"; }'
+        mermaid, _ = convert_dot_digraph(content)
+        assert mermaid.count('"Hub central"') == 1
+        assert '    Hub_central --> A' in mermaid.splitlines()
+        assert '    C --> Hub_central' in mermaid.splitlines()
+
+    def test_unquoted_ids(self):
+        mermaid, _ = convert_dot_digraph('digraph { web -> api; }')
+        assert 'web["web"]' in mermaid
+        assert 'web --> api' in mermaid
+
+    def test_edge_chain(self):
+        mermaid, _ = convert_dot_digraph('digraph { a -> b -> c; }')
+        assert 'a --> b' in mermaid
+        assert 'b --> c' in mermaid
+
+    def test_node_label_attribute(self):
+        mermaid, _ = convert_dot_digraph('digraph { db [label="Base"]; api -> db; }')
+        assert 'db["Base"]' in mermaid
+
+    def test_edge_label(self):
+        mermaid, _ = convert_dot_digraph('digraph { a -> b [label="appelle"]; }')
+        assert 'a -->|"appelle"| b' in mermaid
+
+    def test_isolated_node_declared(self):
+        mermaid, _ = convert_dot_digraph('digraph { seul; a -> b; }')
+        assert '    seul["seul"]' in mermaid.splitlines()
+
+    def test_cluster_becomes_subgraph(self):
+        content = 'digraph { subgraph cluster_back { label="Back-end"; api -> db } web -> api }'
+        mermaid, _ = convert_dot_digraph(content)
+        assert 'subgraph cluster_back["Back-end"]' in mermaid
+        assert 'end' in mermaid.splitlines()[-1]
+
+    def test_quotes_in_label_escaped(self):
+        mermaid, _ = convert_dot_digraph(r'digraph { "dit \"oui\"" -> b }')
+        assert '#quot;oui#quot;' in mermaid
+
+    def test_colliding_labels_stay_distinct(self):
+        mermaid, _ = convert_dot_digraph('digraph { "A B" -> "A-B"; }')
+        assert 'A_B["A B"]' in mermaid
+        assert 'A_B_2["A-B"]' in mermaid
+        assert 'A_B --> A_B_2' in mermaid
+
+    def test_comments_ignored(self):
+        mermaid, _ = convert_dot_digraph('digraph { // "X" -> "Y"\n a -> b }')
+        assert 'X' not in mermaid
 
 
 # ===========================================================================
@@ -410,6 +585,15 @@ class TestConvertDotGraph:
         _, warning = convert_dot_graph(DOT_GRAPH)
         assert 'layout' in warning.lower() or 'neato' in warning.lower()
 
+    def test_unquoted_chain(self):
+        mermaid, _ = convert_dot_graph('graph { a -- b -- c }')
+        assert 'a <--> b' in mermaid
+        assert 'b <--> c' in mermaid
+
+    def test_rankdir_honoured(self):
+        mermaid, _ = convert_dot_graph('graph { rankdir=LR; a -- b }')
+        assert mermaid.startswith('flowchart LR')
+
     def test_no_layout_no_layout_warning(self):
         content = 'graph { "A" -- "B"; }'
         _, warning = convert_dot_graph(content)
@@ -468,6 +652,35 @@ class TestConvertDiagram:
         assert mermaid is not None
 
 
+# ===========================================================================
+# Tests : assemble_segments
+# ===========================================================================
+
+class TestAssembleSegments:
+    """Tests pour l'assemblage en une passe du document de sortie."""
+
+    def test_no_replacement_returns_content(self):
+        assert ''.join(assemble_segments("abc", [])) == "abc"
+
+    def test_replacements_in_order(self):
+        content = "0123456789"
+        result = ''.join(assemble_segments(content, [(1, 3, "X"), (5, 6, "Y")]))
+        assert result == "0X34Y6789"
+
+    def test_replacement_at_boundaries(self):
+        content = "abcdef"
+        result = ''.join(assemble_segments(content, [(0, 2, "<"), (4, 6, ">")]))
+        assert result == "<cd>"
+
+    def test_matches_reverse_splicing(self):
+        content = "".join(f"bloc{i}-" for i in range(50))
+        replacements = [(i * 7, i * 7 + 4, f"[{i}]") for i in range(50)]
+        expected = content
+        for start, end, text in reversed(replacements):
+            expected = expected[:start] + text + expected[end:]
+        assert ''.join(assemble_segments(content, replacements)) == expected
+
+
 # ===========================================================================
 # Tests : convert_file (I/O)
 # ===========================================================================
@@ -537,6 +750,16 @@ class TestConvertFile:
         output = (tmp_path / "plain.mmd.md").read_text(encoding='utf-8')
         assert '# Juste du texte' in output
 
+    def test_indented_block_keeps_indentation(self, tmp_path):
+        input_file = tmp_path / "liste.md"
+        input_file.write_text(
+            "- étape\n  ```plantuml\n  @startuml\n  [*] --> S1\n  @enduml\n  ```\n",
+            encoding='utf-8'
+        )
+        convert_file(str(input_file))
+        output = (tmp_path / "liste.mmd.md").read_text(encoding='utf-8')
+        assert "  ```mermaid\n  stateDiagram-v2\n      [*] --> S1\n  ```\n" in output
+
     def test_mixed_plantuml_and_dot(self, tmp_path):
         input_file = tmp_path / "multi.md"
         input_file.write_text(
@@ -550,6 +773,392 @@ class TestConvertFile:
         assert 'flowchart' in output
 
 
+# ===========================================================================
+# Tests : convert_text (API en mémoire)
+# ===========================================================================
+
+class TestConvertText:
+    """Tests pour la conversion en mémoire, sans fichier ni affichage."""
+
+    def test_matches_convert_file(self, tmp_path, capsys):
+        content = STREAM_DOCUMENTS[2]
+        source = tmp_path / "doc.md"
+        source.write_text(content, encoding='utf-8')
+        convert_file(source)
+        capsys.readouterr()
+
+        result = convert_text(content)
+        assert result.text == (tmp_path / "doc.mmd.md").read_text(encoding='utf-8')
+        assert capsys.readouterr().out == ''
+
+    def test_block_records(self):
+        content = "Intro\n```plantuml\n" + PLANTUML_STATE + "```\n```dot\n" + DOT_GRAPH + "```\n"
+        result = convert_text(content)
+        assert [(b.type, b.subtype) for b in result.blocks] == [('plantuml', 'state'), ('dot', 'graph')]
+        first = result.blocks[0]
+        assert content[first.start:first.end].startswith('```plantuml')
+        assert content[first.start:first.end].endswith('```')
+        assert all(b.converted and not b.cached for b in result.blocks)
+        assert result.converted == 2
+        assert result.warnings == sum(b.warning is not None for b in result.blocks)
+
+    def test_without_diagram_returns_input(self):
+        content = "# Titre\n\n```python\nprint(1)\n```\n"
+        result = convert_text(content)
+        assert result == ConversionResult(content)
+        assert result.text is content
+
+    def test_cache_hits(self):
+        from src.app.conversion.cache import MemoryBlockCache
+
+        cache = MemoryBlockCache()
+        content = "```dot\n" + DOT_DIGRAPH + "```\n"
+        first = convert_text(content, cache=cache)
+        second = convert_text(content, cache=cache)
+        assert second.text == first.text
+        assert second.cached == 1 and second.blocks[0].cached
+
+
+class TestConvertBytes:
+    """Tests pour la conversion d'un document en octets (objet git, entrée d'archive)."""
+
+    @pytest.mark.parametrize("index", [0, 2, 9])
+    def test_matches_convert_file(self, tmp_path, capsys, index):
+        data = STREAM_DOCUMENTS[index].encode('utf-8')
+        source = tmp_path / "doc.md"
+        source.write_bytes(data)
+        convert_file(source)
+        capsys.readouterr()
+
+        converted, _counts = convert_bytes(data)
+        assert converted == (tmp_path / "doc.mmd.md").read_bytes()
+
+    def test_without_fence_returned_as_is(self):
+        data = "# Titre\n\nSans diagramme.\n".encode('utf-8')
+        converted, counts = convert_bytes(data)
+        assert converted is data
+        assert counts['skipped'] and counts['blocks'] == 0
+
+    def test_counts(self):
+        converted, counts = convert_bytes(("```dot\n" + DOT_DIGRAPH + "```\n").encode('utf-8'))
+        assert counts['converted'] == counts['blocks'] == 1 and not counts['skipped']
+        assert b'```mermaid' in converted
+
+    def test_invalid_utf8(self):
+        with pytest.raises(UnicodeDecodeError):
+            convert_bytes(b"```dot\n\xc0\n```\n")
+
+
+# ===========================================================================
+# Tests : conversion au fil de l'eau
+# ===========================================================================
+
+STREAM_DOCUMENTS = [
+    "# Titre\n\nAucun diagramme.\n",
+    "```plantuml\n" + PLANTUML_SEQUENCE + "```\n",
+    "Avant\n```dot\n" + DOT_DIGRAPH + "```\nAprès\n```graphviz\n" + DOT_GRAPH + "```",
+    "```python\nprint('x')\n```\n```plantuml\n" + PLANTUML_STATE + "```\nFin\n",
+    "- liste\n  ```plantuml\n  @startuml\n  [*] --> A\n  @enduml\n  ```\n",
+    "````markdown\n```plantuml\n@startuml\n@enduml\n```\n````\n",
+    "~~~plantuml\n" + PLANTUML_CLASS + "~~~\n",
+    "```plantuml\n@startuml\n[*] --> A\n",
+    "```text\nnon fermé\n```plantuml\n@startuml\n@enduml\n```\n",
+    "```plantuml\r\n@startuml\r\n[*] --> A\r\n@enduml\r\n```\r\nFin\r\n",
+]
+
+
+class TestConvertStream:
+    """Tests pour la conversion incrémentale (mémoire bornée)."""
+
+    @pytest.mark.parametrize('content', STREAM_DOCUMENTS)
+    def test_stream_matches_in_memory(self, content):
+        replacements = []
+        for block in extract_code_blocks(content):
+            mermaid_code, warning = convert_diagram(block['type'], block['content'])
+            replacements.append((block['start'], block['end'],
+                                 render_replacement(block, mermaid_code, warning)))
+        expected = ''.join(assemble_segments(content, replacements))
+
+        out = []
+        convert_stream(content.splitlines(keepends=True), out.append)
+        assert ''.join(out) == expected
+
+    def test_stream_counts(self):
+        content = STREAM_DOCUMENTS[2]
+        counts = convert_stream(content.splitlines(keepends=True), lambda _text: None)
+        assert counts['blocks'] == 2
+        assert counts['converted'] == 2
+        assert counts['warnings'] == 2
+
+    def test_stream_writes_before_end_of_input(self):
+        """Le texte précédant un bloc est écrit avant la lecture de la suite."""
+        out = []
+
+        def lines():
+            yield "Introduction\n"
+            assert out == ["Introduction\n"]
+            yield "```plantuml\n"
+            yield "[*] --> A\n"
+            yield "```\n"
+            assert 'stateDiagram-v2' in ''.join(out)
+
+        convert_stream(lines(), out.append)
+
+    def test_convert_file_stream_matches(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(''.join(STREAM_DOCUMENTS), encoding='utf-8')
+        convert_file(source, tmp_path / "memoire.mmd.md")
+        convert_file(source, tmp_path / "flux.mmd.md", stream=True)
+        assert (tmp_path / "flux.mmd.md").read_bytes() == (tmp_path / "memoire.mmd.md").read_bytes()
+
+
+# ===========================================================================
+# Tests : traitement par lot
+# ===========================================================================
+
+class TestBatch:
+    """Tests pour la conversion par lot (répertoires, glob, pool de processus)."""
+
+    def _make_tree(self, root):
+        (root / "sub").mkdir()
+        (root / "a.md").write_text(
+            "```plantuml\n@startuml\n[*] --> S1\n@enduml\n```\n", encoding='utf-8'
+        )
+        (root / "sub" / "b.md").write_text(
+            '```dot\ndigraph { node [shape=box]; "A" -> "B"; }\n```\n', encoding='utf-8'
+        )
+        (root / "sub" / "c.md").write_text("# Sans diagramme\n", encoding='utf-8')
+        (root / "notes.txt").write_text("ignoré", encoding='utf-8')
+
+    def test_collect_directory_recursive(self, tmp_path):
+        self._make_tree(tmp_path)
+        names = sorted(p.name for p in collect_markdown_files([tmp_path]))
+        assert names == ['a.md', 'b.md', 'c.md']
+
+    def test_collect_skips_outputs(self, tmp_path):
+        self._make_tree(tmp_path)
+        (tmp_path / "a.mmd.md").write_text("sortie", encoding='utf-8')
+        names = [p.name for p in collect_markdown_files([tmp_path])]
+        assert 'a.mmd.md' not in names
+
+    def test_collect_glob_without_duplicates(self, tmp_path):
+        self._make_tree(tmp_path)
+        files = collect_markdown_files([str(tmp_path / "**" / "*.md"), tmp_path / "a.md"])
+        assert len(files) == 3
+
+    def test_batch_report_counts(self, tmp_path):
+        self._make_tree(tmp_path)
+        report = convert_batch([tmp_path], jobs=2)
+        assert report['files'] == 3
+        assert report['blocks'] == 2
+        assert report['converted'] == 2
+        assert report['warnings'] == 1
+        assert report['failed'] == []
+        assert report['elapsed'] >= 0
+
+    def test_batch_output_matches_convert_file(self, tmp_path):
+        self._make_tree(tmp_path)
+        convert_batch([tmp_path], jobs=2)
+        batch_outputs = {
+            p: p.read_text(encoding='utf-8') for p in tmp_path.rglob('*.mmd.md')
+        }
+        for output in batch_outputs:
+            output.unlink()
+        for source in collect_markdown_files([tmp_path]):
+            convert_file(source)
+        for output, content in batch_outputs.items():
+            assert output.read_text(encoding='utf-8') == content
+
+    def test_batch_empty_input(self, tmp_path):
+        report = convert_batch([tmp_path])
+        assert report['files'] == 0
+        assert report['failed'] == []
+
+
+# ===========================================================================
+# Tests : préfiltre sur octets
+# ===========================================================================
+
+class TestPrefilter:
+    """Tests pour has_diagram_fence et la recopie des fichiers sans diagramme."""
+
+    @pytest.mark.parametrize('data', [
+        b"```plantuml\n@startuml\n@enduml\n```\n",
+        b"  ~~~~ DOT\ndigraph { a -> b }\n~~~~\n",
+        b"````\tGraphviz\ngraph {}\n````\n",
+    ])
+    def test_detects_supported_fences(self, data):
+        assert has_diagram_fence(data)
+
+    @pytest.mark.parametrize('data', [
+        b"",
+        b"# Titre\n\nTexte sur plantuml et dot.\n",
+        b"```python\nprint('dot')\n```\n",
+    ])
+    def test_rejects_documents_without_work(self, data):
+        assert not has_diagram_fence(data)
+
+    def test_skipped_file_copied_byte_for_byte(self, tmp_path):
+        source = tmp_path / "notes.md"
+        source.write_bytes("# Notes\n\n```python\nprint(1)\n```\n".encode('utf-8'))
+        stats = convert_path(source, echo=lambda *_: None)
+        assert stats['ok'] and stats['skipped']
+        assert (tmp_path / "notes.mmd.md").read_bytes() == source.read_bytes()
+
+    def test_crlf_file_keeps_newline_normalisation(self, tmp_path):
+        source = tmp_path / "crlf.md"
+        source.write_bytes(b"# Titre\r\nTexte\r\n")
+        stats = convert_path(source, echo=lambda *_: None)
+        assert stats['ok'] and not stats['skipped']
+        assert (tmp_path / "crlf.mmd.md").read_bytes() == b"# Titre\nTexte\n"
+
+    def test_crlf_platform_translates_skipped_file(self, tmp_path, monkeypatch):
+        import os
+
+        monkeypatch.setattr(os, 'linesep', '\r\n')
+        source = tmp_path / "notes.md"
+        source.write_bytes(b"# Notes\nTexte\n")
+        stats = convert_path(source, echo=lambda *_: None)
+        assert stats['ok'] and not stats['skipped']
+        assert (tmp_path / "notes.mmd.md").read_bytes() == b"# Notes\r\nTexte\r\n"
+        assert convert_bytes(b"# Notes\nTexte\n")[0] == b"# Notes\r\nTexte\r\n"
+
+    def test_batch_reports_skipped(self, tmp_path):
+        (tmp_path / "a.md").write_text("```dot\ndigraph { a -> b }\n```\n", encoding='utf-8')
+        (tmp_path / "b.md").write_text("# Sans diagramme\n", encoding='utf-8')
+        (tmp_path / "c.md").write_text("", encoding='utf-8')
+        report = convert_batch([tmp_path], jobs=1)
+        assert report['skipped'] == 2
+        assert report['converted'] == 1
+
+
+# ===========================================================================
+# Tests : conversion parallèle des blocs d'un document
+# ===========================================================================
+
+class TestBlockJobs:
+    """Tests pour block_jobs : sortie identique à la conversion séquentielle."""
+
+    def _large_document(self):
+        parts = ["# Architecture\n\n"]
+        for index in range(BLOCK_PARALLEL_MIN):
+            parts.append(f"## Vue {index}\n\n")
+            if index % 3 == 0:
+                parts.append(f"```plantuml\n@startuml\nA{index} -> B : appel\n@enduml\n```\n\n")
+            elif index % 3 == 1:
+                parts.append(f'```dot\ndigraph {{ "n{index}" -> "m"; }}\n```\n\n')
+            else:
+                # Blocs identiques : convertis une seule fois par le pool
+                parts.append("  ```dot\n  graph { a -- b }\n  ```\n\n")
+        return ''.join(parts)
+
+    def test_output_identical_to_serial(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(self._large_document(), encoding='utf-8')
+        assert convert_file(source, tmp_path / "serial.mmd.md")
+        assert convert_file(source, tmp_path / "parallel.mmd.md", block_jobs=2)
+        assert (tmp_path / "parallel.mmd.md").read_bytes() == (tmp_path / "serial.mmd.md").read_bytes()
+
+    def test_counts_and_cache_match_serial(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(self._large_document(), encoding='utf-8')
+        serial_cache, parallel_cache = MemoryBlockCache(), MemoryBlockCache()
+        serial_metrics, parallel_metrics = Metrics(), Metrics()
+        convert_file(source, tmp_path / "a.mmd.md", cache=serial_cache, metrics=serial_metrics)
+        convert_file(source, tmp_path / "b.mmd.md", cache=parallel_cache, metrics=parallel_metrics, block_jobs=2)
+
+        def summary(metrics):
+            return [(b['type'], b['subtype'], b['start'], b['cached'], b['warning'])
+                    for b in metrics.files[0]['blocks']]
+
+        assert summary(parallel_metrics) == summary(serial_metrics)
+        assert len(parallel_cache) == len(serial_cache)
+
+        # Deuxième passe : tout vient du cache, aucun worker n'est démarré
+        rerun = Metrics()
+        convert_file(source, tmp_path / "b.mmd.md", cache=parallel_cache, metrics=rerun, block_jobs=2)
+        assert all(block['cached'] for block in rerun.files[0]['blocks'])
+
+    def test_small_document_stays_serial(self, tmp_path, monkeypatch):
+        from src.app.conversion import core
+
+        def fail(*args):
+            raise AssertionError("pool démarré pour un petit document")
+
+        monkeypatch.setattr(core, '_convert_blocks_parallel', fail)
+        source = tmp_path / "doc.md"
+        source.write_text("```dot\ndigraph { a -> b }\n```\n", encoding='utf-8')
+        assert convert_file(source, block_jobs=4)
+
+
+# ===========================================================================
+# Tests : entrée / sortie standard ('-')
+# ===========================================================================
+
+class TestStdio:
+    """Tests pour md2mmd - et -o - dans un pipeline shell."""
+
+    def _run(self, monkeypatch, argv, stdin=''):
+        import io
+        import sys
+        from src.app.conversion.commands import md2mmd
+
+        monkeypatch.setattr(sys, 'argv', ['md2mmd', '--no-cache'] + argv)
+        monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(stdin.encode('utf-8'))))
+        monkeypatch.setattr(md2mmd, '_fix_stdout_encoding', lambda: None)
+        return md2mmd.main()
+
+    def test_stdin_to_stdout(self, monkeypatch, capsys):
+        content = STREAM_DOCUMENTS[2]
+        assert self._run(monkeypatch, ['-'], content) == 0
+        captured = capsys.readouterr()
+        assert captured.out == convert_text(content).text
+        assert '[OK]' in captured.err
+
+    def test_file_to_stdout(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "doc.md"
+        source.write_text(STREAM_DOCUMENTS[1], encoding='utf-8')
+        assert self._run(monkeypatch, [str(source), '-o', '-']) == 0
+        captured = capsys.readouterr()
+        assert captured.out == convert_text(STREAM_DOCUMENTS[1]).text
+        assert not (tmp_path / "doc.mmd.md").exists()
+
+    def test_stdin_to_file(self, tmp_path, monkeypatch, capsys):
+        target = tmp_path / "out.md"
+        assert self._run(monkeypatch, ['-', '-o', str(target)], STREAM_DOCUMENTS[1]) == 0
+        assert target.read_text(encoding='utf-8') == convert_text(STREAM_DOCUMENTS[1]).text
+        assert capsys.readouterr().out == ''
+
+    def test_stdin_to_hardlinked_output_keeps_source(self, tmp_path, monkeypatch, capsys):
+        source = tmp_path / "a.md"
+        source.write_text("# Sans diagramme\n", encoding='utf-8')
+        assert convert_file(source, link='hardlink')
+        target = tmp_path / "a.mmd.md"
+        assert self._run(monkeypatch, ['-', '-o', str(target)], "autre\n") == 0
+        assert target.read_text(encoding='utf-8') == "autre\n"
+        assert source.read_text(encoding='utf-8') == "# Sans diagramme\n"
+
+    def test_stdin_to_unchanged_file_not_rewritten(self, tmp_path, monkeypatch, capsys):
+        import os
+
+        target = tmp_path / "out.md"
+        target.write_text(convert_text(STREAM_DOCUMENTS[1]).text, encoding='utf-8')
+        os.utime(target, ns=(10**9, 10**9))
+        assert self._run(monkeypatch, ['-', '-o', str(target)], STREAM_DOCUMENTS[1]) == 0
+        assert os.stat(target).st_mtime_ns == 10**9
+        assert 'Déjà à jour' in capsys.readouterr().err
+
+    def test_missing_input_reports_on_stderr(self, tmp_path, monkeypatch, capsys):
+        assert self._run(monkeypatch, [str(tmp_path / "absent.md"), '-o', '-']) == 1
+        captured = capsys.readouterr()
+        assert captured.out == ''
+        assert '[ERREUR]' in captured.err
+
+    def test_metrics_json_rejected_on_stdout(self, monkeypatch):
+        with pytest.raises(SystemExit):
+            self._run(monkeypatch, ['-', '--metrics', 'json'])
+
+
 # ===========================================================================
 # Tests : gestion des erreurs
 # ===========================================================================
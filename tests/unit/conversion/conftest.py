@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures communes aux tests de src/app/conversion
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.invalid', *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def git():
+    """git(repo, *args) : commande git avec une identité de test, échec = exception."""
+    return _git
+
+
+@pytest.fixture
+def make_repo(tmp_path):
+    """
+    make_repo({chemin: texte}) : dépôt git tmp_path/repo avec ces fichiers
+    dans un premier commit ; retourne la racine du dépôt.
+    """
+    def make(files, message='initial'):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _git(repo, 'init', '-q')
+        for name, content in files.items():
+            path = repo / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding='utf-8')
+        _git(repo, 'add', '.')
+        _git(repo, 'commit', '-q', '-m', message)
+        return repo
+
+    return make
+
+
+@pytest.fixture
+def run_md2mmd(monkeypatch):
+    """run_md2mmd(*args) : md2mmd.main() sans cache disque ; retourne le code de sortie."""
+    from src.app.conversion.commands import md2mmd
+
+    monkeypatch.setattr(md2mmd, '_fix_stdout_encoding', lambda: None)
+
+    def run(*args):
+        monkeypatch.setattr(sys, 'argv', ['md2mmd', '--no-cache', *map(str, args)])
+        return md2mmd.main()
+
+    return run
+
+
+@pytest.fixture
+def expected_output(tmp_path):
+    """expected_output(texte) : octets qu'écrit convert_file pour ce document."""
+    from src.app.conversion.commands.md2mmd import convert_file
+
+    def expected(content):
+        source = tmp_path / "expected.md"
+        source.write_text(content, encoding='utf-8')
+        convert_file(source)
+        return (tmp_path / "expected.mmd.md").read_bytes()
+
+    return expected
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/archive.py
+"""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from src.app.conversion.archive import (
+    TarWriter,
+    ZipWriter,
+    archive_compression,
+    archive_kind,
+    convert_archive,
+)
+
+DOCUMENT = "```dot\ndigraph { a -> b }\n```\n"
+NOTES = "# Notes\n"
+BINARY = bytes(range(256)) * 4
+
+
+def _tar(path, entries, symlink=None):
+    """Archive tar d'entrée : {nom: octets}, dans l'ordre, plus un lien symbolique éventuel."""
+    with tarfile.open(path, 'w:gz') as tar:
+        for name, data in entries.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o640
+            info.mtime = 1600000000
+            tar.addfile(info, io.BytesIO(data))
+        if symlink:
+            info = tarfile.TarInfo(symlink[0])
+            info.type = tarfile.SYMTYPE
+            info.linkname = symlink[1]
+            tar.addfile(info)
+
+
+def _zip(path, entries):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(zipfile.ZipInfo("docs/"), b'')
+        for name, data in entries.items():
+            archive.writestr(name, data)
+
+
+ENTRIES = {
+    "docs/archi.md": DOCUMENT.encode('utf-8'),
+    "docs/archi.mmd.md": b"ancienne sortie\n",
+    "docs/notes.md": NOTES.encode('utf-8'),
+    "docs/logo.bin": BINARY,
+}
+
+
+class TestArchiveCompression:
+    """Tests pour la détection du format d'archive."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("out.tar", ''),
+        ("out.tar.gz", 'gz'),
+        ("OUT.TGZ", 'gz'),
+        ("out.tar.xz", 'xz'),
+        ("out.zip", None),
+        ("out", None),
+        ("out.mmd.md", None),
+    ])
+    def test_suffixes(self, name, expected):
+        assert archive_compression(name) == expected
+
+    @pytest.mark.parametrize("name, expected", [
+        ("out.tgz", 'tar'),
+        ("out.ZIP", 'zip'),
+        ("out.md", None),
+    ])
+    def test_kind(self, name, expected):
+        assert archive_kind(name) == expected
+
+
+class TestTarWriter:
+    """Tests pour l'écriture d'archives tar."""
+
+    def test_entries_and_mtime(self, tmp_path):
+        target = tmp_path / "out.tar.gz"
+        with TarWriter(target, mtime=1700000000) as archive:
+            archive.add("docs/a.mmd.md", b"contenu\n")
+        with tarfile.open(target) as tar:
+            member = tar.getmember("docs/a.mmd.md")
+            assert member.mtime == 1700000000 and member.mode == 0o644
+            assert tar.extractfile(member).read() == b"contenu\n"
+
+    def test_reproducible(self, tmp_path):
+        outputs = []
+        for name in ("first.tar", "second.tar"):
+            with TarWriter(tmp_path / name, mtime=1) as archive:
+                archive.add("a.mmd.md", b"x")
+            outputs.append((tmp_path / name).read_bytes())
+        assert outputs[0] == outputs[1]
+
+    def test_failure_keeps_previous_archive(self, tmp_path):
+        target = tmp_path / "out.tar"
+        target.write_bytes(b"ancienne")
+        with pytest.raises(RuntimeError):
+            with TarWriter(target) as archive:
+                archive.add("a.mmd.md", b"x")
+                raise RuntimeError("interrompu")
+        assert target.read_bytes() == b"ancienne"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.tar"]
+
+    def test_unknown_suffix(self, tmp_path):
+        with pytest.raises(ValueError):
+            TarWriter(tmp_path / "out.rar")
+
+
+class TestZipWriter:
+    """Tests pour l'écriture d'archives zip."""
+
+    def test_entries(self, tmp_path):
+        target = tmp_path / "out.zip"
+        with ZipWriter(target, mtime=0) as archive:
+            archive.add("docs/a.mmd.md", b"contenu\n")
+        with zipfile.ZipFile(target) as result:
+            info = result.getinfo("docs/a.mmd.md")
+            assert info.date_time[0] == 1980
+            assert (info.external_attr >> 16) & 0o777 == 0o644
+            assert result.read(info) == b"contenu\n"
+
+
+# ===========================================================================
+# Tests : conversion d'archive à archive
+# ===========================================================================
+
+class TestConvertArchive:
+    """Tests pour convert_archive (tar et zip, sans extraction)."""
+
+    def test_tar(self, tmp_path, expected_output):
+        source, target = tmp_path / "in.tar.gz", tmp_path / "out.tar.xz"
+        _tar(source, ENTRIES, symlink=("docs/latest.md", "archi.md"))
+        report = convert_archive(source, target)
+        assert report['files'] == 2 and report['converted'] == 1 and report['skipped'] == 1
+        with tarfile.open(target) as tar:
+            assert tar.getnames() == [
+                "docs/archi.md", "docs/archi.mmd.md", "docs/notes.md", "docs/notes.mmd.md",
+                "docs/logo.bin", "docs/latest.md",
+            ]
+            output = tar.getmember("docs/archi.mmd.md")
+            assert (output.mode, output.mtime) == (0o640, 1600000000)
+            assert tar.extractfile(output).read() == expected_output(DOCUMENT)
+            assert tar.extractfile("docs/logo.bin").read() == BINARY
+            assert tar.getmember("docs/latest.md").issym()
+        assert report['entries'] == 6
+
+    def test_zip(self, tmp_path, expected_output):
+        source, target = tmp_path / "in.zip", tmp_path / "out.zip"
+        _zip(source, ENTRIES)
+        report = convert_archive(source, target)
+        with zipfile.ZipFile(target) as result:
+            assert result.namelist() == [
+                "docs/", "docs/archi.md", "docs/archi.mmd.md", "docs/notes.md", "docs/notes.mmd.md",
+                "docs/logo.bin",
+            ]
+            assert result.read("docs/archi.mmd.md") == expected_output(DOCUMENT)
+            assert result.read("docs/notes.mmd.md") == NOTES.encode('utf-8')
+            assert result.read("docs/logo.bin") == BINARY
+        assert report['converted'] == 1 and not report['failed']
+
+    def test_invalid_utf8_reported(self, tmp_path):
+        source, target = tmp_path / "in.tar", tmp_path / "out.tar"
+        _tar(source, {"bad.md": b"```dot\n\xc0\n```\n", "ok.md": DOCUMENT.encode('utf-8')})
+        report = convert_archive(source, target)
+        assert [failure['path'] for failure in report['failed']] == [f"{source}:bad.md"]
+        with tarfile.open(target) as tar:
+            assert tar.getnames() == ["bad.md", "ok.md", "ok.mmd.md"]
+
+    def test_format_mismatch(self, tmp_path):
+        source = tmp_path / "in.zip"
+        _zip(source, ENTRIES)
+        with pytest.raises(ValueError):
+            convert_archive(source, tmp_path / "out.tar.gz")
+
+    def test_corrupt_input_keeps_previous_output(self, tmp_path):
+        source, target = tmp_path / "in.tar.gz", tmp_path / "out.tar.gz"
+        source.write_bytes(b"pas une archive")
+        target.write_bytes(b"ancienne")
+        with pytest.raises(tarfile.TarError):
+            convert_archive(source, target)
+        assert target.read_bytes() == b"ancienne"
+
+
+class TestCliArchive:
+    """Tests de la ligne de commande md2mmd <archive> -o <archive>."""
+
+    def test_archive_to_archive(self, tmp_path, capsys, run_md2mmd):
+        source, target = tmp_path / "in.zip", tmp_path / "out.zip"
+        _zip(source, ENTRIES)
+        assert run_md2mmd(str(source), '-o', str(target)) == 0
+        assert '6 entrée(s) écrite(s)' in capsys.readouterr().out
+        assert not list(tmp_path.glob("*.mmd.md"))
+
+    def test_output_required(self, tmp_path, run_md2mmd):
+        source = tmp_path / "in.tar"
+        _tar(source, ENTRIES)
+        with pytest.raises(SystemExit):
+            run_md2mmd(str(source))
+
+    def test_unreadable_archive(self, tmp_path, capsys, run_md2mmd):
+        source = tmp_path / "in.zip"
+        source.write_bytes(b"pas une archive")
+        assert run_md2mmd(str(source), '-o', str(tmp_path / "out.zip")) == 1
+        assert 'Archive illisible' in capsys.readouterr().out
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/cache.py
+"""
+
+import os
+import pytest
+
+from src.app.conversion.cache import BlockCache, MemoryBlockCache, _disk_usage
+from src.app.conversion.commands.md2mmd import convert_block, convert_file
+
+
+# ===========================================================================
+# Tests : BlockCache
+# ===========================================================================
+
+class TestBlockCache:
+    """Tests pour le cache disque des blocs convertis."""
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = BlockCache(tmp_path, version='1')
+        assert cache.get('dot', 'digraph {}') is None
+        cache.put('dot', 'digraph {}', 'flowchart TD\n', None)
+        assert cache.get('dot', 'digraph {}') == ('flowchart TD\n', None)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_warning_roundtrip(self, tmp_path):
+        cache = BlockCache(tmp_path, version='1')
+        cache.put('plantuml', 'x', 'sequenceDiagram', '<!-- ATTENTION -->')
+        assert cache.get('plantuml', 'x') == ('sequenceDiagram', '<!-- ATTENTION -->')
+
+    def test_key_depends_on_version_type_and_content(self, tmp_path):
+        v1 = BlockCache(tmp_path, version='1')
+        v2 = BlockCache(tmp_path, version='2')
+        assert v1.key('dot', 'a') != v2.key('dot', 'a')
+        assert v1.key('dot', 'a') != v1.key('graphviz', 'a')
+        assert v1.key('dot', 'a') != v1.key('dot', 'b')
+
+    def test_version_change_invalidates(self, tmp_path):
+        BlockCache(tmp_path, version='1').put('dot', 'a', 'ancien', None)
+        assert BlockCache(tmp_path, version='2').get('dot', 'a') is None
+
+    def test_persistent_across_instances(self, tmp_path):
+        BlockCache(tmp_path, version='1').put('dot', 'a', 'flowchart TD', None)
+        assert BlockCache(tmp_path, version='1').get('dot', 'a') == ('flowchart TD', None)
+
+    def test_prune_evicts_least_recently_used(self, tmp_path):
+        cache = BlockCache(tmp_path, version='1', max_bytes=10**6)
+        for i, name in enumerate(('ancien', 'recent', 'utilise')):
+            cache.put('dot', name, 'x' * 100, None)
+            path = cache._entry_path(cache.key('dot', name))
+            os.utime(path, (1000 + i, 1000 + i))
+        # Un accès rafraîchit l'entrée la plus ancienne
+        assert cache.get('dot', 'ancien') is not None
+        entry_size = _disk_usage(cache._entry_path(cache.key('dot', 'recent')).stat())
+        cache.max_bytes = entry_size * 2
+        assert cache.prune() == 1
+        assert cache.get('dot', 'recent') is None
+        assert cache.get('dot', 'ancien') is not None
+        assert cache.get('dot', 'utilise') is not None
+
+    def test_prune_under_cap_keeps_everything(self, tmp_path):
+        cache = BlockCache(tmp_path, version='1')
+        cache.put('dot', 'a', 'x', None)
+        assert cache.prune() == 0
+
+    def test_prune_counts_allocated_blocks(self, tmp_path):
+        if not hasattr(os.stat_result, 'st_blocks'):
+            pytest.skip("st_blocks indisponible")
+        cache = BlockCache(tmp_path, version='1')
+        cache.put('dot', 'a', 'x', None)
+        path = cache._entry_path(cache.key('dot', 'a'))
+        if not path.stat().st_blocks:
+            pytest.skip("système de fichiers sans blocs alloués")
+        # Quelques octets de contenu, mais au moins un bloc sur disque
+        cache.max_bytes = path.stat().st_size * 2
+        assert cache.prune() == 1
+
+    def test_prune_without_new_entries_reads_only_the_index(self, tmp_path, monkeypatch):
+        cache = BlockCache(tmp_path, version='1')
+        for name in ('a', 'b', 'c'):
+            cache.put('dot', name, 'x', None)
+        for subdir in tmp_path.iterdir():
+            if subdir.is_dir():
+                os.utime(subdir, (1000, 1000))
+        assert cache.prune() == 0
+
+        def scan(name):
+            raise AssertionError(f"sous-répertoire relu : {name}")
+
+        monkeypatch.setattr(cache, '_entries', scan)
+        assert cache.prune() == 0
+
+    def test_prune_counts_entries_added_since_index(self, tmp_path):
+        cache = BlockCache(tmp_path, version='1')
+        cache.put('dot', 'ancien', 'x' * 100, None)
+        old = cache._entry_path(cache.key('dot', 'ancien'))
+        os.utime(old, (1000, 1000))
+        os.utime(old.parent, (1000, 1000))
+        assert cache.prune() == 0
+
+        cache.put('dot', 'nouveau', 'x' * 100, None)
+        cache.max_bytes = _disk_usage(old.stat())
+        assert cache.prune() == 1
+        assert cache.get('dot', 'ancien') is None
+        assert cache.get('dot', 'nouveau') is not None
+
+    def test_unwritable_directory_is_not_fatal(self, tmp_path):
+        blocker = tmp_path / "fichier"
+        blocker.write_text("", encoding='utf-8')
+        cache = BlockCache(blocker / "cache", version='1')
+        cache.put('dot', 'a', 'x', None)
+        assert cache.get('dot', 'a') is None
+
+
+# ===========================================================================
+# Tests : intégration avec md2mmd
+# ===========================================================================
+
+class TestCacheIntegration:
+    """Tests pour l'utilisation du cache par convert_block et convert_file."""
+
+    def test_convert_block_uses_cache(self, tmp_path):
+        cache = BlockCache(tmp_path, version='1')
+        first = convert_block('dot', 'digraph { "A" -> "B"; }', cache)
+        second = convert_block('dot', 'digraph { "A" -> "B"; }', cache)
+        assert first[2] is False
+        assert second[2] is True
+        assert first[:2] == second[:2]
+
+    def test_cached_output_identical(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(
+            "```plantuml\n@startuml\n[*] --> S1\n@enduml\n```\n\n"
+            '```dot\ndigraph { node [shape=box]; "A" -> "B"; }\n```\n',
+            encoding='utf-8'
+        )
+        cache = BlockCache(tmp_path / "cache", version='1')
+        convert_file(source, cache=cache)
+        first = (tmp_path / "doc.mmd.md").read_text(encoding='utf-8')
+        convert_file(source, cache=cache)
+        assert (tmp_path / "doc.mmd.md").read_text(encoding='utf-8') == first
+        assert cache.hits == 2
+
+
+# ===========================================================================
+# Tests : MemoryBlockCache
+# ===========================================================================
+
+class TestMemoryBlockCache:
+    """Tests pour le cache mémoire LRU des processus résidents."""
+
+    def test_miss_then_hit(self):
+        cache = MemoryBlockCache()
+        assert cache.get('dot', 'a') is None
+        cache.put('dot', 'a', 'flowchart TD', None)
+        assert cache.get('dot', 'a') == ('flowchart TD', None)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction(self):
+        cache = MemoryBlockCache(max_entries=2)
+        cache.put('dot', 'a', 'A', None)
+        cache.put('dot', 'b', 'B', None)
+        cache.get('dot', 'a')
+        cache.put('dot', 'c', 'C', None)
+        assert len(cache) == 2
+        assert cache.get('dot', 'b') is None
+        assert cache.get('dot', 'a') == ('A', None)
+
+    def test_backend_fallback_and_write_through(self, tmp_path):
+        disk = BlockCache(tmp_path, version='1')
+        disk.put('dot', 'ancien', 'X', None)
+        cache = MemoryBlockCache(backend=disk)
+        assert cache.get('dot', 'ancien') == ('X', None)
+        cache.put('dot', 'nouveau', 'Y', 'w')
+        assert BlockCache(tmp_path, version='1').get('dot', 'nouveau') == ('Y', 'w')
+
+    def test_picklable_for_process_workers(self, tmp_path):
+        import pickle
+
+        cache = MemoryBlockCache(backend=BlockCache(tmp_path, version='1'))
+        cache.put('dot', 'a', 'A', None)
+        copy = pickle.loads(pickle.dumps(cache))
+        assert copy.get('dot', 'a') == ('A', None)
+        assert copy.backend.get('dot', 'a') == ('A', None)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/core.py
+
+Les convertisseurs eux-mêmes sont couverts par commands/test_md2mmd.py, au
+travers des noms que la commande réexporte.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.app.conversion import core
+from src.app.conversion.commands import md2mmd
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+
+class TestCoreApi:
+    """Tests pour l'API publique du cœur de conversion."""
+
+    def test_convert_path_statistics(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text("```dot\ndigraph { a -> b }\n```\n", encoding='utf-8')
+        stats = core.convert_path(source, echo=core.silent)
+        assert stats['ok'] and stats['converted'] == 1
+        assert (tmp_path / "doc.mmd.md").exists()
+
+    def test_source_markdown_and_output_name(self):
+        assert core.is_source_markdown(Path("a.md"))
+        assert not core.is_source_markdown(Path("a.mmd.md"))
+        assert core.output_name("docs/a.md") == "docs/a.mmd.md"
+
+    def test_command_reexports_core(self):
+        assert md2mmd.convert_file is core.convert_file
+        assert md2mmd.CONVERTER_VERSION == core.CONVERTER_VERSION
+
+    def test_results_exposed_on_demand(self):
+        from src.app.conversion import results
+
+        assert md2mmd.__getattr__ is core.__getattr__
+        assert md2mmd.ConversionResult is core.ConversionResult is results.ConversionResult
+        assert md2mmd.BlockResult is results.BlockResult
+
+    @pytest.mark.parametrize("module", ['watch', 'server', 'httpd', 'revision', 'archive', 'manifest'])
+    def test_library_modules_do_not_load_the_command(self, module):
+        code = (
+            f"import sys, app.conversion.{module}\n"
+            "sys.exit('app.conversion.commands.md2mmd' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=str(SRC)))
+        assert result.returncode == 0
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/dot.py
+"""
+
+import pytest
+
+from src.app.conversion.dot import (
+    tokenize,
+    header_directed,
+    parse_dot,
+    flatten,
+    NodeStmt,
+    EdgeStmt,
+    AttrStmt,
+    Subgraph,
+)
+
+
+# ===========================================================================
+# Tests : tokenize
+# ===========================================================================
+
+class TestTokenize:
+    """Tests pour le découpage lexical DOT."""
+
+    def test_unquoted_and_quoted_ids(self):
+        tokens = tokenize('a -> "B c"')
+        assert tokens == [('id', 'a'), ('edgeop', '->'), ('id', 'B c')]
+
+    def test_keywords_case_insensitive(self):
+        assert tokenize('DiGraph Node')[0] == ('keyword', 'digraph')
+        assert tokenize('DiGraph Node')[1] == ('keyword', 'node')
+
+    def test_escaped_quote(self):
+        assert tokenize(r'"dit \"oui\""') == [('id', 'dit "oui"')]
+
+    def test_numerals_and_html(self):
+        tokens = tokenize('-1.5 <<b>gras</b>>')
+        assert tokens == [('id', '-1.5'), ('id', '<b>gras</b>')]
+
+    def test_comments_ignored(self):
+        text = '// ligne\n/* bloc\n sur deux lignes */\n  # préprocesseur\na'
+        assert tokenize(text) == [('id', 'a')]
+
+    def test_accented_identifier(self):
+        assert tokenize('Dépendances') == [('id', 'Dépendances')]
+
+    def test_undirected_edge_op(self):
+        assert tokenize('a--b')[1] == ('edgeop', '--')
+
+
+# ===========================================================================
+# Tests : parse_dot
+# ===========================================================================
+
+class TestParseDot:
+    """Tests pour l'analyse syntaxique DOT."""
+
+    def test_header(self):
+        graph = parse_dot('strict digraph G { }')
+        assert graph.directed is True
+        assert graph.strict is True
+        assert graph.id == 'G'
+
+    def test_undirected_header(self):
+        assert parse_dot('graph { }').directed is False
+
+    def test_missing_header(self):
+        graph = parse_dot('{ "A" -> "B"; }')
+        assert graph.directed is None
+        assert isinstance(graph.body.stmts[0], EdgeStmt)
+
+    def test_edge_chain_with_attributes(self):
+        stmt = parse_dot('digraph { a -> b -> c [label="x"] }').body.stmts[0]
+        assert stmt.endpoints == ['a', 'b', 'c']
+        assert stmt.attrs == {'label': 'x'}
+
+    def test_node_statement(self):
+        stmt = parse_dot('digraph { a [label="Alpha", shape=box]; }').body.stmts[0]
+        assert stmt == NodeStmt('a', {'label': 'Alpha', 'shape': 'box'})
+
+    def test_attr_statements_and_assignment(self):
+        stmts = parse_dot('digraph { rankdir=LR; node [shape=box]; edge [color=red] }').body.stmts
+        assert stmts[0] == AttrStmt('graph', {'rankdir': 'LR'})
+        assert stmts[1] == AttrStmt('node', {'shape': 'box'})
+        assert stmts[2] == AttrStmt('edge', {'color': 'red'})
+
+    def test_subgraph(self):
+        stmt = parse_dot('digraph { subgraph cluster_a { label="A"; x -> y } }').body.stmts[0]
+        assert isinstance(stmt, Subgraph)
+        assert stmt.id == 'cluster_a'
+        assert stmt.node_ids() == ['x', 'y']
+        assert stmt.attrs() == {'label': 'A'}
+
+    def test_subgraph_as_endpoint(self):
+        stmt = parse_dot('digraph { a -> {b c} }').body.stmts[0]
+        assert stmt.endpoints[0] == 'a'
+        assert stmt.endpoints[1].node_ids() == ['b', 'c']
+
+    def test_ports_ignored(self):
+        stmt = parse_dot('digraph { a:p1:n -> b:s }').body.stmts[0]
+        assert stmt.endpoints == ['a', 'b']
+
+    def test_malformed_input_does_not_raise(self):
+        graph = parse_dot('digraph { a -> ; ] = [ -> } }')
+        assert graph.directed is True
+
+    def test_unterminated_input_does_not_raise(self):
+        parse_dot('digraph { a -> b [label="x"')
+
+    @pytest.mark.parametrize('text', [
+        'digraph { a -> b }',
+        'strict graph G { a -- b }',
+        '// réseau\ngraph G { a -- b }',
+        '/* titre */ # ligne\n# autre\nSTRICT DIGRAPH { }',
+        '{ a -> b }',
+        '"graph" { }',
+        'strict strict graph { }',
+        '',
+    ])
+    def test_header_directed_matches_parse_dot(self, text):
+        assert header_directed(text) is parse_dot(text).directed
+
+
+# ===========================================================================
+# Tests : flatten
+# ===========================================================================
+
+class TestFlatten:
+    """Tests pour la mise à plat consommée par les convertisseurs."""
+
+    def test_chain_expanded(self):
+        flat = flatten(parse_dot('digraph { a -> b -> c }'))
+        assert [(s, t) for s, t, _ in flat.edges] == [('a', 'b'), ('b', 'c')]
+
+    def test_subgraph_endpoint_expanded(self):
+        flat = flatten(parse_dot('digraph { a -> {b c} -> d }'))
+        assert [(s, t) for s, t, _ in flat.edges] == [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd')]
+
+    def test_nodes_in_first_appearance_order(self):
+        flat = flatten(parse_dot('digraph { z; a -> z; b [label="B"] }'))
+        assert list(flat.nodes) == ['z', 'a', 'b']
+        assert flat.nodes['b'] == {'label': 'B'}
+
+    def test_clusters_nested(self):
+        flat = flatten(parse_dot(
+            'digraph { subgraph cluster_o { label="Ext"; a; subgraph cluster_i { b } } }'
+        ))
+        assert len(flat.clusters) == 1
+        cluster_id, label, members, nested = flat.clusters[0]
+        assert (cluster_id, label, members) == ('cluster_o', 'Ext', ['a', 'b'])
+        assert nested[0][:3] == ('cluster_i', 'cluster_i', ['b'])
+
+    def test_non_cluster_subgraph_not_drawn(self):
+        flat = flatten(parse_dot('digraph { subgraph s { rank=same; a; b } }'))
+        assert flat.clusters == []
+        assert list(flat.nodes) == ['a', 'b']
+
+    def test_graph_attrs_and_node_defaults(self):
+        flat = flatten(parse_dot('graph { layout=neato; node [shape=circle] }'))
+        assert flat.graph_attrs == {'layout': 'neato'}
+        assert flat.has_node_defaults is True
+
+    def test_large_graph_single_pass(self):
+        body = '\n'.join(f'n{i} -> n{i + 1};' for i in range(50000))
+        flat = flatten(parse_dot('digraph {' + body + '}'))
+        assert len(flat.edges) == 50000
+        assert len(flat.nodes) == 50001
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/executor.py
+"""
+
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.app.conversion.cache import BlockCache, MemoryBlockCache
+from src.app.conversion.commands.md2mmd import convert_batch, convert_text
+from src.app.conversion.executor import gil_enabled, pool_executor, resolve_executor
+from src.app.conversion.metrics import Metrics
+
+DOCUMENT = (
+    "# Titre\n\n"
+    "```plantuml\n@startuml\nA -> B : ping\n@enduml\n```\n\n"
+    "```dot\ngraph { a -- b }\n```\n"
+)
+
+
+# ===========================================================================
+# Tests : choix du pool
+# ===========================================================================
+
+class TestResolveExecutor:
+    """Tests pour la détection du GIL et le choix threads / processus."""
+
+    def test_gil_enabled_without_probe(self, monkeypatch):
+        monkeypatch.delattr(sys, '_is_gil_enabled', raising=False)
+        assert gil_enabled()
+        assert resolve_executor() == 'process'
+
+    def test_auto_uses_threads_without_gil(self, monkeypatch):
+        monkeypatch.setattr(sys, '_is_gil_enabled', lambda: False, raising=False)
+        assert resolve_executor('auto') == 'thread'
+        with pool_executor(2) as pool:
+            assert isinstance(pool, ThreadPoolExecutor)
+
+    def test_explicit_kind(self, monkeypatch):
+        monkeypatch.setattr(sys, '_is_gil_enabled', lambda: False, raising=False)
+        assert resolve_executor('process') == 'process'
+        with pool_executor(1, 'process') as pool:
+            assert isinstance(pool, ProcessPoolExecutor)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            resolve_executor('fibres')
+
+
+# ===========================================================================
+# Tests : lot sur pool de threads
+# ===========================================================================
+
+class TestThreadBatch:
+    """Tests pour convert_batch(executor='thread')."""
+
+    def _corpus(self, root):
+        for index in range(6):
+            (root / f"doc{index}.md").write_text(DOCUMENT + f"\nFichier {index}\n", encoding='utf-8')
+
+    def test_outputs_match_process_pool(self, tmp_path):
+        self._corpus(tmp_path)
+        convert_batch([tmp_path], jobs=3, executor='process')
+        expected = {path: path.read_bytes() for path in tmp_path.glob('*.mmd.md')}
+        report = convert_batch([tmp_path], jobs=3, executor='thread')
+        assert report['failed'] == []
+        assert {path: path.read_bytes() for path in tmp_path.glob('*.mmd.md')} == expected
+
+    def test_metrics_in_file_order(self, tmp_path):
+        self._corpus(tmp_path)
+        metrics = Metrics()
+        convert_batch([tmp_path], jobs=3, executor='thread', metrics=metrics)
+        paths = [record['path'] for record in metrics.files]
+        assert paths == sorted(paths)
+        assert metrics.to_dict()['totals']['blocks'] == 12
+
+    def test_shared_disk_cache(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        self._corpus(tmp_path / "src")
+        cache = BlockCache(tmp_path / "cache", '4')
+        convert_batch([tmp_path / "src"], jobs=3, cache=cache, executor='thread')
+        report = convert_batch([tmp_path / "src"], jobs=3, cache=cache, executor='thread')
+        assert report['cached'] == report['converted'] == 12
+
+    def test_shared_disk_cache_process_pool(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        self._corpus(tmp_path / "src")
+        cache = BlockCache(tmp_path / "cache", '4')
+        first = convert_batch([tmp_path / "src"], jobs=3, cache=cache, executor='process')
+        assert first['failed'] == []
+        report = convert_batch([tmp_path / "src"], jobs=3, cache=cache, executor='process')
+        assert report['cached'] == report['converted'] == 12
+
+
+# ===========================================================================
+# Tests : caches partagés entre threads
+# ===========================================================================
+
+class TestThreadSafety:
+    """Conversions concurrentes sur un même cache mémoire borné."""
+
+    def test_memory_cache_concurrent_conversions(self):
+        cache = MemoryBlockCache(max_entries=8)
+        expected = {index: convert_text(DOCUMENT.replace('ping', f'ping{index}')).text for index in range(32)}
+        errors = []
+
+        def work(offset):
+            try:
+                for step in range(64):
+                    index = (offset + step) % 32
+                    text = convert_text(DOCUMENT.replace('ping', f'ping{index}'), cache=cache).text
+                    assert text == expected[index]
+            except Exception as e:  # remonté au thread principal
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(cache) <= 8
+        assert cache.hits + cache.misses == 8 * 64 * 2
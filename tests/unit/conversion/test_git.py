@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/git.py (dépôts git temporaires)
+"""
+
+import shutil
+
+import pytest
+
+from src.app.conversion.git import CatFile, GitError, changed_files, commit_info, tree_blobs
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git absent")
+
+DOCUMENT = "```dot\ndigraph { a -> b }\n```\n"
+
+
+@pytest.fixture
+def repo(make_repo):
+    return make_repo({f"docs/{name}": DOCUMENT for name in ("a.md", "b.md", "notes.txt")})
+
+
+# ===========================================================================
+# Tests : changed_files
+# ===========================================================================
+
+class TestChangedFiles:
+    """Tests pour la liste des fichiers modifiés (git diff --name-only)."""
+
+    def test_since_ref_includes_worktree_changes(self, repo):
+        (repo / "docs" / "a.md").write_text(DOCUMENT + "\nSuite\n", encoding='utf-8')
+        assert changed_files('HEAD', cwd=repo) == [repo / "docs" / "a.md"]
+
+    def test_staged_only(self, repo, git):
+        (repo / "docs" / "a.md").write_text("modifié\n", encoding='utf-8')
+        (repo / "docs" / "c.md").write_text(DOCUMENT, encoding='utf-8')
+        git(repo, 'add', 'docs/c.md')
+        assert changed_files(staged=True, cwd=repo) == [repo / "docs" / "c.md"]
+
+    def test_deleted_files_excluded(self, repo, git):
+        git(repo, 'rm', '-q', 'docs/b.md')
+        assert changed_files('HEAD', staged=True, cwd=repo) == []
+
+    def test_paths_from_root_despite_diff_relative(self, repo, git):
+        git(repo, 'config', 'diff.relative', 'true')
+        (repo / "docs" / "a.md").write_text(DOCUMENT + "\nSuite\n", encoding='utf-8')
+        assert changed_files('HEAD', cwd=repo / "docs") == [repo / "docs" / "a.md"]
+
+    def test_merge_base_range(self, repo, git):
+        git(repo, 'branch', 'base')
+        git(repo, 'checkout', '-q', '-b', 'feature')
+        (repo / "docs" / "b.md").write_text("branche\n", encoding='utf-8')
+        git(repo, 'commit', '-q', '-am', 'feature')
+        git(repo, 'checkout', '-q', 'base')
+        (repo / "docs" / "a.md").write_text("principale\n", encoding='utf-8')
+        git(repo, 'commit', '-q', '-am', 'base')
+        git(repo, 'checkout', '-q', 'feature')
+        # Seuls les changements de la branche depuis la base de fusion
+        assert changed_files('base...', cwd=repo) == [repo / "docs" / "b.md"]
+        assert changed_files('base..feature', cwd=repo) == [repo / "docs" / "a.md", repo / "docs" / "b.md"]
+
+    def test_staged_without_commit(self, tmp_path, git):
+        git(tmp_path, 'init', '-q')
+        (tmp_path / "a.md").write_text(DOCUMENT, encoding='utf-8')
+        git(tmp_path, 'add', 'a.md')
+        assert changed_files(staged=True, cwd=tmp_path) == [tmp_path / "a.md"]
+
+    def test_unknown_ref(self, repo):
+        with pytest.raises(GitError):
+            changed_files('absente', cwd=repo)
+
+
+# ===========================================================================
+# Tests : lecture d'une révision (ls-tree, cat-file --batch)
+# ===========================================================================
+
+class TestRevisionObjects:
+    """Tests pour commit_info, tree_blobs et CatFile."""
+
+    def test_commit_info(self, repo):
+        sha, timestamp = commit_info('HEAD', cwd=repo)
+        assert len(sha) == 40 and timestamp > 0
+
+    def test_tree_blobs_with_pathspec(self, repo, git):
+        (repo / "other").mkdir()
+        (repo / "other" / "c.md").write_text(DOCUMENT, encoding='utf-8')
+        git(repo, 'add', '.')
+        git(repo, 'commit', '-q', '-m', 'other')
+        names = [name for _oid, name in tree_blobs('HEAD', ['docs'], cwd=repo / "other")]
+        assert names == ["docs/a.md", "docs/b.md", "docs/notes.txt"]
+
+    def test_cat_file_reads_several_objects(self, repo):
+        (repo / "docs" / "a.md").write_text("modifié\n", encoding='utf-8')
+        with CatFile(repo) as objects:
+            assert objects.read('HEAD:docs/a.md') == DOCUMENT.encode('utf-8')
+            for oid, _name in tree_blobs('HEAD', cwd=repo):
+                assert objects.read(oid) == DOCUMENT.encode('utf-8')
+
+    def test_cat_file_missing_object(self, repo):
+        with CatFile(repo) as objects:
+            with pytest.raises(GitError):
+                objects.read('HEAD:absent.md')
+            # Le processus reste utilisable après un objet absent
+            assert objects.read('HEAD:docs/b.md') == DOCUMENT.encode('utf-8')
+
+
+# ===========================================================================
+# Tests : md2mmd --since / --staged
+# ===========================================================================
+
+class TestCliGit:
+    """Tests de la ligne de commande dans un dépôt temporaire."""
+
+    @pytest.fixture(autouse=True)
+    def _in_repo(self, monkeypatch, repo):
+        monkeypatch.chdir(repo)
+
+    def test_staged_converts_only_index(self, repo, capsys, git, run_md2mmd):
+        (repo / "docs" / "b.md").write_text(DOCUMENT + "\n# Modifié\n", encoding='utf-8')
+        git(repo, 'add', 'docs/b.md')
+        assert run_md2mmd('--staged') == 0
+        assert (repo / "docs" / "b.mmd.md").exists()
+        assert not (repo / "docs" / "a.mmd.md").exists()
+        assert '1 fichier(s) analysé(s)' in capsys.readouterr().out
+
+    def test_since_with_pathspec(self, repo, git, run_md2mmd):
+        (repo / "other").mkdir()
+        (repo / "other" / "c.md").write_text(DOCUMENT, encoding='utf-8')
+        (repo / "docs" / "a.md").write_text(DOCUMENT + "\nSuite\n", encoding='utf-8')
+        git(repo, 'add', '.')
+        assert run_md2mmd('--since', 'HEAD', 'docs') == 0
+        assert (repo / "docs" / "a.mmd.md").exists()
+        assert not (repo / "other" / "c.mmd.md").exists()
+
+    def test_nothing_changed(self, capsys, run_md2mmd):
+        assert run_md2mmd('--since', 'HEAD') == 0
+        assert 'Aucun fichier Markdown modifié' in capsys.readouterr().out
+
+    def test_git_error(self, capsys, run_md2mmd):
+        assert run_md2mmd('--since', 'absente') == 1
+        assert '[ERREUR] git' in capsys.readouterr().out
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/httpd.py (client local uniquement)
+"""
+
+import http.client
+import threading
+
+import pytest
+
+from src.app.conversion.commands.md2mmd import convert_text
+from src.app.conversion.httpd import (
+    ConversionEndpoint,
+    ConversionHTTPServer,
+    content_etag,
+    etag_matches,
+)
+
+DOCUMENT = (
+    "# Titre\n\n"
+    "```plantuml\n@startuml\nA -> B : ping\n@enduml\n```\n\n"
+    "```dot\ngraph { a -- b }\n```\n"
+)
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "doc.md").write_text(DOCUMENT, encoding='utf-8')
+    (tmp_path / "notes.txt").write_text("texte", encoding='utf-8')
+    endpoint = ConversionEndpoint(tmp_path, max_entries=2)
+    httpd = ConversionHTTPServer(('127.0.0.1', 0), endpoint, quiet=True)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+def request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+# ===========================================================================
+# Tests : ETag
+# ===========================================================================
+
+class TestEtag:
+    """Tests pour l'empreinte et la comparaison If-None-Match."""
+
+    def test_content_etag_is_stable_and_quoted(self):
+        assert content_etag(b'abc') == content_etag(b'abc')
+        assert content_etag(b'abc') != content_etag(b'abd')
+        assert content_etag(b'abc').startswith('"') and content_etag(b'abc').endswith('"')
+
+    def test_etag_matches(self):
+        etag = content_etag(b'abc')
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"autre", W/{etag}', etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches('"autre"', etag)
+        assert not etag_matches(None, etag)
+
+
+# ===========================================================================
+# Tests : endpoint et LRU
+# ===========================================================================
+
+class TestConversionEndpoint:
+    """Tests pour la conversion avec LRU des résultats."""
+
+    def test_lru_hits_and_eviction(self):
+        endpoint = ConversionEndpoint(max_entries=2)
+        for source in (b'a\n', b'b\n', b'a\n', b'c\n', b'b\n'):
+            endpoint.convert(source)
+        assert (endpoint.hits, endpoint.misses) == (1, 4)
+        assert len(endpoint._results) == 2
+
+    def test_resolve_stays_under_root(self, tmp_path):
+        endpoint = ConversionEndpoint(tmp_path)
+        assert endpoint.resolve('doc.md') == tmp_path.resolve() / 'doc.md'
+        assert endpoint.resolve('../doc.md') is None
+        assert endpoint.resolve('notes.txt') is None
+        assert ConversionEndpoint().resolve('doc.md') is None
+
+
+# ===========================================================================
+# Tests : serveur HTTP
+# ===========================================================================
+
+class TestConversionHTTPServer:
+    """Tests des routes via http.client sur 127.0.0.1."""
+
+    def test_post_converts_body(self, server):
+        status, headers, body = request(server, 'POST', '/convert', DOCUMENT.encode('utf-8'))
+        assert status == 200
+        assert body.decode('utf-8') == convert_text(DOCUMENT).text
+        assert headers['ETag'] == content_etag(DOCUMENT.encode('utf-8'))
+        assert headers['Content-Type'].startswith('text/markdown')
+
+    def test_if_none_match_returns_304(self, server):
+        _, headers, _ = request(server, 'POST', '/convert', DOCUMENT.encode('utf-8'))
+        status, again, body = request(server, 'POST', '/convert', DOCUMENT.encode('utf-8'),
+                                      {'If-None-Match': headers['ETag']})
+        assert status == 304
+        assert body == b''
+        assert again['ETag'] == headers['ETag']
+
+    def test_get_path_under_root(self, server):
+        status, headers, body = request(server, 'GET', '/convert?path=doc.md')
+        assert status == 200
+        assert 'mermaid' in body.decode('utf-8')
+        status, _, _ = request(server, 'GET', '/convert?path=doc.md', headers={'If-None-Match': headers['ETag']})
+        assert status == 304
+        assert server.endpoint.misses == 1
+
+    def test_get_rejects_escape_and_missing(self, server):
+        assert request(server, 'GET', '/convert?path=../secret.md')[0] == 403
+        assert request(server, 'GET', '/convert?path=notes.txt')[0] == 403
+        assert request(server, 'GET', '/convert?path=absent.md')[0] == 404
+        assert request(server, 'GET', '/ailleurs')[0] == 404
+
+    def test_post_rejects_invalid_utf8(self, server):
+        assert request(server, 'POST', '/convert', b'\xff\xfe')[0] == 400
+
+    def test_rejected_body_closes_connection(self, server):
+        server.max_body = 8
+        status, headers, _body = request(server, 'POST', '/convert', b'x' * 64)
+        assert status == 413
+        assert headers['Connection'] == 'close'
+        # Une nouvelle connexion est servie normalement
+        server.max_body = len(DOCUMENT) * 2
+        assert request(server, 'POST', '/convert', DOCUMENT.encode('utf-8'))[0] == 200
+
+    def test_negative_content_length(self, server):
+        import socket
+
+        with socket.create_connection(server.server_address[:2], timeout=5) as sock:
+            sock.sendall(b'POST /convert HTTP/1.1\r\nHost: test\r\nContent-Length: -1\r\n\r\n')
+            response = sock.recv(4096)
+        assert response.startswith(b'HTTP/1.1 400')
+        assert b'Connection: close' in response
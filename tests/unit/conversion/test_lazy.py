@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/lazy.py
+"""
+
+import re
+
+import pytest
+
+from src.app.conversion.lazy import LazyPattern
+
+
+class TestLazyPattern:
+    """Tests pour les expressions régulières compilées à la demande."""
+
+    def test_behaves_like_compiled_pattern(self):
+        lazy = LazyPattern(r'^(a+)$', re.MULTILINE)
+        assert [m.group(1) for m in lazy.finditer('a\nb\naa')] == ['a', 'aa']
+        assert lazy.sub('x', 'aa') == 'x'
+        assert lazy.flags & re.MULTILINE
+        assert lazy.groups == 1
+
+    def test_compiles_once(self):
+        lazy = LazyPattern(r'\d+')
+        first = lazy.match
+        assert 'match' in vars(lazy)
+        assert lazy.match is first
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            LazyPattern('a').nope
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/manifest.py
+"""
+
+import json
+
+import pytest
+
+from src.app.conversion import core
+from src.app.conversion.commands.md2mmd import CONVERTER_VERSION, convert_batch, convert_file
+from src.app.conversion.manifest import MANIFEST_NAME, check_outputs, load_manifest
+
+DOCUMENT = (
+    "# Titre\n\n"
+    "```plantuml\n@startuml\nA -> B : ping\n@enduml\n```\n\n"
+    "```dot\ngraph { a -- b }\n```\n"
+)
+
+
+def _pairs(*sources):
+    return [(source, source.parent / (source.stem + '.mmd.md')) for source in sources]
+
+
+# ===========================================================================
+# Tests : écriture du manifeste
+# ===========================================================================
+
+class TestManifest:
+    """Tests pour les manifestes écrits par convert_file / convert_batch."""
+
+    def test_convert_file_records_entry(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        assert convert_file(source, manifest=True)
+
+        manifest = load_manifest(tmp_path)
+        assert manifest['converter_version'] == CONVERTER_VERSION
+        entry = manifest['files']['doc.mmd.md']
+        assert entry['source'] == 'doc.md'
+        assert len(entry['blocks']) == 2
+
+    def test_stream_and_memory_record_same_blocks(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        convert_file(source, manifest=True)
+        expected = load_manifest(tmp_path)['files']['doc.mmd.md']
+        (tmp_path / MANIFEST_NAME).unlink()
+        convert_file(source, stream=True, manifest=True)
+        assert load_manifest(tmp_path)['files']['doc.mmd.md'] == expected
+
+    def test_batch_writes_one_manifest_per_directory(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.md").write_text(DOCUMENT, encoding='utf-8')
+        (tmp_path / "sub" / "b.md").write_text("# Sans diagramme\n", encoding='utf-8')
+        convert_batch([tmp_path], jobs=2, manifest=True)
+        assert set(load_manifest(tmp_path)['files']) == {'a.mmd.md'}
+        assert load_manifest(tmp_path / "sub")['files']['b.mmd.md']['blocks'] == []
+
+    def test_no_manifest_by_default(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        convert_file(source)
+        assert not (tmp_path / MANIFEST_NAME).exists()
+
+
+# ===========================================================================
+# Tests : vérification de fraîcheur
+# ===========================================================================
+
+class TestCheckOutputs:
+    """Tests pour check_outputs (aucune conversion)."""
+
+    def _converted(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        convert_file(source, manifest=True)
+        return source
+
+    def test_up_to_date(self, tmp_path):
+        source = self._converted(tmp_path)
+        assert check_outputs(_pairs(source), CONVERTER_VERSION) == []
+
+    def test_source_text_changed(self, tmp_path):
+        source = self._converted(tmp_path)
+        source.write_text(DOCUMENT + "\nParagraphe ajouté.\n", encoding='utf-8')
+        [(_, _, reason)] = check_outputs(_pairs(source), CONVERTER_VERSION)
+        assert 'texte modifié' in reason
+
+    def test_source_block_changed(self, tmp_path):
+        source = self._converted(tmp_path)
+        source.write_text(DOCUMENT.replace('ping', 'pong'), encoding='utf-8')
+        [(_, _, reason)] = check_outputs(_pairs(source), CONVERTER_VERSION)
+        assert '1 bloc(s)' in reason
+
+    def test_output_edited_or_missing(self, tmp_path):
+        source = self._converted(tmp_path)
+        output = tmp_path / "doc.mmd.md"
+        output.write_text("retouché\n", encoding='utf-8')
+        assert 'à la main' in check_outputs(_pairs(source), CONVERTER_VERSION)[0][2]
+        output.unlink()
+        assert check_outputs(_pairs(source), CONVERTER_VERSION)[0][2] == 'sortie absente'
+
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_source_saved_during_conversion_is_stale(self, tmp_path, monkeypatch, stream):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        convert_block = core.convert_block
+
+        def save_then_convert(*args, **kwargs):
+            # Enregistrement de l'éditeur pendant la conversion (mode watch)
+            source.write_text(DOCUMENT.replace('ping', 'pong'), encoding='utf-8')
+            return convert_block(*args, **kwargs)
+
+        monkeypatch.setattr(core, 'convert_block', save_then_convert)
+        assert convert_file(source, stream=stream, manifest=True)
+        assert 'ping' in (tmp_path / "doc.mmd.md").read_text(encoding='utf-8')
+        [(_, _, reason)] = check_outputs(_pairs(source), CONVERTER_VERSION)
+        assert '1 bloc(s)' in reason
+
+    def test_converter_version_changed(self, tmp_path):
+        source = self._converted(tmp_path)
+        [(_, _, reason)] = check_outputs(_pairs(source), CONVERTER_VERSION + '-next')
+        assert 'convertisseur' in reason
+
+    def test_cli_check(self, tmp_path, capsys, run_md2mmd):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+
+        assert run_md2mmd(tmp_path, '--check') == 1
+        assert '[PÉRIMÉ]' in capsys.readouterr().out
+
+        assert run_md2mmd(tmp_path) == 0
+        assert json.loads((tmp_path / MANIFEST_NAME).read_text(encoding='utf-8'))['files']
+
+        assert run_md2mmd(tmp_path, '--check') == 0
+        assert '[OK] 1 sortie(s) à jour' in capsys.readouterr().out
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/metrics.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+from src.app.conversion.commands.md2mmd import convert_batch, convert_file, diagram_subtype
+from src.app.conversion.metrics import METRICS_SCHEMA, Metrics
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+DOCUMENT = (
+    "# Titre\n\n"
+    "```plantuml\n@startuml\nA -> B : ping\n@enduml\n```\n\n"
+    "```python\nprint(1)\n```\n\n"
+    "```dot\ngraph { a -- b }\n```\n"
+)
+
+
+# ===========================================================================
+# Tests : collecteur Metrics
+# ===========================================================================
+
+class TestMetrics:
+    """Tests pour la collecte des mesures par étape et par bloc."""
+
+    def test_stage_durations_accumulate(self):
+        metrics = Metrics()
+        file_metrics = metrics.begin_file('a.md')
+        with file_metrics.stage('convert'):
+            pass
+        first = metrics.files[0]['stages']['convert']
+        with file_metrics.stage('convert'):
+            pass
+        assert metrics.files[0]['stages']['convert'] >= first
+
+    def test_to_dict_totals(self):
+        metrics = Metrics()
+        file_metrics = metrics.begin_file('a.md')
+        file_metrics.block('dot', 'digraph', 0, 10, 20, file_metrics.block_started(), False, False)
+        file_metrics.finish(True, 100, 120)
+        metrics.add_record({'path': 'b.md', 'ok': False, 'bytes_in': 5, 'bytes_out': 0,
+                            'stages': {'read': 0.5}, 'blocks': []})
+        document = metrics.to_dict('4')
+        assert document['schema'] == METRICS_SCHEMA
+        assert document['converter_version'] == '4'
+        assert document['totals'] == {'files': 2, 'failed': 1, 'blocks': 1, 'bytes_in': 105, 'bytes_out': 120}
+        assert document['stages']['read'] == 0.5
+        assert 'memory' not in document
+        json.dumps(document)
+
+    def test_diagram_subtype(self):
+        assert diagram_subtype('plantuml', '@startuml\n[*] --> S1\n@enduml') == 'state'
+        assert diagram_subtype('dot', 'strict graph { a -- b }') == 'graph'
+        assert diagram_subtype('graphviz', 'digraph { a -> b }') == 'digraph'
+        assert diagram_subtype('dot', '// réseau\ngraph G { a -- b }') == 'graph'
+        assert diagram_subtype('dot', '/* graph */ digraph { a -> b }') == 'digraph'
+
+
+# ===========================================================================
+# Tests : intégration à md2mmd
+# ===========================================================================
+
+class TestConvertMetrics:
+    """Tests pour les mesures produites par convert_file / convert_batch."""
+
+    def test_convert_file_records_stages_and_blocks(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        metrics = Metrics()
+        assert convert_file(source, metrics=metrics)
+
+        record = metrics.files[0]
+        assert record['ok']
+        assert record['bytes_in'] == source.stat().st_size
+        assert record['bytes_out'] == (tmp_path / "doc.mmd.md").stat().st_size
+        assert set(record['stages']) == {'read', 'extract', 'convert', 'assemble', 'write'}
+        assert [(b['type'], b['subtype']) for b in record['blocks']] == [('plantuml', 'sequence'), ('dot', 'graph')]
+        assert record['blocks'][0]['start'] == DOCUMENT.index('```plantuml')
+        assert all(b['bytes_in'] > 0 and b['bytes_out'] > 0 for b in record['blocks'])
+
+    def test_stream_mode_matches_offsets(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        metrics = Metrics()
+        assert convert_file(source, stream=True, metrics=metrics)
+
+        record = metrics.files[0]
+        assert set(record['stages']) == {'stream'}
+        assert [b['start'] for b in record['blocks']] == [DOCUMENT.index('```plantuml'), DOCUMENT.index('```dot')]
+
+    def test_failed_file_is_recorded(self, tmp_path):
+        metrics = Metrics()
+        assert not convert_file(tmp_path / "absent.md", metrics=metrics)
+        assert metrics.to_dict()['totals']['failed'] == 1
+
+    def test_batch_collects_worker_records(self, tmp_path):
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text(DOCUMENT, encoding='utf-8')
+        metrics = Metrics()
+        report = convert_batch([tmp_path], jobs=2, metrics=metrics)
+        assert 'metrics' not in report
+        document = metrics.to_dict()
+        assert document['totals']['files'] == 3
+        assert document['totals']['blocks'] == 6
+
+    def test_cli_json_on_stdout(self, tmp_path, capsys, run_md2mmd):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        assert run_md2mmd(source, '--metrics', 'json') == 0
+
+        captured = capsys.readouterr()
+        document = json.loads(captured.out)
+        assert document['totals']['blocks'] == 2
+        assert '[OK]' in captured.err
+
+    def test_cli_metrics_file(self, tmp_path, run_md2mmd):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        target = tmp_path / "metrics.json"
+        assert run_md2mmd(source, '--metrics-file', target) == 0
+        assert json.loads(target.read_text(encoding='utf-8'))['totals']['files'] == 1
+
+
+# ===========================================================================
+# Tests : profil mémoire (--mem-profile)
+# ===========================================================================
+
+class TestMemoryProfile:
+    """Tests pour les pics de mémoire par fichier, par convertisseur et les sites d'allocation."""
+
+    def test_close_stops_tracing(self):
+        metrics = Metrics(memory=True)
+        assert tracemalloc.is_tracing()
+        metrics.close()
+        assert not tracemalloc.is_tracing()
+
+    def test_convert_file_records_peaks(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        metrics = Metrics(memory=True)
+        try:
+            assert convert_file(source, metrics=metrics)
+            document = metrics.to_dict()
+        finally:
+            metrics.close()
+
+        record = document['files'][0]
+        assert record['peak_bytes'] > 0
+        assert all(block['peak_bytes'] > 0 for block in record['blocks'])
+        memory = document['memory']
+        assert memory['peak_bytes'] == record['peak_bytes']
+        assert set(memory['converters']) == {'sequence', 'graph'}
+        assert memory['top_allocations']['path'] == str(source)
+        assert memory['top_allocations']['sites']
+        json.dumps(document)
+
+    def test_identical_blocks_have_comparable_peaks(self, tmp_path):
+        # Interpréteur neuf : les modules de conversion n'y sont pas encore importés
+        source = tmp_path / "doc.md"
+        source.write_text("```dot\ndigraph G { a -> b; b -> c }\n```\n\n" * 2, encoding='utf-8')
+        code = (
+            "import json, sys\n"
+            "from app.conversion.core import convert_path, silent\n"
+            "from app.conversion.metrics import Metrics\n"
+            "metrics = Metrics(memory=True)\n"
+            "convert_path(sys.argv[1], echo=silent, metrics=metrics)\n"
+            "print(json.dumps([b['peak_bytes'] for b in metrics.to_dict()['files'][0]['blocks']]))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code, str(source)], capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=str(SRC)), check=True)
+        first, second = json.loads(result.stdout)
+        assert first < second * 2
+
+    def test_batch_keeps_heaviest_file_sites(self, tmp_path):
+        (tmp_path / "small.md").write_text(DOCUMENT, encoding='utf-8')
+        (tmp_path / "big.md").write_text(DOCUMENT * 50, encoding='utf-8')
+        metrics = Metrics(memory=True)
+        try:
+            convert_batch([tmp_path], jobs=2, metrics=metrics)
+            document = metrics.to_dict()
+        finally:
+            metrics.close()
+
+        assert all('top_allocations' not in record for record in document['files'])
+        assert document['memory']['top_allocations']['path'] == str(tmp_path / "big.md")
+
+    def test_cli_prints_report(self, tmp_path, capsys, run_md2mmd):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        assert run_md2mmd(source, '--mem-profile') == 0
+
+        out = capsys.readouterr().out
+        assert 'Pic par fichier' in out
+        assert 'sequence' in out
+        assert not tracemalloc.is_tracing()
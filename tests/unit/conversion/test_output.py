@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/output.py
+"""
+
+import os
+
+import pytest
+
+from src.app.conversion.core import convert_batch, convert_path
+from src.app.conversion.output import AtomicOutput, copy_if_changed, write_bytes_if_changed, write_text_if_changed
+
+DOCUMENT = "# Titre\n\n```dot\ndigraph { a -> b }\n```\n"
+
+
+def _age(path, seconds=100):
+    """Recule la date de modification pour détecter toute réécriture."""
+    stamp = os.stat(path).st_mtime_ns - seconds * 10**9
+    os.utime(path, ns=(stamp, stamp))
+    return stamp
+
+
+def _leftovers(directory):
+    return [p.name for p in directory.iterdir() if p.name.endswith('.tmp')]
+
+
+# ===========================================================================
+# Tests : écriture atomique
+# ===========================================================================
+
+class TestWriteTextIfChanged:
+    """Tests pour write_text_if_changed."""
+
+    def test_unchanged_file_not_rewritten(self, tmp_path):
+        target = tmp_path / "out.md"
+        assert write_text_if_changed(target, "contenu\n")
+        stamp = _age(target)
+        assert not write_text_if_changed(target, "contenu\n")
+        assert os.stat(target).st_mtime_ns == stamp
+
+    def test_bytes_variant(self, tmp_path):
+        target = tmp_path / "out.md"
+        assert write_bytes_if_changed(target, b"contenu\r\n")
+        assert not write_bytes_if_changed(target, b"contenu\r\n")
+        assert target.read_bytes() == b"contenu\r\n"
+
+    def test_changed_file_replaced_keeping_mode(self, tmp_path):
+        target = tmp_path / "out.md"
+        target.write_text("ancien\n", encoding='utf-8')
+        os.chmod(target, 0o640)
+        assert write_text_if_changed(target, "nouveau\n")
+        assert target.read_text(encoding='utf-8') == "nouveau\n"
+        assert os.stat(target).st_mode & 0o777 == 0o640
+        assert _leftovers(tmp_path) == []
+
+
+class TestAtomicOutput:
+    """Tests pour AtomicOutput (écriture au fil de l'eau)."""
+
+    def test_identical_stream_keeps_file(self, tmp_path):
+        target = tmp_path / "out.md"
+        target.write_text("ligne\n", encoding='utf-8')
+        stamp = _age(target)
+        output = AtomicOutput(target)
+        with output as f:
+            f.write("ligne\n")
+        assert not output.changed
+        assert os.stat(target).st_mtime_ns == stamp
+        assert _leftovers(tmp_path) == []
+
+    def test_exception_leaves_previous_version(self, tmp_path):
+        target = tmp_path / "out.md"
+        target.write_text("ancien\n", encoding='utf-8')
+        with pytest.raises(RuntimeError):
+            with AtomicOutput(target) as f:
+                f.write("partiel")
+                raise RuntimeError("interruption")
+        assert target.read_text(encoding='utf-8') == "ancien\n"
+        assert _leftovers(tmp_path) == []
+
+
+# ===========================================================================
+# Tests : copie, lien physique, reflink
+# ===========================================================================
+
+class TestCopyIfChanged:
+    """Tests pour copy_if_changed."""
+
+    def test_hardlink(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text("# Texte\n", encoding='utf-8')
+        target = tmp_path / "doc.mmd.md"
+        assert copy_if_changed(source, target, 'hardlink')
+        assert os.path.samefile(source, target)
+        assert not copy_if_changed(source, target, 'hardlink')
+
+    def test_reflink_falls_back_to_copy(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text("# Texte\n", encoding='utf-8')
+        target = tmp_path / "doc.mmd.md"
+        target.write_text("périmé\n", encoding='utf-8')
+        assert copy_if_changed(source, target, 'reflink')
+        assert target.read_bytes() == source.read_bytes()
+        assert _leftovers(tmp_path) == []
+
+    def test_identical_copy_not_rewritten(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text("# Texte\n", encoding='utf-8')
+        target = tmp_path / "doc.mmd.md"
+        target.write_bytes(source.read_bytes())
+        stamp = _age(target)
+        assert not copy_if_changed(source, target)
+        assert os.stat(target).st_mtime_ns == stamp
+
+    def test_unknown_link_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            copy_if_changed(tmp_path / "a.md", tmp_path / "b.md", 'symlink')
+
+
+# ===========================================================================
+# Tests : intégration à md2mmd
+# ===========================================================================
+
+class TestConvertOutputs:
+    """Sorties non réécrites quand la conversion redonne le même résultat."""
+
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_second_conversion_leaves_output(self, tmp_path, stream):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        first = convert_path(source, echo=lambda *_: None, stream=stream)
+        assert first['ok'] and not first['unchanged']
+        stamp = _age(tmp_path / "doc.mmd.md")
+
+        second = convert_path(source, echo=lambda *_: None, stream=stream)
+        assert second['ok'] and second['unchanged']
+        assert os.stat(tmp_path / "doc.mmd.md").st_mtime_ns == stamp
+
+    def test_batch_counts_unchanged_and_links(self, tmp_path):
+        (tmp_path / "a.md").write_text(DOCUMENT, encoding='utf-8')
+        (tmp_path / "b.md").write_text("# Sans diagramme\n", encoding='utf-8')
+        convert_batch([tmp_path], jobs=1, link='hardlink')
+        assert os.path.samefile(tmp_path / "b.md", tmp_path / "b.mmd.md")
+        report = convert_batch([tmp_path], jobs=1, link='hardlink')
+        assert report['unchanged'] == 2
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/revision.py (dépôts git temporaires)
+"""
+
+import shutil
+import tarfile
+
+import pytest
+
+from src.app.conversion.git import GitError
+from src.app.conversion.commands.md2mmd import output_name
+from src.app.conversion.revision import convert_revision
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git absent")
+
+DOCUMENT = "```dot\ndigraph { a -> b }\n```\n"
+
+
+@pytest.fixture
+def repo(make_repo, git):
+    repo = make_repo({
+        "docs/archi.md": DOCUMENT,
+        "docs/notes.md": "# Notes\n",
+        "docs/old.mmd.md": "sortie\n",
+        "README.md": DOCUMENT,
+    }, message='v1')
+    git(repo, 'tag', 'v1')
+    # Arbre de travail différent de la révision convertie
+    (repo / "docs" / "archi.md").write_text("# Réécrit\n", encoding='utf-8')
+    return repo
+
+
+# ===========================================================================
+# Tests : convert_revision
+# ===========================================================================
+
+class TestConvertRevision:
+    """Tests pour la conversion d'une révision sans extraction."""
+
+    def test_output_name(self):
+        assert output_name("docs/archi.md") == "docs/archi.mmd.md"
+        assert output_name("README.md") == "README.mmd.md"
+
+    def test_directory_output(self, repo, tmp_path, expected_output):
+        out = tmp_path / "out"
+        report = convert_revision('v1', out, cwd=repo, echo=lambda *a: None)
+        assert report['files'] == 3 and report['converted'] == 2 and report['skipped'] == 1
+        assert sorted(str(p.relative_to(out)) for p in out.rglob('*') if p.is_file()) == \
+            ["README.mmd.md", "docs/archi.mmd.md", "docs/notes.mmd.md"]
+        assert (out / "docs" / "archi.mmd.md").read_bytes() == expected_output(DOCUMENT)
+        # Ni extraction ni modification de l'arbre de travail
+        assert (repo / "docs" / "archi.md").read_text(encoding='utf-8') == "# Réécrit\n"
+        assert not (repo / "docs" / "archi.mmd.md").exists()
+
+    def test_second_run_unchanged(self, repo, tmp_path):
+        out = tmp_path / "out"
+        convert_revision('v1', out, cwd=repo, echo=lambda *a: None)
+        report = convert_revision('v1', out, cwd=repo, echo=lambda *a: None)
+        assert report['unchanged'] == 3
+
+    def test_tar_output_with_pathspec(self, repo, tmp_path, expected_output):
+        target = tmp_path / "v1.tar.gz"
+        report = convert_revision('v1', target, pathspecs=['docs'], cwd=repo, echo=lambda *a: None)
+        with tarfile.open(target) as tar:
+            assert tar.getnames() == ["docs/archi.mmd.md", "docs/notes.mmd.md"]
+            member = tar.getmember("docs/archi.mmd.md")
+            assert tar.extractfile(member).read() == expected_output(DOCUMENT)
+        assert report['files'] == 2
+
+    def test_zip_output(self, repo, tmp_path):
+        import zipfile
+
+        target = tmp_path / "v1.zip"
+        convert_revision('v1', target, cwd=repo, echo=lambda *a: None)
+        with zipfile.ZipFile(target) as archive:
+            assert archive.namelist() == ["README.mmd.md", "docs/archi.mmd.md", "docs/notes.mmd.md"]
+
+    def test_invalid_utf8_reported(self, repo, tmp_path, git):
+        (repo / "bad.md").write_bytes(b"```dot\n\xc0\n```\n")
+        git(repo, 'add', 'bad.md')
+        git(repo, 'commit', '-q', '-m', 'bad')
+        report = convert_revision('HEAD', tmp_path / "out", cwd=repo, echo=lambda *a: None)
+        assert [failure['path'] for failure in report['failed']] == ['HEAD:bad.md']
+        assert (tmp_path / "out" / "README.mmd.md").exists()
+
+    def test_unknown_revision(self, repo, tmp_path):
+        with pytest.raises(GitError):
+            convert_revision('absente', tmp_path / "out", cwd=repo)
+
+
+# ===========================================================================
+# Tests : md2mmd --rev
+# ===========================================================================
+
+class TestCliRevision:
+    """Tests de la ligne de commande md2mmd --rev."""
+
+    @pytest.fixture(autouse=True)
+    def _in_repo(self, monkeypatch, repo):
+        monkeypatch.chdir(repo)
+
+    def test_rev_to_archive(self, tmp_path, capsys, run_md2mmd):
+        target = tmp_path / "v1.tar"
+        assert run_md2mmd('--rev', 'v1', '-o', str(target)) == 0
+        assert '3 fichier(s) analysé(s)' in capsys.readouterr().out
+        with tarfile.open(target) as tar:
+            assert len(tar.getnames()) == 3
+
+    def test_rev_requires_output(self, run_md2mmd):
+        with pytest.raises(SystemExit):
+            run_md2mmd('--rev', 'v1')
+
+    def test_git_error(self, tmp_path, capsys, run_md2mmd):
+        assert run_md2mmd('--rev', 'absente', '-o', str(tmp_path / "out")) == 1
+        assert '[ERREUR] git' in capsys.readouterr().out
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/server.py
+"""
+
+import io
+import json
+
+from src.app.conversion.commands.md2mmd import convert_text
+from src.app.conversion.server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    JsonRpcServer,
+    read_message,
+    write_message,
+)
+
+DOCUMENT = "# Titre\n\n```dot\ndigraph { a -> b }\n```\n\n```plantuml\n@startuml\n[*] --> A\n@enduml\n```\n"
+
+
+def frame(payload):
+    body = json.dumps(payload).encode('utf-8')
+    return b'Content-Length: %d\r\n\r\n' % len(body) + body
+
+
+def request(request_id, method, params=None):
+    message = {'jsonrpc': '2.0', 'id': request_id, 'method': method}
+    if params is not None:
+        message['params'] = params
+    return message
+
+
+def run_session(messages, server=None):
+    """Envoie des messages au serveur ; retourne (code de sortie, réponses)."""
+    server = server or JsonRpcServer()
+    reader = io.BytesIO(b''.join(frame(m) for m in messages))
+    writer = io.BytesIO()
+    status = server.serve(reader, writer)
+    writer.seek(0)
+    responses = []
+    while True:
+        body = read_message(writer)
+        if body is None:
+            break
+        responses.append(json.loads(body))
+    return status, responses
+
+
+# ===========================================================================
+# Tests : encadrement Content-Length
+# ===========================================================================
+
+class TestFraming:
+    """Tests pour la lecture et l'écriture des messages encadrés."""
+
+    def test_roundtrip_utf8(self):
+        stream = io.BytesIO()
+        write_message(stream, {'texte': 'Nœud é'})
+        stream.seek(0)
+        assert json.loads(read_message(stream)) == {'texte': 'Nœud é'}
+        assert read_message(stream) is None
+
+    def test_extra_headers_ignored(self):
+        body = b'{"a":1}'
+        stream = io.BytesIO(b'Content-Type: application/vscode-jsonrpc\r\nContent-Length: 7\r\n\r\n' + body)
+        assert read_message(stream) == body
+
+    def test_truncated_body(self):
+        assert read_message(io.BytesIO(b'Content-Length: 10\r\n\r\n{}')) is None
+
+
+# ===========================================================================
+# Tests : méthodes JSON-RPC
+# ===========================================================================
+
+class TestJsonRpcServer:
+    """Tests pour la répartition des requêtes du serveur résident."""
+
+    def test_initialize_lists_methods(self):
+        _, responses = run_session([request(1, 'initialize', {})])
+        methods = responses[0]['result']['capabilities']['methods']
+        assert {'md2mmd/convertText', 'md2mmd/convertFile', 'md2mmd/listBlocks'} <= set(methods)
+
+    def test_convert_text_matches_library(self):
+        _, responses = run_session([request(1, 'md2mmd/convertText', {'text': DOCUMENT})])
+        result = responses[0]['result']
+        assert result['text'] == convert_text(DOCUMENT).text
+        assert [b['subtype'] for b in result['blocks']] == ['digraph', 'state']
+        assert result['converted'] == 2
+
+    def test_cache_stays_warm_between_requests(self):
+        _, responses = run_session([
+            request(1, 'md2mmd/convertText', {'text': DOCUMENT}),
+            request(2, 'md2mmd/convertText', {'text': DOCUMENT + "\nModifié\n"}),
+        ])
+        assert responses[0]['result']['cached'] == 0
+        assert responses[1]['result']['cached'] == 2
+
+    def test_convert_file(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        _, responses = run_session([request(1, 'md2mmd/convertFile', {'path': str(source)})])
+        assert responses[0]['result']['ok']
+        assert (tmp_path / "doc.mmd.md").read_text(encoding='utf-8') == convert_text(DOCUMENT).text
+
+    def test_list_blocks_with_lines(self, tmp_path):
+        source = tmp_path / "doc.md"
+        source.write_text(DOCUMENT, encoding='utf-8')
+        _, responses = run_session([request(1, 'md2mmd/listBlocks', {'path': str(source)})])
+        blocks = responses[0]['result']
+        assert [(b['type'], b['line']) for b in blocks] == [('dot', 2), ('plantuml', 6)]
+
+    def test_errors(self):
+        _, responses = run_session([
+            request(1, 'inconnue'),
+            request(2, 'md2mmd/convertText', {}),
+            request(3, 'md2mmd/listBlocks', {'path': '/inexistant.md'}),
+        ])
+        assert [r['error']['code'] for r in responses] == [METHOD_NOT_FOUND, INVALID_PARAMS, INVALID_PARAMS]
+
+    def test_parse_error(self):
+        server = JsonRpcServer()
+        assert server.handle(b'{pas du json')['error']['code'] == PARSE_ERROR
+
+    def test_notifications_get_no_response(self):
+        _, responses = run_session([{'jsonrpc': '2.0', 'method': 'md2mmd/convertText', 'params': {'text': 'x'}}])
+        assert responses == []
+
+    def test_shutdown_then_exit(self):
+        status, responses = run_session([
+            request(1, 'shutdown'),
+            {'jsonrpc': '2.0', 'method': 'exit'},
+            request(2, 'initialize'),
+        ])
+        assert status == 0
+        assert len(responses) == 1
+
+    def test_exit_without_shutdown(self):
+        status, _ = run_session([{'jsonrpc': '2.0', 'method': 'exit'}])
+        assert status == 1
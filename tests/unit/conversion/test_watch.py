@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/conversion/watch.py
+"""
+
+import sys
+import time
+import threading
+import pytest
+
+from src.app.conversion.cache import MemoryBlockCache
+from src.app.conversion.watch import PollingWatcher, WatchTargets, make_watcher, watch
+
+STATE_DOC = "```plantuml\n@startuml\n[*] --> {state}\n@enduml\n```\n"
+
+
+def wait_for(predicate, timeout=5.0):
+    """Attend qu'une condition devienne vraie (ou échoue après timeout)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def running_watch(tmp_path):
+    """Lance watch() dans un thread et l'arrête en fin de test."""
+    threads = []
+
+    def start(inputs, poll):
+        stop = threading.Event()
+        messages = []
+        cache = MemoryBlockCache()
+        thread = threading.Thread(
+            target=watch, args=(inputs,),
+            kwargs={'cache': cache, 'poll': poll, 'stop': stop, 'debounce': 0.02, 'echo': messages.append},
+            daemon=True,
+        )
+        thread.start()
+        threads.append((thread, stop))
+        return messages, cache
+
+    yield start
+    for thread, stop in threads:
+        stop.set()
+        thread.join(timeout=5)
+
+
+# ===========================================================================
+# Tests : WatchTargets
+# ===========================================================================
+
+class TestWatchTargets:
+    """Tests pour le filtrage des chemins observés."""
+
+    def test_directory_accepts_nested_markdown(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        targets = WatchTargets([tmp_path])
+        assert targets.accepts(tmp_path / "sub" / "doc.md")
+        assert tmp_path / "sub" in targets.directories()
+
+    def test_outputs_are_ignored(self, tmp_path):
+        targets = WatchTargets([tmp_path])
+        assert not targets.accepts(tmp_path / "doc.mmd.md")
+        assert not targets.accepts(tmp_path / "notes.txt")
+
+    def test_single_file_only(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("", encoding='utf-8')
+        targets = WatchTargets([doc])
+        assert targets.accepts(doc)
+        assert not targets.accepts(tmp_path / "autre.md")
+        assert targets.directories() == {tmp_path.resolve()}
+
+    def test_glob_pattern(self, tmp_path):
+        targets = WatchTargets([str(tmp_path / "*.md")])
+        assert targets.accepts(tmp_path / "doc.md")
+        assert tmp_path.resolve() in targets.directories()
+
+
+# ===========================================================================
+# Tests : observateurs
+# ===========================================================================
+
+class TestWatchers:
+    """Tests pour la détection des modifications."""
+
+    def test_polling_detects_modification(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("v1", encoding='utf-8')
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+        assert watcher.wait(0) == set()
+        doc.write_text("version 2", encoding='utf-8')
+        assert watcher.wait(1) == {doc.resolve()}
+
+    def test_polling_detects_new_file(self, tmp_path):
+        watcher = PollingWatcher([tmp_path], interval=0.01)
+        (tmp_path / "nouveau.md").write_text("x", encoding='utf-8')
+        assert watcher.wait(1) == {(tmp_path / "nouveau.md").resolve()}
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason='inotify : Linux uniquement')
+    def test_inotify_detects_modification(self, tmp_path):
+        doc = tmp_path / "doc.md"
+        doc.write_text("v1", encoding='utf-8')
+        watcher = make_watcher([tmp_path])
+        try:
+            assert type(watcher).__name__ == 'InotifyWatcher'
+            doc.write_text("v2", encoding='utf-8')
+            (tmp_path / "doc.mmd.md").write_text("sortie", encoding='utf-8')
+            assert watcher.wait(1) == {doc.resolve()}
+        finally:
+            watcher.close()
+
+    def test_poll_flag_forces_polling(self, tmp_path):
+        assert isinstance(make_watcher([tmp_path], poll=True), PollingWatcher)
+
+
+# ===========================================================================
+# Tests : boucle watch()
+# ===========================================================================
+
+class TestWatchLoop:
+    """Tests de bout en bout : enregistrement → .mmd.md à jour."""
+
+    @pytest.mark.parametrize('poll', [True, False])
+    def test_reconverts_on_save(self, tmp_path, running_watch, poll):
+        doc = tmp_path / "doc.md"
+        output = tmp_path / "doc.mmd.md"
+        doc.write_text(STATE_DOC.format(state='Initial'), encoding='utf-8')
+        messages, _cache = running_watch([tmp_path], poll)
+
+        assert wait_for(lambda: output.exists() and 'Initial' in output.read_text(encoding='utf-8'))
+        doc.write_text(STATE_DOC.format(state='Modifie'), encoding='utf-8')
+        assert wait_for(lambda: 'Modifie' in output.read_text(encoding='utf-8'))
+
+    def test_unchanged_blocks_come_from_cache(self, tmp_path, running_watch):
+        doc = tmp_path / "doc.md"
+        output = tmp_path / "doc.mmd.md"
+        doc.write_text(STATE_DOC.format(state='A') + STATE_DOC.format(state='B'), encoding='utf-8')
+        messages, cache = running_watch([doc], True)
+
+        assert wait_for(output.exists)
+        doc.write_text(STATE_DOC.format(state='A') + STATE_DOC.format(state='C'), encoding='utf-8')
+        assert wait_for(lambda: '--> C' in output.read_text(encoding='utf-8'))
+        # La sortie est écrite avant que le message ne soit émis
+        assert wait_for(lambda: any('1 inchangé(s)' in m for m in messages))
+        assert cache.hits == 1
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests unitaires pour src/app/cli.py (répartition des commandes, démarrage à froid)
+"""
+
+import os
+import sys
+import importlib
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.app import cli
+
+SRC = Path(__file__).resolve().parents[2] / 'src'
+
+# Modules que le démarrage de la ligne de commande ne doit pas charger
+LAZY_MODULES = [
+    'argparse', 'json', 'hashlib', 'tempfile', 'dataclasses', 'tracemalloc', 'unicodedata',
+    'app.conversion.cache', 'app.conversion.dot', 'app.conversion.results',
+]
+
+
+class TestCli:
+    """Tests pour le point d'entrée vscodiumbench."""
+
+    def test_dispatch_runs_command(self, monkeypatch, capsys):
+        monkeypatch.syspath_prepend(str(SRC))
+        md2mmd = importlib.import_module(cli.COMMANDS['md2mmd'])
+        monkeypatch.setattr(md2mmd, '_fix_stdout_encoding', lambda: None)
+        monkeypatch.setattr(sys, 'argv', ['vscodiumbench', 'md2mmd', '--help'])
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main()
+        assert excinfo.value.code == 0
+        assert 'md2mmd' in capsys.readouterr().out
+
+    def test_unknown_command_rejected(self, monkeypatch):
+        monkeypatch.setattr(sys, 'argv', ['vscodiumbench', 'inconnue'])
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main()
+        assert excinfo.value.code == 2
+
+    def test_startup_imports_stay_lazy(self):
+        code = (
+            'import sys; import app.cli; import app.conversion.commands.md2mmd; '
+            f'print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=str(SRC)),
+            capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == ''